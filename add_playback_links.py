@@ -8,10 +8,11 @@ Adds various watch/playback links based on available metadata:
 - OTTPlay aggregator links
 """
 
-import json
 import urllib.parse
 from datetime import datetime
 
+from json_io import load_json, save_json
+
 
 def normalize_platform_name(platform):
     """Normalize platform names for link construction"""
@@ -77,8 +78,7 @@ def add_playback_links(input_file='ottplay_complete_enriched.json', output_file=
     print("="*70 + "\n")
 
     # Load data
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(input_file)
 
     content = data.get('content', [])
     print(f"✓ Loaded {len(content)} items from {input_file}\n")
@@ -144,8 +144,7 @@ def add_playback_links(input_file='ottplay_complete_enriched.json', output_file=
 
     # Save enriched data
     print(f"💾 Saving enriched data to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    save_json(data, output_file)
 
     print("\n" + "="*70)
     print("✅ PLAYBACK LINKS ADDED!")
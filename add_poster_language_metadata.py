@@ -3,11 +3,12 @@
 Add poster language metadata to all movies by checking TMDB
 """
 
-import json
 import os
 import requests
 import time
 
+from json_io import load_json, save_json
+
 TMDB_API_KEY = os.environ.get('TMDB_API_KEY', '452357e5da52e2ddde20c64414a40637')
 
 def get_poster_language(tmdb_id, media_type, current_poster_path):
@@ -35,8 +36,7 @@ def get_poster_language(tmdb_id, media_type, current_poster_path):
 def add_language_metadata(filename):
     """Add poster language metadata to all movies"""
 
-    with open(filename, 'r', encoding='utf-8') as f:
-        movies = json.load(f)
+    movies = load_json(filename)
 
     if not movies:
         return
@@ -81,8 +81,7 @@ def add_language_metadata(filename):
         time.sleep(0.3)
 
     # Save
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(movies, f, indent=2, ensure_ascii=False)
+    save_json(movies, filename)
 
     print(f"\n✅ Updated {updated} movies with language metadata")
     print(f"💾 Saved: {filename}\n")
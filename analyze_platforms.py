@@ -4,10 +4,11 @@ Comprehensive platform analysis for duplicates and inconsistencies
 across all data sources and configuration files
 """
 
-import json
 import re
 from collections import defaultdict
 
+from json_io import load_json
+
 def analyze_script_js():
     """Extract platform names from script.js platformLogos"""
     platforms = []
@@ -83,8 +84,7 @@ def analyze_json_data():
 
     for filename in json_files:
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            data = load_json(filename)
 
             platform_set = set()
             duplicates_in_items = []
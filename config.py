@@ -3,6 +3,9 @@ Configuration file for content scraping
 Supports multi-city configuration for BookMyShow scraping
 """
 
+import re
+from functools import lru_cache
+
 # BookMyShow Configuration
 BMS_CONFIG = {
     'default_city': 'bengaluru',
@@ -79,6 +82,38 @@ BINGED_CONFIG = {
     'detail_page_timeout': 20000,  # Timeout for detail pages
 }
 
+# Binged placeholder artwork that should never be used as a poster
+BAD_POSTER_RE = re.compile(r'\.svg$|Binged\.png', re.IGNORECASE)
+
+
+def usable_poster_url(url):
+    """Absolute poster URL from a Binged page, or None for placeholders (SVG logos, Binged.png)"""
+    if not url:
+        return None
+    if url.startswith('//'):
+        url = 'https:' + url
+    elif url.startswith('/'):
+        url = BINGED_CONFIG['base_url'] + url
+    if not url.startswith('http') or BAD_POSTER_RE.search(url):
+        return None
+    return url
+
+
+# Title clean-up regexes for search queries, compiled once
+PARENS_RE = re.compile(r'\([^)]*\)')
+SEASON_SUFFIX_RE = re.compile(r'\s+Season\s+\d+.*', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def clean_search_title(title, strip_season=True):
+    """Memoized title clean-up for search queries"""
+    cleaned = PARENS_RE.sub('', title)  # Remove content in parentheses
+    if strip_season:
+        cleaned = SEASON_SUFFIX_RE.sub('', cleaned)  # Remove season information
+    cleaned = ' '.join(cleaned.split())  # Remove extra whitespace
+    return cleaned.strip(' -:')  # Remove trailing punctuation
+
+
 # OTT Platform URLs for Binged scraping
 OTT_PLATFORM_FILTERS = [
     'ALT Balaji',
@@ -115,6 +150,23 @@ TMDB_CONFIG = {
     'max_retries': 3,
 }
 
+# Named sizes stored for every TMDB poster / backdrop
+POSTER_SIZES = (
+    ('thumbnail', 'w92'), ('small', 'w185'), ('medium', 'w342'),
+    ('large', 'w500'), ('xlarge', 'w780'), ('original', 'original')
+)
+BACKDROP_SIZES = (('small', 'w300'), ('medium', 'w780'), ('large', 'w1280'), ('original', 'original'))
+
+
+def tmdb_image_url(path, size):
+    """TMDB image URL for one file path at one size (e.g. 'w185')"""
+    return f"{TMDB_CONFIG['image_base_url']}/{size}{path}"
+
+
+def tmdb_image_urls(path, sizes):
+    """Sized TMDB image URLs for one file path"""
+    return {name: tmdb_image_url(path, size) for name, size in sizes}
+
 # YouTube Configuration
 YOUTUBE_CONFIG = {
     'search_delay': 1.0,  # Delay between searches
@@ -20,7 +20,7 @@ async def debug_html():
         await page.wait_for_timeout(3000)
 
         html = await page.content()
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
 
         # Find first movie item
         items = soup.find_all('div', class_='bng-movies-table-item')
@@ -7,22 +7,51 @@ Usage:
     python3 enrich_ott_releases.py
 """
 
-import json
+import asyncio
+import hashlib
 import os
-import re
 import sys
-import time
-import requests
 from typing import Dict, List, Optional
 from datetime import datetime
 
+try:
+    import aiohttp
+except ImportError:
+    print("❌ Missing required package: aiohttp")
+    print("\n💡 Install: pip3 install aiohttp")
+    sys.exit(1)
+
+from config import BACKDROP_SIZES, POSTER_SIZES, clean_search_title, tmdb_image_url, tmdb_image_urls
+from json_io import load_json, save_json
+from tmdb_cache import ResponseCache
+from tmdb_client import TMDBClient, is_rate_limited
+
 
 class OTTReleasesEnricher:
     """Enrich OTT releases with TMDB data"""
 
+    # Concurrent releases in flight during TMDB enrichment
+    TMDB_CONCURRENCY = 16
+
+    # TMDB search matches by normalized title + year, reused across runs until they expire
+    # (so a wrong match is looked up again instead of sticking forever)
+    SEARCH_CACHE_FILE = '.cache/tmdb_search_cache.json'
+    SEARCH_CACHE_TTL = 14 * 24 * 3600
+
+    # Per-title TMDB responses (details, images, credits, videos) by endpoint + ID; these change, so they expire
+    RESPONSE_CACHE_FILE = '.cache/ott_releases_tmdb_cache.json'
+    RESPONSE_CACHE_TTL = 14 * 24 * 3600
+
     def __init__(self):
         self.movies = []
 
+        # Search matches: persisted cache plus searches currently in flight
+        self.search_cache = ResponseCache(self.SEARCH_CACHE_FILE, self.SEARCH_CACHE_TTL)
+        self._pending_searches = {}
+
+        # Per-title responses, keyed by endpoint + ID
+        self.response_cache = ResponseCache(self.RESPONSE_CACHE_FILE, self.RESPONSE_CACHE_TTL)
+
         # TMDB API (required)
         self.tmdb_api_key = os.environ.get('TMDB_API_KEY')
         if not self.tmdb_api_key:
@@ -30,6 +59,9 @@ class OTTReleasesEnricher:
             print("💡 Set it with: export TMDB_API_KEY='your_key_here'")
             sys.exit(1)
 
+        # Rate-limited TMDB client (token bucket, Retry-After, AIMD in-flight cap) over one pooled session
+        self.tmdb = TMDBClient(self.tmdb_api_key, self.response_cache)
+
         # Platform mapping for normalization
         self.platform_map = {
             'Platform 2': 'Aha Video',
@@ -49,8 +81,7 @@ class OTTReleasesEnricher:
     def load_movies(self, filename='ott_releases.json'):
         """Load OTT releases from JSON file"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.movies = json.load(f)
+            self.movies = load_json(filename)
             print(f"✓ Loaded {len(self.movies)} OTT releases from {filename}\n")
         except FileNotFoundError:
             print(f"❌ File not found: {filename}")
@@ -72,31 +103,44 @@ class OTTReleasesEnricher:
         if not title:
             return title
 
-        cleaned = title
-        cleaned = re.sub(r'\([^)]*\)', '', cleaned)  # Remove parentheses
-        cleaned = ' '.join(cleaned.split())  # Remove extra whitespace
-        cleaned = cleaned.strip(' -:')  # Remove trailing punctuation
-
-        return cleaned
-
-    def _fetch_with_retry(self, url, params, max_retries=3):
-        """Fetch URL with retry logic"""
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, params=params, timeout=15)
-                response.raise_for_status()
-                return response.json()
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-                if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise
-            except Exception:
-                raise
-
-    def _search_tmdb(self, movie: Dict) -> Optional[Dict]:
+        return clean_search_title(title, strip_season=False)
+
+    def _load_caches(self):
+        """Load cached TMDB search matches and per-title responses"""
+        self.search_cache.load()
+        self.response_cache.load()
+        if self.search_cache or self.response_cache:
+            print(f"📦 Loaded {len(self.search_cache)} cached TMDB matches, "
+                  f"{len(self.response_cache)} cached responses")
+
+    def _save_caches(self):
+        """Persist both TMDB caches to disk"""
+        self.search_cache.save()
+        self.response_cache.save()
+
+    def _search_cache_key(self, movie: Dict) -> str:
+        """Cache key from the normalized title and release year"""
+        title = ' '.join(movie.get('title', '').lower().split())
+        release_date = movie.get('release_date') or ''
+        year = release_date[-4:] if release_date[-4:].isdigit() else ''
+        return hashlib.md5(f"{title}:{year}".encode()).hexdigest()
+
+    async def _search_tmdb_cached(self, movie: Dict) -> Optional[Dict]:
+        """Search TMDB once per distinct title/year, across duplicates and runs"""
+        key = self._search_cache_key(movie)
+        cached = self.search_cache.get(key)
+        if cached and self.search_cache.is_fresh(cached):
+            return cached['data']
+
+        if key not in self._pending_searches:
+            self._pending_searches[key] = asyncio.ensure_future(self._search_tmdb(movie))
+        result = await self._pending_searches[key]
+
+        if result:
+            self.search_cache.store(key, {'id': result['id'], 'media_type': result.get('media_type', 'movie')})
+        return result
+
+    async def _search_tmdb(self, movie: Dict) -> Optional[Dict]:
         """Search TMDB with multiple strategies"""
         title = movie.get('title', '')
         clean_title = self._clean_title_for_search(title)
@@ -117,79 +161,48 @@ class OTTReleasesEnricher:
                     'language': 'en-US'
                 }
 
-                data = self._fetch_with_retry(url, params)
+                data = await self.tmdb.fetch(url, params, use_cache=False)
 
                 if data.get('results') and len(data['results']) > 0:
                     return data['results'][0]
-            except:
+            except Exception as e:
+                if is_rate_limited(e):
+                    raise
                 continue
 
         return None
 
-    def _get_tmdb_details(self, tmdb_id: int, media_type: str) -> Optional[Dict]:
-        """Get full movie/show details from TMDB"""
+    async def _get_tmdb_details(self, tmdb_id: int, media_type: str, append: List[str] = ()) -> Optional[Dict]:
+        """Get full movie/show details from TMDB, with sub-resources appended to the same response"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}"
             params = {
                 'api_key': self.tmdb_api_key,
                 'language': 'en-US'
             }
-            return self._fetch_with_retry(url, params)
-        except:
-            return None
-
-    def _get_tmdb_external_ids(self, tmdb_id: int, media_type: str) -> Optional[Dict]:
-        """Get external IDs (IMDb, etc.) from TMDB"""
-        try:
-            url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/external_ids"
-            params = {'api_key': self.tmdb_api_key}
-            return self._fetch_with_retry(url, params)
-        except:
+            if append:
+                params['append_to_response'] = ','.join(append)
+            return await self.tmdb.fetch(url, params)
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
             return None
 
-    def _get_tmdb_images(self, tmdb_id: int, media_type: str, image_type: str) -> List[str]:
-        """Get all images (posters or backdrops) from TMDB"""
+    async def _get_tmdb_images(self, tmdb_id: int, media_type: str) -> Dict:
+        """Get all images (posters and backdrops, every language) from TMDB"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/images"
             params = {'api_key': self.tmdb_api_key}
+            return await self.tmdb.fetch(url, params) or {}
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
+            return {}
 
-            data = self._fetch_with_retry(url, params)
-
-            if image_type == 'posters':
-                images = data.get('posters', [])
-            else:
-                images = data.get('backdrops', [])
-
-            # Sort by vote average (quality)
-            images.sort(key=lambda x: x.get('vote_average', 0), reverse=True)
-
-            # Return file paths
-            return [img['file_path'] for img in images if img.get('file_path')]
-
-        except:
-            return []
-
-    def _get_tmdb_credits(self, tmdb_id: int, media_type: str) -> Optional[Dict]:
-        """Get cast and crew from TMDB"""
-        try:
-            url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/credits"
-            params = {'api_key': self.tmdb_api_key}
-            return self._fetch_with_retry(url, params)
-        except:
-            return None
-
-    def _get_tmdb_videos(self, tmdb_id: int, media_type: str) -> List[Dict]:
-        """Get videos (trailers) from TMDB"""
-        try:
-            url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/videos"
-            params = {
-                'api_key': self.tmdb_api_key,
-                'language': 'en-US'
-            }
-            data = self._fetch_with_retry(url, params)
-            return data.get('results', [])
-        except:
-            return []
+    def _sorted_image_paths(self, images: Dict, image_type: str) -> List[str]:
+        """File paths of posters or backdrops, best voted first"""
+        items = sorted(images.get(image_type, []), key=lambda x: x.get('vote_average', 0), reverse=True)
+        return [img['file_path'] for img in items if img.get('file_path')]
 
     def enrich(self):
         """Enrich OTT releases with TMDB data"""
@@ -197,152 +210,144 @@ class OTTReleasesEnricher:
         print("ENRICHING OTT RELEASES WITH TMDB DATA")
         print("="*60 + "\n")
 
-        enriched_count = 0
+        results = asyncio.run(self._enrich_all())
+        enriched_count = sum(results)
+
+        print(f"\n✅ Enriched {enriched_count}/{len(self.movies)} OTT releases with TMDB data\n")
 
-        for i, movie in enumerate(self.movies, 1):
-            title = movie.get('title', 'Unknown')
-            print(f"[{i}/{len(self.movies)}] {title[:50]}... ", end='', flush=True)
+    async def _enrich_all(self) -> List[bool]:
+        """Enrich every release concurrently over one pooled session"""
+        total = len(self.movies)
+        semaphore = asyncio.Semaphore(self.TMDB_CONCURRENCY)
 
+        self._load_caches()
+        try:
+            async with self.tmdb:
+                results = await asyncio.gather(*(
+                    self._enrich_movie_bounded(semaphore, i, total, movie)
+                    for i, movie in enumerate(self.movies, 1)
+                ))
+        finally:
+            self._save_caches()
+
+        return results
+
+    async def _enrich_movie_bounded(self, semaphore, index: int, total: int, movie: Dict) -> bool:
+        """Enrich one release under the concurrency limit and print its status line"""
+        async with semaphore:
             try:
-                # Search TMDB
-                tmdb_result = self._search_tmdb(movie)
-
-                if not tmdb_result:
-                    print("✗ Not found")
-                    continue
-
-                tmdb_id = tmdb_result['id']
-                media_type = tmdb_result.get('media_type', 'movie')
-
-                # Store basic TMDB data
-                movie['tmdb_id'] = tmdb_id
-                movie['tmdb_media_type'] = media_type
-
-                # Get full details
-                details = self._get_tmdb_details(tmdb_id, media_type)
-                if details:
-                    movie['overview'] = details.get('overview', '')
-                    movie['description'] = details.get('overview', '')
-
-                    genres = details.get('genres', [])
-                    movie['genres'] = [g['name'] for g in genres]
-
-                    if media_type == 'movie':
-                        movie['runtime'] = details.get('runtime')
-
-                    if media_type == 'tv':
-                        movie['episode_runtime'] = details.get('episode_run_time', [])
-                        movie['number_of_seasons'] = details.get('number_of_seasons')
-                        movie['number_of_episodes'] = details.get('number_of_episodes')
-
-                    movie['tmdb_release_date'] = details.get('release_date') or details.get('first_air_date')
-                    movie['status'] = details.get('status')
-                    movie['tmdb_rating'] = details.get('vote_average')
-                    movie['tmdb_vote_count'] = details.get('vote_count')
-                    movie['original_title'] = details.get('original_title') or details.get('original_name')
-                    movie['original_language'] = details.get('original_language')
-
-                # Get external IDs (IMDb)
-                external_ids = self._get_tmdb_external_ids(tmdb_id, media_type)
-                if external_ids:
-                    imdb_id = external_ids.get('imdb_id')
-                    if imdb_id:
-                        movie['imdb_id'] = imdb_id
-
-                # Get all posters
-                posters = self._get_tmdb_images(tmdb_id, media_type, 'posters')
-                if posters:
-                    movie['posters'] = {
-                        'thumbnail': f"https://image.tmdb.org/t/p/w92{posters[0]}",
-                        'small': f"https://image.tmdb.org/t/p/w185{posters[0]}",
-                        'medium': f"https://image.tmdb.org/t/p/w342{posters[0]}",
-                        'large': f"https://image.tmdb.org/t/p/w500{posters[0]}",
-                        'xlarge': f"https://image.tmdb.org/t/p/w780{posters[0]}",
-                        'original': f"https://image.tmdb.org/t/p/original{posters[0]}"
-                    }
-
-                    movie['all_posters'] = [
-                        {
-                            'thumbnail': f"https://image.tmdb.org/t/p/w92{p}",
-                            'small': f"https://image.tmdb.org/t/p/w185{p}",
-                            'medium': f"https://image.tmdb.org/t/p/w342{p}",
-                            'large': f"https://image.tmdb.org/t/p/w500{p}",
-                            'xlarge': f"https://image.tmdb.org/t/p/w780{p}",
-                            'original': f"https://image.tmdb.org/t/p/original{p}"
-                        }
-                        for p in posters[:5]
-                    ]
-
-                    movie['poster_url_medium'] = movie['posters']['medium']
-                    movie['poster_url_large'] = movie['posters']['large']
-
-                # Get all backdrops
-                backdrops = self._get_tmdb_images(tmdb_id, media_type, 'backdrops')
-                if backdrops:
-                    movie['backdrops'] = {
-                        'small': f"https://image.tmdb.org/t/p/w300{backdrops[0]}",
-                        'medium': f"https://image.tmdb.org/t/p/w780{backdrops[0]}",
-                        'large': f"https://image.tmdb.org/t/p/w1280{backdrops[0]}",
-                        'original': f"https://image.tmdb.org/t/p/original{backdrops[0]}"
-                    }
-
-                    movie['all_backdrops'] = [
-                        {
-                            'small': f"https://image.tmdb.org/t/p/w300{b}",
-                            'medium': f"https://image.tmdb.org/t/p/w780{b}",
-                            'large': f"https://image.tmdb.org/t/p/w1280{b}",
-                            'original': f"https://image.tmdb.org/t/p/original{b}"
-                        }
-                        for b in backdrops[:5]
-                    ]
-
-                    movie['backdrop_url'] = movie['backdrops']['original']
-
-                # Get cast and crew
-                credits = self._get_tmdb_credits(tmdb_id, media_type)
-                if credits:
-                    cast = credits.get('cast', [])
-                    crew = credits.get('crew', [])
-
-                    movie['cast'] = [
-                        {
-                            'name': c['name'],
-                            'character': c.get('character', ''),
-                            'profile_path': f"https://image.tmdb.org/t/p/w185{c['profile_path']}" if c.get('profile_path') else None
-                        }
-                        for c in cast[:10]
-                    ]
-
-                    directors = [c['name'] for c in crew if c.get('job') == 'Director']
-                    movie['directors'] = directors
-
-                    writers = [c['name'] for c in crew if c.get('job') in ['Writer', 'Screenplay']]
-                    movie['writers'] = writers[:5]
-
-                # Get videos (trailers)
-                videos = self._get_tmdb_videos(tmdb_id, media_type)
-                if videos:
-                    trailers = [v for v in videos if v.get('type') == 'Trailer' and v.get('site') == 'YouTube']
-                    if trailers:
-                        official_trailer = next((t for t in trailers if t.get('official')), trailers[0])
-                        movie['youtube_id'] = official_trailer['key']
-                        movie['youtube_url'] = f"https://www.youtube.com/watch?v={official_trailer['key']}"
-                        movie['youtube_title'] = official_trailer.get('name', '')
-
-                enriched_count += 1
-                print("✓ Complete")
-
-                time.sleep(0.25)  # Rate limiting
-
+                enriched, status = await self._enrich_movie(movie)
             except Exception as e:
-                print(f"✗ Error: {str(e)[:40]}")
+                enriched, status = False, f"✗ Error: {str(e)[:40]}"
+
+        print(f"[{index}/{total}] {movie.get('title', 'Unknown')[:50]}... {status}")
+        return enriched
+
+    async def _enrich_movie(self, movie: Dict):
+        """Enrich a single release with TMDB data; returns (enriched, status)"""
+        # Search TMDB
+        tmdb_result = await self._search_tmdb_cached(movie)
+
+        if not tmdb_result:
+            return False, "✗ Not found"
+
+        tmdb_id = tmdb_result['id']
+        media_type = tmdb_result.get('media_type', 'movie')
+
+        # Store basic TMDB data
+        movie['tmdb_id'] = tmdb_id
+        movie['tmdb_media_type'] = media_type
+
+        # Get full details (IDs, credits and videos appended) and all images
+        details, images = await asyncio.gather(
+            self._get_tmdb_details(tmdb_id, media_type, ['external_ids', 'credits', 'videos']),
+            self._get_tmdb_images(tmdb_id, media_type)
+        )
+        details = details or {}
+        if details:
+            movie['overview'] = details.get('overview', '')
+            movie['description'] = details.get('overview', '')
+
+            genres = details.get('genres', [])
+            movie['genres'] = [g['name'] for g in genres]
+
+            if media_type == 'movie':
+                movie['runtime'] = details.get('runtime')
+
+            if media_type == 'tv':
+                movie['episode_runtime'] = details.get('episode_run_time', [])
+                movie['number_of_seasons'] = details.get('number_of_seasons')
+                movie['number_of_episodes'] = details.get('number_of_episodes')
+
+            movie['tmdb_release_date'] = details.get('release_date') or details.get('first_air_date')
+            movie['status'] = details.get('status')
+            movie['tmdb_rating'] = details.get('vote_average')
+            movie['tmdb_vote_count'] = details.get('vote_count')
+            movie['original_title'] = details.get('original_title') or details.get('original_name')
+            movie['original_language'] = details.get('original_language')
+
+        # External IDs (IMDb) came back with the details
+        external_ids = details.get('external_ids')
+        if external_ids:
+            imdb_id = external_ids.get('imdb_id')
+            if imdb_id:
+                movie['imdb_id'] = imdb_id
+
+        # Get all posters
+        posters = self._sorted_image_paths(images, 'posters')
+        if posters:
+            movie['posters'] = tmdb_image_urls(posters[0], POSTER_SIZES)
+
+            movie['all_posters'] = [tmdb_image_urls(p, POSTER_SIZES) for p in posters[:5]]
+
+            movie['poster_url_medium'] = movie['posters']['medium']
+            movie['poster_url_large'] = movie['posters']['large']
+
+        # Get all backdrops
+        backdrops = self._sorted_image_paths(images, 'backdrops')
+        if backdrops:
+            movie['backdrops'] = tmdb_image_urls(backdrops[0], BACKDROP_SIZES)
+
+            movie['all_backdrops'] = [tmdb_image_urls(b, BACKDROP_SIZES) for b in backdrops[:5]]
+
+            movie['backdrop_url'] = movie['backdrops']['original']
+
+        # Cast and crew came back with the details
+        credits = details.get('credits')
+        if credits:
+            cast = credits.get('cast', [])
+            crew = credits.get('crew', [])
+
+            movie['cast'] = [
+                {
+                    'name': c['name'],
+                    'character': c.get('character', ''),
+                    'profile_path': tmdb_image_url(c['profile_path'], 'w185') if c.get('profile_path') else None
+                }
+                for c in cast[:10]
+            ]
 
-        print(f"\n✅ Enriched {enriched_count}/{len(self.movies)} OTT releases with TMDB data\n")
+            directors = [c['name'] for c in crew if c.get('job') == 'Director']
+            movie['directors'] = directors
+
+            writers = [c['name'] for c in crew if c.get('job') in ['Writer', 'Screenplay']]
+            movie['writers'] = writers[:5]
+
+        # Videos (trailers) came back with the details
+        videos = (details.get('videos') or {}).get('results', [])
+        if videos:
+            trailers = [v for v in videos if v.get('type') == 'Trailer' and v.get('site') == 'YouTube']
+            if trailers:
+                official_trailer = next((t for t in trailers if t.get('official')), trailers[0])
+                movie['youtube_id'] = official_trailer['key']
+                movie['youtube_url'] = f"https://www.youtube.com/watch?v={official_trailer['key']}"
+                movie['youtube_title'] = official_trailer.get('name', '')
+
+        return True, "✓ Complete"
 
     def save(self, filename='ott_releases_enriched.json'):
-        """Save enriched data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.movies, f, indent=2, ensure_ascii=False)
+        """Save enriched data to JSON file (serialized in memory, then written in one go)"""
+        save_json(self.movies, filename)
         print(f"💾 Saved: {filename}\n")
 
     def run(self):
@@ -359,22 +364,27 @@ class OTTReleasesEnricher:
         self.save()
 
         # Summary
-        with_tmdb = sum(1 for m in self.movies if m.get('tmdb_id'))
-        with_imdb = sum(1 for m in self.movies if m.get('imdb_id'))
-        with_posters = sum(1 for m in self.movies if m.get('posters'))
-        with_backdrops = sum(1 for m in self.movies if m.get('backdrops'))
-        with_deeplinks = sum(1 for m in self.movies if m.get('deeplinks'))
+        # Count coverage in a single pass over the releases
+        with_tmdb = with_imdb = with_posters = with_backdrops = with_deeplinks = 0
+        movies = self.movies
+        total = len(movies)
+        for m in movies:
+            if m.get('tmdb_id'): with_tmdb += 1
+            if m.get('imdb_id'): with_imdb += 1
+            if m.get('posters'): with_posters += 1
+            if m.get('backdrops'): with_backdrops += 1
+            if m.get('deeplinks'): with_deeplinks += 1
 
         print("="*60)
         print("✅ ENRICHMENT COMPLETE")
         print("="*60)
         print(f"\n📊 Summary:")
-        print(f"   • Total OTT releases: {len(self.movies)}")
-        print(f"   • With TMDB IDs: {with_tmdb}/{len(self.movies)}")
-        print(f"   • With IMDb IDs: {with_imdb}/{len(self.movies)}")
-        print(f"   • With posters: {with_posters}/{len(self.movies)}")
-        print(f"   • With backdrops: {with_backdrops}/{len(self.movies)}")
-        print(f"   • With deeplinks: {with_deeplinks}/{len(self.movies)}")
+        print(f"   • Total OTT releases: {total}")
+        print(f"   • With TMDB IDs: {with_tmdb}/{total}")
+        print(f"   • With IMDb IDs: {with_imdb}/{total}")
+        print(f"   • With posters: {with_posters}/{total}")
+        print(f"   • With backdrops: {with_backdrops}/{total}")
+        print(f"   • With deeplinks: {with_deeplinks}/{total}")
         print("\n" + "="*60 + "\n")
 
 
@@ -22,14 +22,15 @@ Usage:
     --force: Re-enrich all items, even if already enriched
 """
 
-import json
-import re
 import time
 import argparse
 from typing import Dict, List, Optional
 import requests
 from datetime import datetime
 
+from config import clean_search_title
+from json_io import load_json, save_json
+
 
 class OTTPlayEnricher:
     """Enrich OTTPlay content using qdMovieAPI (IMDB-based)"""
@@ -41,6 +42,9 @@ class OTTPlayEnricher:
         self.data = {}
         self.content_list = []
 
+        # One keep-alive session for every API call (no new connection per lookup)
+        self.session = requests.Session()
+
         # Test API connection
         self._test_connection()
 
@@ -48,7 +52,7 @@ class OTTPlayEnricher:
         """Test if qdMovieAPI is accessible"""
         try:
             print(f"Testing connection to {self.api_url}...")
-            response = requests.get(f"{self.api_url}/", timeout=5)
+            response = self.session.get(f"{self.api_url}/", timeout=5)
             response.raise_for_status()
             print("✓ API connection successful\n")
         except requests.exceptions.ConnectionError:
@@ -77,7 +81,7 @@ class OTTPlayEnricher:
         """Fetch URL with retry logic"""
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, timeout=15)
+                response = self.session.get(url, timeout=15)
                 response.raise_for_status()
                 return response.json()
             except requests.exceptions.ConnectionError:
@@ -99,17 +103,7 @@ class OTTPlayEnricher:
         if not title:
             return title
 
-        cleaned = title
-        # Remove content in parentheses
-        cleaned = re.sub(r'\([^)]*\)', '', cleaned)
-        # Remove season information
-        cleaned = re.sub(r'\s+Season\s+\d+.*', '', cleaned, flags=re.IGNORECASE)
-        # Remove extra whitespace
-        cleaned = ' '.join(cleaned.split())
-        # Remove trailing punctuation
-        cleaned = cleaned.strip(' -:')
-
-        return cleaned
+        return clean_search_title(title)
 
     def _search_qdmovie(self, title: str) -> Optional[Dict]:
         """Search for content using qdMovieAPI"""
@@ -179,8 +173,7 @@ class OTTPlayEnricher:
     def load_data(self, filename='ottplay_complete_no_deeplink.json'):
         """Load OTTPlay data from JSON file"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
+            self.data = load_json(filename)
 
             # Extract content array
             self.content_list = self.data.get('content', [])
@@ -221,30 +214,36 @@ class OTTPlayEnricher:
         imdb_count = 0
         metadata_count = 0
 
+        total = len(items_to_enrich)
         for i, item in enumerate(items_to_enrich, 1):
             title = item.get('title', 'Unknown')
             title_type = item.get('title_type', 'unknown')
 
-            print(f"[{i}/{len(items_to_enrich)}] {title[:45]}... ({title_type}) ", end='', flush=True)
+            print(f"[{i}/{total}] {title[:45]}... ({title_type}) ", end='', flush=True)
 
             try:
                 # Track what we already have (unless force mode)
                 has_imdb = bool(item.get('imdb_id')) and not self.force
                 has_poster = bool(item.get('posters')) and not self.force
 
-                # Step 1: Search for the content
-                search_result = self._search_qdmovie(title)
+                # Step 1: Search for the content (skipped when the IMDB ID is already known;
+                # the details call below returns everything the search result would)
+                if has_imdb:
+                    search_result = None
+                    imdb_id = item['imdb_id']
+                else:
+                    search_result = self._search_qdmovie(title)
 
-                if not search_result:
-                    print("✗ Not found")
-                    continue
+                    if not search_result:
+                        print("✗ Not found")
+                        continue
 
-                # Extract IMDB ID from search result
-                imdb_id = None
-                for field in ['id', 'imdb_id', 'imdbID', 'imdbId']:
-                    if field in search_result and search_result[field]:
-                        imdb_id = str(search_result[field])
-                        break
+                    # Extract IMDB ID from search result
+                    imdb_id = None
+                    for field in ['id', 'imdb_id', 'imdbID', 'imdbId']:
+                        if field in search_result and search_result[field]:
+                            imdb_id = str(search_result[field])
+                            break
 
                 if not imdb_id:
                     print("✗ No IMDB ID")
@@ -261,7 +260,7 @@ class OTTPlayEnricher:
 
                 # Try to get poster from search result first (faster)
                 poster_url = None
-                if not has_poster:
+                if not has_poster and search_result:
                     poster_url = self._extract_poster_from_details(search_result)
                     if poster_url:
                         item['posters'] = {
@@ -413,8 +412,7 @@ class OTTPlayEnricher:
 
     def save(self, filename='ottplay_complete_enriched.json'):
         """Save enriched data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        save_json(self.data, filename)
 
         print(f"💾 Saved: {filename}")
 
@@ -7,31 +7,55 @@ Prerequisites:
     export TMDB_API_KEY='your_key_here'
 
 Usage:
-    python3 enrich_ottplay_tmdb.py [--test] [--force]
+    python3 enrich_ottplay_tmdb.py [--test] [--force] [--no-cache]
 
     --test: Process only first 5 items
     --force: Re-enrich all items, even if already enriched
+    --no-cache: Ignore and do not update the TMDB response cache
 """
 
-import json
+import asyncio
 import os
-import re
 import sys
-import time
 import argparse
-import requests
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import aiohttp
+except ImportError:
+    print("❌ Missing required package: aiohttp")
+    print("\n💡 Install: pip3 install aiohttp")
+    sys.exit(1)
+
+from config import BACKDROP_SIZES, POSTER_SIZES, clean_search_title, tmdb_image_url, tmdb_image_urls
+from json_io import load_json, save_json
+from tmdb_cache import ResponseCache
+from tmdb_client import TMDBClient, is_rate_limited
+
+
+# Poster sizes stored for OTTPlay items: xlarge/original capped at w500 so every size keeps the 27:40 ratio
+_POSTER_SIZES_W500 = POSTER_SIZES[:4] + (('xlarge', 'w500'), ('original', 'w500'))
+
 
 class OTTPlayTMDBEnricher:
     """Enrich OTTPlay content using TMDB API"""
 
-    def __init__(self, test_mode=False, force=False):
+    # Concurrent items in flight during TMDB enrichment
+    TMDB_CONCURRENCY = 16
+
+    # On-disk cache of TMDB responses, shared across runs (entries expire)
+    CACHE_FILE = '.cache/ottplay_tmdb_cache.json'
+    CACHE_TTL = 7 * 24 * 3600
+
+    def __init__(self, test_mode=False, force=False, use_cache=True):
         self.test_mode = test_mode
         self.force = force
+        self.use_cache = use_cache
+        self.cache = ResponseCache(self.CACHE_FILE, self.CACHE_TTL, enabled=use_cache)
         self.data = {}
         self.content_list = []
+        self.counts = {}
 
         # TMDB API (required)
         self.tmdb_api_key = os.environ.get('TMDB_API_KEY')
@@ -43,44 +67,52 @@ class OTTPlayTMDBEnricher:
 
         print(f"✓ TMDB API key configured\n")
 
+        # Rate-limited TMDB requests over one pooled session (opened for the enrichment step)
+        self.tmdb = TMDBClient(self.tmdb_api_key, self.cache)
+
     def _clean_title_for_search(self, title):
         """Clean up title for better search results"""
         if not title:
             return title
 
-        cleaned = title
-        # Remove content in parentheses
-        cleaned = re.sub(r'\([^)]*\)', '', cleaned)
-        # Remove season information
-        cleaned = re.sub(r'\s+Season\s+\d+.*', '', cleaned, flags=re.IGNORECASE)
-        # Remove extra whitespace
-        cleaned = ' '.join(cleaned.split())
-        # Remove trailing punctuation
-        cleaned = cleaned.strip(' -:')
-
-        return cleaned
-
-    def _fetch_with_retry(self, url, params, max_retries=3):
-        """Fetch URL with retry logic"""
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, params=params, timeout=15)
-                response.raise_for_status()
-                return response.json()
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-                if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise
-            except Exception:
+        return clean_search_title(title)
+
+    def _load_cache(self):
+        """Load cached TMDB responses from disk"""
+        if self.cache.load():
+            print(f"📦 Loaded {len(self.cache)} cached TMDB responses\n")
+
+    async def _find_by_imdb_id(self, imdb_id: str, title_type: str) -> Optional[Dict]:
+        """Look up TMDB content by IMDb ID (exact index lookup, no title disambiguation)"""
+        try:
+            url = f"https://api.themoviedb.org/3/find/{imdb_id}"
+            params = {
+                'api_key': self.tmdb_api_key,
+                'external_source': 'imdb_id'
+            }
+            data = await self.tmdb.fetch(url, params)
+        except Exception as e:
+            if is_rate_limited(e):
                 raise
+            return None
+
+        movie_results = [dict(r, media_type='movie') for r in data.get('movie_results', [])]
+        tv_results = [dict(r, media_type='tv') for r in data.get('tv_results', [])]
+        results = tv_results + movie_results if title_type == 'show' else movie_results + tv_results
+        return results[0] if results else None
 
-    def _search_tmdb(self, item: Dict) -> Optional[Dict]:
+    async def _search_tmdb(self, item: Dict) -> Optional[Dict]:
         """Search TMDB with multiple strategies"""
         title = item.get('title', '')
         title_type = item.get('title_type', 'movie')
+
+        # Items that already carry an IMDb ID resolve with one exact /find call
+        imdb_id = item.get('imdb_id')
+        if imdb_id and imdb_id.startswith('tt'):
+            result = await self._find_by_imdb_id(imdb_id, title_type)
+            if result:
+                return result
+
         clean_title = self._clean_title_for_search(title)
 
         # Determine search type based on title_type
@@ -103,7 +135,7 @@ class OTTPlayTMDBEnricher:
                     'language': 'en-US'
                 }
 
-                data = self._fetch_with_retry(url, params)
+                data = await self.tmdb.fetch(url, params)
 
                 if data.get('results') and len(data['results']) > 0:
                     # Filter by title_type if specified
@@ -119,107 +151,80 @@ class OTTPlayTMDBEnricher:
 
                     # Fallback to first result
                     return results[0]
-            except:
+            except Exception as e:
+                if is_rate_limited(e):
+                    raise
                 continue
 
         return None
 
-    def _get_tmdb_details(self, tmdb_id: int, media_type: str) -> Optional[Dict]:
-        """Get full content details from TMDB"""
+    async def _get_tmdb_details(self, tmdb_id: int, media_type: str, append: List[str] = ()) -> Optional[Dict]:
+        """Get full content details from TMDB, with sub-resources appended to the same response"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}"
             params = {
                 'api_key': self.tmdb_api_key,
                 'language': 'en-US'
             }
-            return self._fetch_with_retry(url, params)
-        except:
-            return None
-
-    def _get_tmdb_external_ids(self, tmdb_id: int, media_type: str) -> Optional[Dict]:
-        """Get external IDs (IMDb, etc.) from TMDB"""
-        try:
-            url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/external_ids"
-            params = {'api_key': self.tmdb_api_key}
-            return self._fetch_with_retry(url, params)
-        except:
+            if append:
+                params['append_to_response'] = ','.join(append)
+            return await self.tmdb.fetch(url, params)
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
             return None
 
-    def _get_tmdb_images(self, tmdb_id: int, media_type: str, image_type: str) -> List[str]:
-        """Get all images (posters or backdrops) from TMDB - prefer Indian/English"""
+    async def _get_tmdb_images(self, tmdb_id: int, media_type: str) -> Dict:
+        """Get all images (posters and backdrops) from TMDB"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/images"
             # Don't specify language to get all images
             params = {'api_key': self.tmdb_api_key}
-
-            data = self._fetch_with_retry(url, params)
-
-            if image_type == 'posters':
-                images = data.get('posters', [])
+            return await self.tmdb.fetch(url, params) or {}
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
+            return {}
+
+    def _sorted_image_paths(self, images: Dict, image_type: str) -> List[str]:
+        """File paths of posters or backdrops - prefer Indian/English"""
+        images = images.get(image_type, [])
+
+        # Preferred languages for Indian region (in priority order)
+        preferred_languages = ['en', 'hi', 'ta', 'te', 'ml', 'kn', 'mr', None]  # None = no language tag
+
+        # Separate images by language preference
+        prioritized_images = []
+        other_images = []
+
+        for img in images:
+            lang = img.get('iso_639_1')
+            if lang in preferred_languages:
+                # Add priority score based on language preference
+                priority = preferred_languages.index(lang) if lang in preferred_languages else 100
+                img['_priority'] = priority
+                prioritized_images.append(img)
             else:
-                images = data.get('backdrops', [])
-
-            # Preferred languages for Indian region (in priority order)
-            preferred_languages = ['en', 'hi', 'ta', 'te', 'ml', 'kn', 'mr', None]  # None = no language tag
+                # Non-preferred language (e.g., Chinese, Korean, etc.)
+                img['_priority'] = 1000
+                other_images.append(img)
 
-            # Separate images by language preference
-            prioritized_images = []
-            other_images = []
+        # Sort prioritized images by: 1) language priority, 2) vote average
+        prioritized_images.sort(key=lambda x: (x.get('_priority', 100), -x.get('vote_average', 0)))
 
-            for img in images:
-                lang = img.get('iso_639_1')
-                if lang in preferred_languages:
-                    # Add priority score based on language preference
-                    priority = preferred_languages.index(lang) if lang in preferred_languages else 100
-                    img['_priority'] = priority
-                    prioritized_images.append(img)
-                else:
-                    # Non-preferred language (e.g., Chinese, Korean, etc.)
-                    img['_priority'] = 1000
-                    other_images.append(img)
+        # Sort other images by vote average
+        other_images.sort(key=lambda x: x.get('vote_average', 0), reverse=True)
 
-            # Sort prioritized images by: 1) language priority, 2) vote average
-            prioritized_images.sort(key=lambda x: (x.get('_priority', 100), -x.get('vote_average', 0)))
+        # Combine: preferred languages first, then others
+        all_images = prioritized_images + other_images
 
-            # Sort other images by vote average
-            other_images.sort(key=lambda x: x.get('vote_average', 0), reverse=True)
-
-            # Combine: preferred languages first, then others
-            all_images = prioritized_images + other_images
-
-            # Return file paths
-            return [img['file_path'] for img in all_images if img.get('file_path')]
-
-        except:
-            return []
-
-    def _get_tmdb_credits(self, tmdb_id: int, media_type: str) -> Optional[Dict]:
-        """Get cast and crew from TMDB"""
-        try:
-            url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/credits"
-            params = {'api_key': self.tmdb_api_key}
-            return self._fetch_with_retry(url, params)
-        except:
-            return None
-
-    def _get_tmdb_videos(self, tmdb_id: int, media_type: str) -> List[Dict]:
-        """Get videos (trailers) from TMDB"""
-        try:
-            url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/videos"
-            params = {
-                'api_key': self.tmdb_api_key,
-                'language': 'en-US'
-            }
-            data = self._fetch_with_retry(url, params)
-            return data.get('results', [])
-        except:
-            return []
+        # Return file paths
+        return [img['file_path'] for img in all_images if img.get('file_path')]
 
     def load_data(self, filename='ottplay_complete_no_deeplink.json'):
         """Load OTTPlay data from JSON file"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
+            self.data = load_json(filename)
 
             # Extract content array
             self.content_list = self.data.get('content', [])
@@ -255,218 +260,17 @@ class OTTPlayTMDBEnricher:
             print("✅ All items already enriched!")
             return
 
-        enriched_count = 0
-        poster_count = 0
-        tmdb_count = 0
-        imdb_count = 0
-        metadata_count = 0
-
-        for i, item in enumerate(items_to_enrich, 1):
-            title = item.get('title', 'Unknown')
-            title_type = item.get('title_type', 'unknown')
-
-            print(f"[{i}/{len(items_to_enrich)}] {title[:45]}... ({title_type}) ", end='', flush=True)
-
-            try:
-                # Track what we already have (unless force mode)
-                has_tmdb = bool(item.get('tmdb_id')) and not self.force
-                has_imdb = bool(item.get('imdb_id')) and not self.force
-                has_poster = bool(item.get('posters')) and not self.force
-
-                # Step 1: Search TMDB
-                tmdb_result = self._search_tmdb(item)
-
-                if not tmdb_result:
-                    print("✗ Not found")
-                    continue
-
-                tmdb_id = tmdb_result['id']
-                media_type = tmdb_result.get('media_type', 'movie')
-
-                # Store basic TMDB data
-                if not has_tmdb:
-                    item['tmdb_id'] = tmdb_id
-                    item['tmdb_media_type'] = media_type
-                    tmdb_count += 1
-
-                # Step 2: Get full details
-                details = self._get_tmdb_details(tmdb_id, media_type)
-
-                if details:
-                    added_metadata = False
-
-                    # Description/Overview (only if better than current)
-                    overview = details.get('overview', '')
-                    if overview:
-                        current_desc = item.get('description', '')
-                        # Only update if current description is generic OTTplay template
-                        if 'Watch' in current_desc and 'full movie online in HD on OTTplay' in current_desc:
-                            item['description'] = overview
-                            item['overview'] = overview
-                            added_metadata = True
-                        elif not current_desc:
-                            item['description'] = overview
-                            item['overview'] = overview
-                            added_metadata = True
-
-                    # Genres
-                    genres = details.get('genres', [])
-                    if genres:
-                        item['genres'] = [g['name'] for g in genres]
-                        added_metadata = True
-
-                    # Runtime
-                    if media_type == 'movie':
-                        runtime = details.get('runtime')
-                        if runtime:
-                            item['runtime'] = runtime
-                            added_metadata = True
-
-                    # TV-specific metadata
-                    if media_type == 'tv':
-                        item['episode_runtime'] = details.get('episode_run_time', [])
-                        item['number_of_seasons'] = details.get('number_of_seasons')
-                        item['number_of_episodes'] = details.get('number_of_episodes')
-                        added_metadata = True
-
-                    # Release dates
-                    release_date = details.get('release_date') or details.get('first_air_date')
-                    if release_date:
-                        item['tmdb_release_date'] = release_date
-                        # Extract year
-                        try:
-                            item['year'] = int(release_date.split('-')[0])
-                            added_metadata = True
-                        except:
-                            pass
-
-                    # Ratings
-                    vote_average = details.get('vote_average')
-                    if vote_average:
-                        item['tmdb_rating'] = vote_average
-                        added_metadata = True
-
-                    item['tmdb_vote_count'] = details.get('vote_count')
-                    item['status'] = details.get('status')
-                    item['original_title'] = details.get('original_title') or details.get('original_name')
-                    item['original_language'] = details.get('original_language')
-
-                    if added_metadata:
-                        metadata_count += 1
-
-                # Step 3: Get external IDs (IMDb)
-                if not has_imdb:
-                    external_ids = self._get_tmdb_external_ids(tmdb_id, media_type)
-                    if external_ids:
-                        imdb_id = external_ids.get('imdb_id')
-                        if imdb_id:
-                            item['imdb_id'] = imdb_id
-                            imdb_count += 1
-
-                # Step 4: Get posters (prefer Indian/English, consistent size)
-                if not has_poster:
-                    posters = self._get_tmdb_images(tmdb_id, media_type, 'posters')
-                    if posters:
-                        # Use w500 for consistency (27:40 ratio, ~500x750px)
-                        item['posters'] = {
-                            'thumbnail': f"https://image.tmdb.org/t/p/w92{posters[0]}",
-                            'small': f"https://image.tmdb.org/t/p/w185{posters[0]}",
-                            'medium': f"https://image.tmdb.org/t/p/w342{posters[0]}",
-                            'large': f"https://image.tmdb.org/t/p/w500{posters[0]}",
-                            'xlarge': f"https://image.tmdb.org/t/p/w500{posters[0]}",  # Use w500 for consistency
-                            'original': f"https://image.tmdb.org/t/p/w500{posters[0]}"  # Use w500 for consistency
-                        }
-
-                        item['all_posters'] = [
-                            {
-                                'thumbnail': f"https://image.tmdb.org/t/p/w92{p}",
-                                'small': f"https://image.tmdb.org/t/p/w185{p}",
-                                'medium': f"https://image.tmdb.org/t/p/w342{p}",
-                                'large': f"https://image.tmdb.org/t/p/w500{p}",
-                                'xlarge': f"https://image.tmdb.org/t/p/w500{p}",
-                                'original': f"https://image.tmdb.org/t/p/w500{p}"
-                            }
-                            for p in posters[:5]
-                        ]
-
-                        item['poster_url_medium'] = item['posters']['medium']
-                        item['poster_url_large'] = item['posters']['large']
-                        item['poster_source'] = 'tmdb'
-                        poster_count += 1
-
-                # Step 5: Get backdrops
-                backdrops = self._get_tmdb_images(tmdb_id, media_type, 'backdrops')
-                if backdrops:
-                    item['backdrops'] = {
-                        'small': f"https://image.tmdb.org/t/p/w300{backdrops[0]}",
-                        'medium': f"https://image.tmdb.org/t/p/w780{backdrops[0]}",
-                        'large': f"https://image.tmdb.org/t/p/w1280{backdrops[0]}",
-                        'original': f"https://image.tmdb.org/t/p/original{backdrops[0]}"
-                    }
-
-                    item['all_backdrops'] = [
-                        {
-                            'small': f"https://image.tmdb.org/t/p/w300{b}",
-                            'medium': f"https://image.tmdb.org/t/p/w780{b}",
-                            'large': f"https://image.tmdb.org/t/p/w1280{b}",
-                            'original': f"https://image.tmdb.org/t/p/original{b}"
-                        }
-                        for b in backdrops[:5]
-                    ]
-
-                    item['backdrop_url'] = item['backdrops']['original']
-
-                # Step 6: Get cast and crew
-                credits = self._get_tmdb_credits(tmdb_id, media_type)
-                if credits:
-                    cast = credits.get('cast', [])
-                    crew = credits.get('crew', [])
-
-                    item['cast'] = [
-                        {
-                            'name': c['name'],
-                            'character': c.get('character', ''),
-                            'profile_path': f"https://image.tmdb.org/t/p/w185{c['profile_path']}" if c.get('profile_path') else None
-                        }
-                        for c in cast[:10]
-                    ]
-
-                    directors = [c['name'] for c in crew if c.get('job') == 'Director']
-                    if directors:
-                        item['directors'] = directors
-
-                    writers = [c['name'] for c in crew if c.get('job') in ['Writer', 'Screenplay']]
-                    if writers:
-                        item['writers'] = writers[:5]
-
-                # Step 7: Get videos (trailers)
-                videos = self._get_tmdb_videos(tmdb_id, media_type)
-                if videos:
-                    trailers = [v for v in videos if v.get('type') == 'Trailer' and v.get('site') == 'YouTube']
-                    if trailers:
-                        official_trailer = next((t for t in trailers if t.get('official')), trailers[0])
-                        item['youtube_id'] = official_trailer['key']
-                        item['youtube_url'] = f"https://www.youtube.com/watch?v={official_trailer['key']}"
-                        item['youtube_title'] = official_trailer.get('name', '')
-
-                enriched_count += 1
-
-                status_parts = []
-                if not has_tmdb:
-                    status_parts.append("TMDB")
-                if not has_imdb and item.get('imdb_id'):
-                    status_parts.append("IMDB")
-                if not has_poster and item.get('posters'):
-                    status_parts.append("poster")
-                if metadata_count:
-                    status_parts.append("metadata")
-
-                print(f"✓ {' + '.join(status_parts) if status_parts else 'complete'}")
-
-                time.sleep(0.25)  # Rate limiting
-
-            except Exception as e:
-                print(f"✗ Error: {str(e)[:40]}")
+        self.counts = {'tmdb': 0, 'imdb': 0, 'poster': 0, 'metadata': 0}
+        self._load_cache()
+        try:
+            results = asyncio.run(self._enrich_all(items_to_enrich))
+        finally:
+            self.cache.save()
+        enriched_count = sum(results)
+        tmdb_count = self.counts['tmdb']
+        imdb_count = self.counts['imdb']
+        poster_count = self.counts['poster']
+        metadata_count = self.counts['metadata']
 
         # Update the data structure
         self.data['content'] = self.content_list
@@ -478,10 +282,203 @@ class OTTPlayTMDBEnricher:
         print(f"   • Added posters: {poster_count}")
         print(f"   • Added metadata: {metadata_count}")
 
+    async def _enrich_all(self, items: List[Dict]) -> List[bool]:
+        """Enrich every item concurrently over one pooled, rate-limited session"""
+        total = len(items)
+        semaphore = asyncio.Semaphore(self.TMDB_CONCURRENCY)
+
+        async with self.tmdb:
+            results = await asyncio.gather(*(
+                self._enrich_item_bounded(semaphore, i, total, item)
+                for i, item in enumerate(items, 1)
+            ))
+
+        return results
+
+    async def _enrich_item_bounded(self, semaphore, index: int, total: int, item: Dict) -> bool:
+        """Enrich one item under the concurrency limit and print its status line"""
+        async with semaphore:
+            try:
+                enriched, status = await self._enrich_item(item)
+            except Exception as e:
+                enriched, status = False, f"✗ Error: {str(e)[:40]}"
+
+        title = item.get('title', 'Unknown')
+        title_type = item.get('title_type', 'unknown')
+        print(f"[{index}/{total}] {title[:45]}... ({title_type}) {status}")
+        return enriched
+
+    async def _enrich_item(self, item: Dict) -> Tuple[bool, str]:
+        """Search TMDB for one item and merge in details, IDs, images, credits and trailers"""
+        # Track what we already have (unless force mode)
+        has_tmdb = bool(item.get('tmdb_id')) and not self.force
+        has_imdb = bool(item.get('imdb_id')) and not self.force
+        has_poster = bool(item.get('posters')) and not self.force
+
+        # Step 1: Search TMDB
+        tmdb_result = await self._search_tmdb(item)
+
+        if not tmdb_result:
+            return False, "✗ Not found"
+
+        tmdb_id = tmdb_result['id']
+        media_type = tmdb_result.get('media_type', 'movie')
+
+        # Store basic TMDB data
+        if not has_tmdb:
+            item['tmdb_id'] = tmdb_id
+            item['tmdb_media_type'] = media_type
+            self.counts['tmdb'] += 1
+
+        # Step 2: Get full details (IDs, credits and videos appended) and all images
+        details, images = await asyncio.gather(
+            self._get_tmdb_details(tmdb_id, media_type, ['external_ids', 'credits', 'videos']),
+            self._get_tmdb_images(tmdb_id, media_type)
+        )
+        details = details or {}
+
+        added_metadata = False
+        if details:
+
+            # Description/Overview (only if better than current)
+            overview = details.get('overview', '')
+            if overview:
+                current_desc = item.get('description', '')
+                # Only update if current description is generic OTTplay template
+                if 'Watch' in current_desc and 'full movie online in HD on OTTplay' in current_desc:
+                    item['description'] = overview
+                    item['overview'] = overview
+                    added_metadata = True
+                elif not current_desc:
+                    item['description'] = overview
+                    item['overview'] = overview
+                    added_metadata = True
+
+            # Genres
+            genres = details.get('genres', [])
+            if genres:
+                item['genres'] = [g['name'] for g in genres]
+                added_metadata = True
+
+            # Runtime
+            if media_type == 'movie':
+                runtime = details.get('runtime')
+                if runtime:
+                    item['runtime'] = runtime
+                    added_metadata = True
+
+            # TV-specific metadata
+            if media_type == 'tv':
+                item['episode_runtime'] = details.get('episode_run_time', [])
+                item['number_of_seasons'] = details.get('number_of_seasons')
+                item['number_of_episodes'] = details.get('number_of_episodes')
+                added_metadata = True
+
+            # Release dates
+            release_date = details.get('release_date') or details.get('first_air_date')
+            if release_date:
+                item['tmdb_release_date'] = release_date
+                # Extract year
+                try:
+                    item['year'] = int(release_date.split('-')[0])
+                    added_metadata = True
+                except:
+                    pass
+
+            # Ratings
+            vote_average = details.get('vote_average')
+            if vote_average:
+                item['tmdb_rating'] = vote_average
+                added_metadata = True
+
+            item['tmdb_vote_count'] = details.get('vote_count')
+            item['status'] = details.get('status')
+            item['original_title'] = details.get('original_title') or details.get('original_name')
+            item['original_language'] = details.get('original_language')
+
+            if added_metadata:
+                self.counts['metadata'] += 1
+
+        # Step 3: External IDs (IMDb) came back with the details
+        if not has_imdb:
+            external_ids = details.get('external_ids')
+            if external_ids:
+                imdb_id = external_ids.get('imdb_id')
+                if imdb_id:
+                    item['imdb_id'] = imdb_id
+                    self.counts['imdb'] += 1
+
+        # Step 4: Get posters (prefer Indian/English, consistent size)
+        if not has_poster:
+            posters = self._sorted_image_paths(images, 'posters')
+            if posters:
+                # Use w500 for consistency (27:40 ratio, ~500x750px)
+                item['posters'] = tmdb_image_urls(posters[0], _POSTER_SIZES_W500)
+
+                item['all_posters'] = [tmdb_image_urls(p, _POSTER_SIZES_W500) for p in posters[:5]]
+
+                item['poster_url_medium'] = item['posters']['medium']
+                item['poster_url_large'] = item['posters']['large']
+                item['poster_source'] = 'tmdb'
+                self.counts['poster'] += 1
+
+        # Step 5: Get backdrops
+        backdrops = self._sorted_image_paths(images, 'backdrops')
+        if backdrops:
+            item['backdrops'] = tmdb_image_urls(backdrops[0], BACKDROP_SIZES)
+
+            item['all_backdrops'] = [tmdb_image_urls(b, BACKDROP_SIZES) for b in backdrops[:5]]
+
+            item['backdrop_url'] = item['backdrops']['original']
+
+        # Step 6: Cast and crew (appended to the details)
+        credits = details.get('credits')
+        if credits:
+            cast = credits.get('cast', [])
+            crew = credits.get('crew', [])
+
+            item['cast'] = [
+                {
+                    'name': c['name'],
+                    'character': c.get('character', ''),
+                    'profile_path': tmdb_image_url(c['profile_path'], 'w185') if c.get('profile_path') else None
+                }
+                for c in cast[:10]
+            ]
+
+            directors = [c['name'] for c in crew if c.get('job') == 'Director']
+            if directors:
+                item['directors'] = directors
+
+            writers = [c['name'] for c in crew if c.get('job') in ['Writer', 'Screenplay']]
+            if writers:
+                item['writers'] = writers[:5]
+
+        # Step 7: Videos (trailers, appended to the details)
+        videos = (details.get('videos') or {}).get('results', [])
+        if videos:
+            trailers = [v for v in videos if v.get('type') == 'Trailer' and v.get('site') == 'YouTube']
+            if trailers:
+                official_trailer = next((t for t in trailers if t.get('official')), trailers[0])
+                item['youtube_id'] = official_trailer['key']
+                item['youtube_url'] = f"https://www.youtube.com/watch?v={official_trailer['key']}"
+                item['youtube_title'] = official_trailer.get('name', '')
+
+        status_parts = []
+        if not has_tmdb:
+            status_parts.append("TMDB")
+        if not has_imdb and item.get('imdb_id'):
+            status_parts.append("IMDB")
+        if not has_poster and item.get('posters'):
+            status_parts.append("poster")
+        if added_metadata:
+            status_parts.append("metadata")
+
+        return True, f"✓ {' + '.join(status_parts) if status_parts else 'complete'}"
+
     def save(self, filename='ottplay_complete_enriched.json'):
         """Save enriched data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        save_json(self.data, filename)
 
         print(f"💾 Saved: {filename}")
 
@@ -509,6 +506,8 @@ def main():
                         help='Test mode: process only first 5 items')
     parser.add_argument('--force', action='store_true',
                         help='Force re-enrichment of all items, even if already enriched')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore and do not update the TMDB response cache')
 
     args = parser.parse_args()
 
@@ -518,7 +517,7 @@ def main():
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*60 + "\n")
 
-    enricher = OTTPlayTMDBEnricher(test_mode=args.test, force=args.force)
+    enricher = OTTPlayTMDBEnricher(test_mode=args.test, force=args.force, use_cache=not args.no_cache)
     enricher.load_data(args.input)
 
     if args.test and len(enricher.content_list) > 5:
@@ -8,34 +8,52 @@ Prioritizes items missing posters, uses IMDb as fallback source
 import json
 import sys
 import time
+import threading
 import requests
-from typing import Dict, Optional, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 
 try:
     from bs4 import BeautifulSoup
 except ImportError:
     print("❌ Missing required package: beautifulsoup4")
-    print("\n💡 Install: pip3 install beautifulsoup4")
+    print("\n💡 Install: pip3 install beautifulsoup4 lxml")
     sys.exit(1)
 
+from json_io import load_json, save_json
+
 
 class IMDbPosterEnricher:
     """Enriches content with IMDb poster URLs"""
 
+    # Concurrent IMDb page fetches (also acts as the rate limit)
+    MAX_WORKERS = 8
+
     def __init__(self, input_file='movies_enriched.json'):
         self.input_file = input_file
         self.data = []
         self.full_data = None
         self.enriched_count = 0
         self.failed_count = 0
+        self.lock = threading.Lock()
+
+        # One pooled session shared by all workers (keep-alive to imdb.com, retries with backoff)
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        })
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_WORKERS, max_retries=retries)
+        self.session.mount('https://', adapter)
 
     def load_data(self):
         """Load enriched data from JSON file"""
         print(f"\n📂 Loading data from {self.input_file}...")
         try:
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                loaded = json.load(f)
+            loaded = load_json(self.input_file)
 
             # Handle both flat list and OTTPlay structure
             if isinstance(loaded, list):
@@ -71,24 +89,15 @@ class IMDbPosterEnricher:
 
         try:
             url = f"https://www.imdb.com/title/{imdb_id}/"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-
-            # Retry logic for connection issues
-            for attempt in range(3):
-                try:
-                    response = requests.get(url, headers=headers, timeout=15)
-                    response.raise_for_status()
-                    break
-                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-                    if attempt < 2:
-                        time.sleep((attempt + 1) * 2)
-                        continue
-                    else:
-                        return None
-
-            soup = BeautifulSoup(response.text, 'html.parser')
+
+            # Connection errors and 429/5xx are retried with backoff by the session adapter
+            try:
+                response = self.session.get(url, timeout=15)
+                response.raise_for_status()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                return None
+
+            soup = BeautifulSoup(response.text, 'lxml')
 
             # Method 1: Look for poster image in hero section
             poster_img = soup.find('img', class_='ipc-image')
@@ -123,18 +132,17 @@ class IMDbPosterEnricher:
             print(f"\n⚠️  Error fetching IMDb poster for {imdb_id}: {e}")
             return None
 
-    def enrich_item(self, item: Dict) -> bool:
+    def enrich_item(self, item: Dict) -> Tuple[bool, str]:
         """
         Enrich a single item with IMDb poster
 
         Returns:
-            True if poster was added/updated
+            (True if poster was added/updated, status message)
         """
         imdb_id = item.get('imdb_id')
         if not imdb_id:
-            return False
+            return False, "❌ No IMDb ID"
 
-        title = item.get('title', 'Unknown')
         has_poster = bool(item.get('posters') or item.get('poster_path'))
 
         # Get IMDb poster
@@ -155,14 +163,31 @@ class IMDbPosterEnricher:
                 item['poster_url_medium'] = imdb_poster_url
                 item['poster_url_large'] = imdb_poster_url
 
-                print(f" → ✅ Added IMDb poster (no TMDB poster)")
-                return True
+                return True, "✅ Added IMDb poster (no TMDB poster)"
             else:
-                print(f" → ℹ️  IMDb poster stored as alternative")
-                return True
+                return True, "ℹ️  IMDb poster stored as alternative"
         else:
-            print(f" → ❌ No poster found on IMDb")
-            return False
+            return False, "❌ No poster found on IMDb"
+
+    def process_items(self, items: List[Dict]):
+        """Enrich items on a bounded thread pool (IMDb fetches are pure network wait)"""
+        total = len(items)
+
+        def process(numbered):
+            i, item = numbered
+            enriched, status = self.enrich_item(item)
+
+            with self.lock:
+                if enriched:
+                    self.enriched_count += 1
+                else:
+                    self.failed_count += 1
+                title = item.get('title', 'Unknown')
+                imdb_id = item.get('imdb_id', 'N/A')
+                print(f"[{i}/{total}] {title[:50]} ({imdb_id}) → {status}")
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            list(executor.map(process, enumerate(items, 1)))
 
     def run(self, prioritize_missing=True):
         """
@@ -204,19 +229,7 @@ class IMDbPosterEnricher:
         print("PROCESSING ITEMS WITHOUT POSTERS (Priority)")
         print("="*70 + "\n")
 
-        for i, item in enumerate(items_without_posters, 1):
-            title = item.get('title', 'Unknown')
-            imdb_id = item.get('imdb_id', 'N/A')
-
-            print(f"[{i}/{len(items_without_posters)}] {title[:50]} ({imdb_id})", end='')
-
-            if self.enrich_item(item):
-                self.enriched_count += 1
-            else:
-                self.failed_count += 1
-
-            # Rate limiting
-            time.sleep(0.5)
+        self.process_items(items_without_posters)
 
         # Optionally process items with existing posters
         if not prioritize_missing:
@@ -224,19 +237,7 @@ class IMDbPosterEnricher:
             print("PROCESSING ITEMS WITH EXISTING POSTERS (Adding IMDb as Alternative)")
             print("="*70 + "\n")
 
-            for i, item in enumerate(items_with_posters, 1):
-                title = item.get('title', 'Unknown')
-                imdb_id = item.get('imdb_id', 'N/A')
-
-                print(f"[{i}/{len(items_with_posters)}] {title[:50]} ({imdb_id})", end='')
-
-                if self.enrich_item(item):
-                    self.enriched_count += 1
-                else:
-                    self.failed_count += 1
-
-                # Rate limiting
-                time.sleep(0.5)
+            self.process_items(items_with_posters)
 
         # Save enriched data
         self.save_data()
@@ -267,15 +268,14 @@ class IMDbPosterEnricher:
 
         # Save enriched data (handle both structures)
         print(f"💾 Saving enriched data to {self.input_file}...")
-        with open(self.input_file, 'w', encoding='utf-8') as f:
-            if self.full_data:
-                # OTTPlay structure - update content array
-                self.full_data['content'] = self.data
-                self.full_data['enriched_at'] = datetime.now().isoformat()
-                json.dump(self.full_data, f, indent=2, ensure_ascii=False)
-            else:
-                # Flat list structure
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+        if self.full_data:
+            # OTTPlay structure - update content array
+            self.full_data['content'] = self.data
+            self.full_data['enriched_at'] = datetime.now().isoformat()
+            save_json(self.full_data, self.input_file)
+        else:
+            # Flat list structure
+            save_json(self.data, self.input_file)
         print("✅ Saved successfully")
 
 
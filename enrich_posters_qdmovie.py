@@ -21,6 +21,8 @@ except ImportError:
     print("\n💡 Install: pip3 install imdbinfo")
     sys.exit(1)
 
+from json_io import load_json, save_json
+
 
 class QDMoviePosterEnricher:
     """Enriches content with metadata (posters, plot, genres) using imdbinfo package"""
@@ -37,8 +39,7 @@ class QDMoviePosterEnricher:
         """Load enriched data from JSON file"""
         print(f"\n📂 Loading data from {self.input_file}...")
         try:
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                loaded = json.load(f)
+            loaded = load_json(self.input_file)
 
             # Handle both flat list and OTTPlay structure
             if isinstance(loaded, list):
@@ -334,15 +335,14 @@ class QDMoviePosterEnricher:
 
         # Save enriched data (handle both structures)
         print(f"💾 Saving enriched data to {self.input_file}...")
-        with open(self.input_file, 'w', encoding='utf-8') as f:
-            if self.full_data:
-                # OTTPlay structure - update content array
-                self.full_data['content'] = self.data
-                self.full_data['enriched_at'] = datetime.now().isoformat()
-                json.dump(self.full_data, f, indent=2, ensure_ascii=False)
-            else:
-                # Flat list structure
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+        if self.full_data:
+            # OTTPlay structure - update content array
+            self.full_data['content'] = self.data
+            self.full_data['enriched_at'] = datetime.now().isoformat()
+            save_json(self.full_data, self.input_file)
+        else:
+            # Flat list structure
+            save_json(self.data, self.input_file)
         print("✅ Saved successfully")
 
 
@@ -20,23 +20,63 @@ Usage:
 """
 
 import asyncio
-import json
-import re
 import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
+
+from config import clean_search_title
+from json_io import load_json, save_json
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the request rate shared by the worker threads"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping only when the bucket is empty"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.updated = time.monotonic()
+                self.tokens = 1
+            self.tokens -= 1
 
 
 class QDMovieEnricher:
     """Enrich movies using qdMovieAPI (IMDB-based)"""
 
+    # Concurrent qdMovieAPI lookups, paced so the IMDb scraping behind it isn't hammered
+    MAX_WORKERS = 8
+    REQUESTS_PER_SECOND = 4
+
     def __init__(self, api_url="http://127.0.0.1:5000", test_mode=False, force=False, input_file="movies_enriched.json"):
         self.api_url = api_url.rstrip('/')
         self.test_mode = test_mode
         self.force = force
         self.input_file = input_file
         self.movies = []
+        self.lock = threading.Lock()
+        self.counts = {}
+        self.rate_limiter = TokenBucket(rate=self.REQUESTS_PER_SECOND, burst=self.REQUESTS_PER_SECOND)
+
+        # One keep-alive session shared by the worker threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_WORKERS, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
         # Test API connection
         self._test_connection()
@@ -45,7 +85,7 @@ class QDMovieEnricher:
         """Test if qdMovieAPI is accessible"""
         try:
             print(f"Testing connection to {self.api_url}...")
-            response = requests.get(f"{self.api_url}/", timeout=5)
+            response = self.session.get(f"{self.api_url}/", timeout=5)
             response.raise_for_status()
             print("✓ API connection successful\n")
         except requests.exceptions.ConnectionError:
@@ -74,7 +114,8 @@ class QDMovieEnricher:
         """Fetch URL with retry logic"""
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, timeout=15)
+                self.rate_limiter.acquire()
+                response = self.session.get(url, timeout=15)
                 response.raise_for_status()
                 return response.json()
             except requests.exceptions.ConnectionError:
@@ -96,17 +137,7 @@ class QDMovieEnricher:
         if not title:
             return title
 
-        cleaned = title
-        # Remove content in parentheses
-        cleaned = re.sub(r'\([^)]*\)', '', cleaned)
-        # Remove season information
-        cleaned = re.sub(r'\s+Season\s+\d+.*', '', cleaned, flags=re.IGNORECASE)
-        # Remove extra whitespace
-        cleaned = ' '.join(cleaned.split())
-        # Remove trailing punctuation
-        cleaned = cleaned.strip(' -:')
-
-        return cleaned
+        return clean_search_title(title)
 
     def _search_qdmovie(self, title: str) -> Optional[Dict]:
         """Search for movie using qdMovieAPI"""
@@ -176,13 +207,151 @@ class QDMovieEnricher:
     def load_movies(self, filename='movies_enriched.json'):
         """Load movies from JSON file"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.movies = json.load(f)
+            self.movies = load_json(filename)
             print(f"✓ Loaded {len(self.movies)} movies from {filename}\n")
         except FileNotFoundError:
             print(f"❌ File not found: {filename}")
             exit(1)
 
+    def _count(self, key: str):
+        """Bump one of the enrichment counters (called from worker threads)"""
+        with self.lock:
+            self.counts[key] += 1
+
+    def _set_poster(self, movie: Dict, poster_url: str):
+        """Use one IMDb poster URL for every poster size"""
+        movie['posters'] = {size: poster_url for size in ('thumbnail', 'small', 'medium', 'large', 'xlarge', 'original')}
+        movie['poster_url_medium'] = poster_url
+        movie['poster_url_large'] = poster_url
+        movie['poster_source'] = 'imdb'
+        self._count('poster')
+
+    def _enrich_movie(self, movie: Dict) -> str:
+        """Search, fetch details and merge them into one movie; returns a status line"""
+        title = movie.get('title', 'Unknown')
+
+        # Track what we already have (unless force mode)
+        has_imdb = bool(movie.get('imdb_id')) and not self.force
+        has_poster = bool(movie.get('posters')) and not self.force
+
+        # Step 1: Search for the movie
+        search_result = self._search_qdmovie(title)
+
+        if not search_result:
+            return "✗ Not found"
+
+        # Extract IMDB ID from search result
+        imdb_id = None
+        for field in ['id', 'imdb_id', 'imdbID', 'imdbId']:
+            if field in search_result and search_result[field]:
+                imdb_id = str(search_result[field])
+                break
+
+        if not imdb_id:
+            return "✗ No IMDB ID"
+
+        # Ensure IMDB ID has 'tt' prefix
+        if not imdb_id.startswith('tt'):
+            imdb_id = f"tt{imdb_id}"
+
+        # Store IMDB ID if we don't have it
+        if not has_imdb:
+            movie['imdb_id'] = imdb_id
+            self._count('imdb')
+
+        # Try to get poster from search result first (faster)
+        if not has_poster:
+            poster_url = self._extract_poster_from_details(search_result)
+            if poster_url:
+                self._set_poster(movie, poster_url)
+                has_poster = True
+
+        # Step 2: Get full movie details
+        details = self._get_movie_details(imdb_id)
+
+        if details:
+            # Extract various metadata
+
+            # Description/Plot
+            for field in ['plot', 'overview', 'description', 'Plot']:
+                if field in details and details[field]:
+                    movie['description'] = details[field]
+                    movie['overview'] = details[field]
+                    break
+
+            # Genres
+            for field in ['genres', 'genre', 'Genre']:
+                if field in details and details[field]:
+                    genres = details[field]
+                    if isinstance(genres, str):
+                        movie['genres'] = [g.strip() for g in genres.split(',')]
+                    elif isinstance(genres, list):
+                        movie['genres'] = genres
+                    break
+
+            # Rating
+            for field in ['rating', 'imdbRating', 'imdb_rating', 'Rating']:
+                if field in details and details[field]:
+                    try:
+                        movie['imdb_rating'] = float(details[field])
+                    except:
+                        pass
+                    break
+
+            # Runtime
+            for field in ['runtime', 'Runtime', 'duration']:
+                if field in details and details[field]:
+                    movie['runtime'] = details[field]
+                    break
+
+            # Year
+            for field in ['year', 'Year', 'releaseDate', 'release_date']:
+                if field in details and details[field]:
+                    movie['year'] = details[field]
+                    break
+
+            # Director
+            for field in ['director', 'Director', 'directors']:
+                if field in details and details[field]:
+                    directors = details[field]
+                    if isinstance(directors, str):
+                        movie['directors'] = [d.strip() for d in directors.split(',')]
+                    elif isinstance(directors, list):
+                        movie['directors'] = directors
+                    break
+
+            # Cast/Actors
+            for field in ['actors', 'Actors', 'cast']:
+                if field in details and details[field]:
+                    actors = details[field]
+                    if isinstance(actors, str):
+                        movie['actors'] = [a.strip() for a in actors.split(',')]
+                    elif isinstance(actors, list):
+                        movie['actors'] = actors
+                    break
+
+            # Poster - only if we don't have one
+            if not has_poster:
+                poster_url = self._extract_poster_from_details(details)
+
+                if poster_url:
+                    self._set_poster(movie, poster_url)
+
+            self._count('enriched')
+
+            status_parts = []
+            if not has_imdb:
+                status_parts.append("IMDB ID")
+            if not has_poster and poster_url:
+                status_parts.append("poster")
+            if details.get('plot') or details.get('overview'):
+                status_parts.append("metadata")
+
+            return f"✓ {' + '.join(status_parts) if status_parts else 'enriched'}"
+        if not has_imdb:
+            return "✓ IMDB ID only"
+        return "⊙ No details"
+
     async def enrich_movies(self):
         """Enrich movies with qdMovieAPI (IMDB) data"""
         print("="*60)
@@ -207,171 +376,28 @@ class QDMovieEnricher:
             print("✅ All movies already enriched!")
             return
 
-        enriched_count = 0
-        poster_count = 0
-        imdb_count = 0
-
-        for i, movie in enumerate(movies_to_enrich, 1):
-            title = movie.get('title', 'Unknown')
-            print(f"[{i}/{len(movies_to_enrich)}] {title[:50]}... ", end='', flush=True)
+        self.counts = {'enriched': 0, 'poster': 0, 'imdb': 0}
+        total = len(movies_to_enrich)
 
+        def process(numbered):
+            i, movie = numbered
             try:
-                # Track what we already have (unless force mode)
-                has_imdb = bool(movie.get('imdb_id')) and not self.force
-                has_poster = bool(movie.get('posters')) and not self.force
-
-                # Step 1: Search for the movie
-                search_result = self._search_qdmovie(title)
-
-                if not search_result:
-                    print("✗ Not found")
-                    continue
-
-                # Extract IMDB ID from search result
-                imdb_id = None
-                for field in ['id', 'imdb_id', 'imdbID', 'imdbId']:
-                    if field in search_result and search_result[field]:
-                        imdb_id = str(search_result[field])
-                        break
-
-                if not imdb_id:
-                    print("✗ No IMDB ID")
-                    continue
-
-                # Ensure IMDB ID has 'tt' prefix
-                if not imdb_id.startswith('tt'):
-                    imdb_id = f"tt{imdb_id}"
-
-                # Store IMDB ID if we don't have it
-                if not has_imdb:
-                    movie['imdb_id'] = imdb_id
-                    imdb_count += 1
-
-                # Try to get poster from search result first (faster)
-                if not has_poster:
-                    poster_url = self._extract_poster_from_details(search_result)
-                    if poster_url:
-                        movie['posters'] = {
-                            'thumbnail': poster_url,
-                            'small': poster_url,
-                            'medium': poster_url,
-                            'large': poster_url,
-                            'xlarge': poster_url,
-                            'original': poster_url
-                        }
-                        movie['poster_url_medium'] = poster_url
-                        movie['poster_url_large'] = poster_url
-                        movie['poster_source'] = 'imdb'
-                        poster_count += 1
-                        has_poster = True
-
-                # Step 2: Get full movie details
-                details = self._get_movie_details(imdb_id)
-
-                if details:
-                    # Extract various metadata
-
-                    # Description/Plot
-                    for field in ['plot', 'overview', 'description', 'Plot']:
-                        if field in details and details[field]:
-                            movie['description'] = details[field]
-                            movie['overview'] = details[field]
-                            break
-
-                    # Genres
-                    for field in ['genres', 'genre', 'Genre']:
-                        if field in details and details[field]:
-                            genres = details[field]
-                            if isinstance(genres, str):
-                                movie['genres'] = [g.strip() for g in genres.split(',')]
-                            elif isinstance(genres, list):
-                                movie['genres'] = genres
-                            break
-
-                    # Rating
-                    for field in ['rating', 'imdbRating', 'imdb_rating', 'Rating']:
-                        if field in details and details[field]:
-                            try:
-                                movie['imdb_rating'] = float(details[field])
-                            except:
-                                pass
-                            break
-
-                    # Runtime
-                    for field in ['runtime', 'Runtime', 'duration']:
-                        if field in details and details[field]:
-                            movie['runtime'] = details[field]
-                            break
-
-                    # Year
-                    for field in ['year', 'Year', 'releaseDate', 'release_date']:
-                        if field in details and details[field]:
-                            movie['year'] = details[field]
-                            break
-
-                    # Director
-                    for field in ['director', 'Director', 'directors']:
-                        if field in details and details[field]:
-                            directors = details[field]
-                            if isinstance(directors, str):
-                                movie['directors'] = [d.strip() for d in directors.split(',')]
-                            elif isinstance(directors, list):
-                                movie['directors'] = directors
-                            break
-
-                    # Cast/Actors
-                    for field in ['actors', 'Actors', 'cast']:
-                        if field in details and details[field]:
-                            actors = details[field]
-                            if isinstance(actors, str):
-                                movie['actors'] = [a.strip() for a in actors.split(',')]
-                            elif isinstance(actors, list):
-                                movie['actors'] = actors
-                            break
-
-                    # Poster - only if we don't have one
-                    if not has_poster:
-                        poster_url = self._extract_poster_from_details(details)
-
-                        if poster_url:
-                            movie['posters'] = {
-                                'thumbnail': poster_url,
-                                'small': poster_url,
-                                'medium': poster_url,
-                                'large': poster_url,
-                                'xlarge': poster_url,
-                                'original': poster_url
-                            }
-                            movie['poster_url_medium'] = poster_url
-                            movie['poster_url_large'] = poster_url
-                            movie['poster_source'] = 'imdb'
-                            poster_count += 1
-
-                    enriched_count += 1
-
-                    status_parts = []
-                    if not has_imdb:
-                        status_parts.append("IMDB ID")
-                    if not has_poster and poster_url:
-                        status_parts.append("poster")
-                    if details.get('plot') or details.get('overview'):
-                        status_parts.append("metadata")
-
-                    print(f"✓ {' + '.join(status_parts) if status_parts else 'enriched'}")
-                else:
-                    if not has_imdb:
-                        print("✓ IMDB ID only")
-                    else:
-                        print("⊙ No details")
+                status = self._enrich_movie(movie)
+            except Exception as e:
+                status = f"✗ Error: {str(e)[:40]}"
+            with self.lock:
+                print(f"[{i}/{total}] {movie.get('title', 'Unknown')[:50]}... {status}")
 
-                time.sleep(0.5)  # Rate limiting
+        # Lookups are pure network wait, so run them on a bounded thread pool
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            list(executor.map(process, enumerate(movies_to_enrich, 1)))
 
-            except Exception as e:
-                print(f"✗ Error: {str(e)[:40]}")
+        enriched_count = self.counts['enriched']
+        poster_count = self.counts['poster']
+        imdb_count = self.counts['imdb']
 
         # Save enriched data
-        with open(self.input_file, 'w', encoding='utf-8') as f:
-            json.dump(self.movies, f, indent=2, ensure_ascii=False)
+        save_json(self.movies, self.input_file)
 
         print(f"\n✅ Enriched {enriched_count}/{len(movies_to_enrich)} movies")
         print(f"   • Added IMDB IDs: {imdb_count}")
@@ -7,10 +7,11 @@ Usage:
     python3 filter_upcoming.py [--input FILE] [--output FILE]
 """
 
-import json
 import argparse
 from datetime import datetime
 
+from json_io import load_json, save_json
+
 
 def parse_release_date(date_str):
     """Parse release date string to datetime object"""
@@ -113,8 +114,7 @@ def main():
 
     # Load movies
     try:
-        with open(args.input, 'r', encoding='utf-8') as f:
-            movies = json.load(f)
+        movies = load_json(args.input)
         print(f"✓ Loaded {len(movies)} movies from {args.input}\n")
     except FileNotFoundError:
         print(f"❌ File not found: {args.input}")
@@ -145,8 +145,7 @@ def main():
     print(f"✅ Keeping {after_count} {result_label}\n")
 
     # Save filtered movies
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(filtered_movies, f, indent=2, ensure_ascii=False)
+    save_json(filtered_movies, args.output)
 
     print(f"💾 Saved {after_count} movies to {args.output}\n")
     print("="*60 + "\n")
@@ -4,14 +4,13 @@ Remove all Binged.png poster references from movies_enriched.json
 and prepare for re-enrichment
 """
 
-import json
+from json_io import load_json, save_json
 
 def fix_binged_posters():
     """Remove all Binged.png posters from the enriched data"""
 
     # Load the enriched data
-    with open('movies_enriched.json', 'r', encoding='utf-8') as f:
-        movies = json.load(f)
+    movies = load_json('movies_enriched.json')
 
     print(f"Total movies: {len(movies)}")
 
@@ -72,8 +71,7 @@ def fix_binged_posters():
             print(f"Fixed: {movie.get('title', 'Unknown')}")
 
     # Save the cleaned data
-    with open('movies_enriched.json', 'w', encoding='utf-8') as f:
-        json.dump(movies, f, indent=2, ensure_ascii=False)
+    save_json(movies, 'movies_enriched.json')
 
     print(f"\n✅ Fixed {fixed_count} movies with Binged.png posters")
     print(f"💾 Saved: movies_enriched.json")
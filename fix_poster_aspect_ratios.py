@@ -4,11 +4,13 @@ Fix poster aspect ratios by re-fetching TMDB posters
 Focuses on items that have Binged posters or incorrect aspect ratios
 """
 
-import json
 import os
 import requests
 import time
 
+from config import POSTER_SIZES, tmdb_image_urls
+from json_io import load_json, save_json
+
 # TMDB API Key
 TMDB_API_KEY = os.environ.get('TMDB_API_KEY', '452357e5da52e2ddde20c64414a40637')
 
@@ -37,8 +39,7 @@ def fix_posters():
     """Fix poster aspect ratios in enriched data"""
 
     # Load enriched data
-    with open('movies_enriched.json', 'r', encoding='utf-8') as f:
-        movies = json.load(f)
+    movies = load_json('movies_enriched.json')
 
     print(f"\nTotal movies: {len(movies)}")
 
@@ -76,26 +77,9 @@ def fix_posters():
 
         if posters:
             # Update with TMDB posters
-            movie['posters'] = {
-                'thumbnail': f"https://image.tmdb.org/t/p/w92{posters[0]}",
-                'small': f"https://image.tmdb.org/t/p/w185{posters[0]}",
-                'medium': f"https://image.tmdb.org/t/p/w342{posters[0]}",
-                'large': f"https://image.tmdb.org/t/p/w500{posters[0]}",
-                'xlarge': f"https://image.tmdb.org/t/p/w780{posters[0]}",
-                'original': f"https://image.tmdb.org/t/p/original{posters[0]}"
-            }
-
-            movie['all_posters'] = [
-                {
-                    'thumbnail': f"https://image.tmdb.org/t/p/w92{p}",
-                    'small': f"https://image.tmdb.org/t/p/w185{p}",
-                    'medium': f"https://image.tmdb.org/t/p/w342{p}",
-                    'large': f"https://image.tmdb.org/t/p/w500{p}",
-                    'xlarge': f"https://image.tmdb.org/t/p/w780{p}",
-                    'original': f"https://image.tmdb.org/t/p/original{p}"
-                }
-                for p in posters[:5]
-            ]
+            movie['posters'] = tmdb_image_urls(posters[0], POSTER_SIZES)
+
+            movie['all_posters'] = [tmdb_image_urls(p, POSTER_SIZES) for p in posters[:5]]
 
             movie['poster_url_medium'] = movie['posters']['medium']
             movie['poster_url_large'] = movie['posters']['large']
@@ -112,8 +96,7 @@ def fix_posters():
         time.sleep(0.25)  # Rate limiting
 
     # Save updated data
-    with open('movies_enriched.json', 'w', encoding='utf-8') as f:
-        json.dump(movies, f, indent=2, ensure_ascii=False)
+    save_json(movies, 'movies_enriched.json')
 
     print(f"\n✅ Fixed {fixed_count}/{len(movies_to_fix)} posters")
     print(f"💾 Saved: movies_enriched.json")
@@ -4,11 +4,13 @@ Fix poster languages - prioritize English and Indian language posters
 over non-English/non-Indian language posters (Korean, Japanese, Chinese, etc.)
 """
 
-import json
 import os
 import requests
 import time
 
+from config import POSTER_SIZES, tmdb_image_url, tmdb_image_urls
+from json_io import load_json, save_json
+
 TMDB_API_KEY = os.environ.get('TMDB_API_KEY', '452357e5da52e2ddde20c64414a40637')
 
 # Preferred languages (in priority order)
@@ -116,8 +118,7 @@ def fix_poster_languages(filename):
     """Fix poster languages for a given JSON file"""
 
     # Load data
-    with open(filename, 'r', encoding='utf-8') as f:
-        movies = json.load(f)
+    movies = load_json(filename)
 
     print(f"\n{'='*70}")
     print(f"FIXING POSTER LANGUAGES: {filename}")
@@ -160,7 +161,7 @@ def fix_poster_languages(filename):
         # Get current poster to check if we need to update
         current_poster = movie.get('posters', {}).get('medium', '')
         new_poster_path = preferred_posters[0]['file_path']
-        new_poster_url = f"https://image.tmdb.org/t/p/w342{new_poster_path}"
+        new_poster_url = tmdb_image_url(new_poster_path, 'w342')
 
         # Check if poster changed
         if new_poster_path in current_poster:
@@ -169,26 +170,11 @@ def fix_poster_languages(filename):
             continue
 
         # Update with language-appropriate posters
-        movie['posters'] = {
-            'thumbnail': f"https://image.tmdb.org/t/p/w92{new_poster_path}",
-            'small': f"https://image.tmdb.org/t/p/w185{new_poster_path}",
-            'medium': f"https://image.tmdb.org/t/p/w342{new_poster_path}",
-            'large': f"https://image.tmdb.org/t/p/w500{new_poster_path}",
-            'xlarge': f"https://image.tmdb.org/t/p/w780{new_poster_path}",
-            'original': f"https://image.tmdb.org/t/p/original{new_poster_path}"
-        }
+        movie['posters'] = tmdb_image_urls(new_poster_path, POSTER_SIZES)
 
         # Store all preferred posters (up to 5)
         movie['all_posters'] = [
-            {
-                'thumbnail': f"https://image.tmdb.org/t/p/w92{p['file_path']}",
-                'small': f"https://image.tmdb.org/t/p/w185{p['file_path']}",
-                'medium': f"https://image.tmdb.org/t/p/w342{p['file_path']}",
-                'large': f"https://image.tmdb.org/t/p/w500{p['file_path']}",
-                'xlarge': f"https://image.tmdb.org/t/p/w780{p['file_path']}",
-                'original': f"https://image.tmdb.org/t/p/original{p['file_path']}",
-                'language': p['language']
-            }
+            dict(tmdb_image_urls(p['file_path'], POSTER_SIZES), language=p['language'])
             for p in preferred_posters[:5]
         ]
 
@@ -207,8 +193,7 @@ def fix_poster_languages(filename):
         time.sleep(0.3)  # Rate limiting
 
     # Save updated data
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(movies, f, indent=2, ensure_ascii=False)
+    save_json(movies, filename)
 
     print(f"\n{'='*70}")
     print(f"✅ Checked {checked_count} movies, updated {fixed_count} posters")
@@ -231,8 +216,7 @@ def main():
     for filename in files_to_process:
         if os.path.exists(filename):
             try:
-                with open(filename) as f:
-                    data = json.load(f)
+                data = load_json(filename)
                 if data:  # Only process if file has data
                     fix_poster_languages(filename)
             except Exception as e:
@@ -3,10 +3,12 @@
 Fix Stranger Things Season 5 poster by searching TMDB properly
 """
 
-import json
 import requests
 import os
 
+from config import POSTER_SIZES, tmdb_image_urls
+from json_io import load_json, save_json
+
 TMDB_API_KEY = os.environ.get('TMDB_API_KEY', '452357e5da52e2ddde20c64414a40637')
 
 def search_stranger_things():
@@ -63,8 +65,7 @@ def fix_stranger_things():
     """Fix Stranger Things Season 5 poster"""
 
     # Load enriched data
-    with open('movies_enriched.json', 'r', encoding='utf-8') as f:
-        movies = json.load(f)
+    movies = load_json('movies_enriched.json')
 
     # Find Stranger Things
     st_movie = None
@@ -104,26 +105,9 @@ def fix_stranger_things():
     st_movie['tmdb_id'] = tmdb_id
     st_movie['tmdb_media_type'] = media_type
 
-    st_movie['posters'] = {
-        'thumbnail': f"https://image.tmdb.org/t/p/w92{posters[0]}",
-        'small': f"https://image.tmdb.org/t/p/w185{posters[0]}",
-        'medium': f"https://image.tmdb.org/t/p/w342{posters[0]}",
-        'large': f"https://image.tmdb.org/t/p/w500{posters[0]}",
-        'xlarge': f"https://image.tmdb.org/t/p/w780{posters[0]}",
-        'original': f"https://image.tmdb.org/t/p/original{posters[0]}"
-    }
-
-    st_movie['all_posters'] = [
-        {
-            'thumbnail': f"https://image.tmdb.org/t/p/w92{p}",
-            'small': f"https://image.tmdb.org/t/p/w185{p}",
-            'medium': f"https://image.tmdb.org/t/p/w342{p}",
-            'large': f"https://image.tmdb.org/t/p/w500{p}",
-            'xlarge': f"https://image.tmdb.org/t/p/w780{p}",
-            'original': f"https://image.tmdb.org/t/p/original{p}"
-        }
-        for p in posters[:5]
-    ]
+    st_movie['posters'] = tmdb_image_urls(posters[0], POSTER_SIZES)
+
+    st_movie['all_posters'] = [tmdb_image_urls(p, POSTER_SIZES) for p in posters[:5]]
 
     st_movie['poster_url_medium'] = st_movie['posters']['medium']
     st_movie['poster_url_large'] = st_movie['posters']['large']
@@ -131,8 +115,7 @@ def fix_stranger_things():
     movies[st_index] = st_movie
 
     # Save
-    with open('movies_enriched.json', 'w', encoding='utf-8') as f:
-        json.dump(movies, f, indent=2, ensure_ascii=False)
+    save_json(movies, 'movies_enriched.json')
 
     print(f"\n✅ Fixed Stranger Things poster!")
     print(f"New poster URL: {st_movie['posters']['medium']}")
@@ -0,0 +1,41 @@
+"""
+Shared JSON load/save helpers for the scrapers and enrichers
+Uses orjson when it is installed (several times faster than stdlib json); the output is the same either way
+"""
+
+import json
+
+# Optional: orjson parses and serializes JSON several times faster than stdlib json
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+
+def loads_json(data):
+    """Parse JSON from bytes or str"""
+    return orjson.loads(data) if USE_ORJSON else json.loads(data)
+
+
+def load_json(filename):
+    """Read and parse a JSON file"""
+    with open(filename, 'rb') as f:
+        return loads_json(f.read())
+
+
+def dumps_json(data, indent=True) -> bytes:
+    """Serialize data as UTF-8 JSON (2-space indented unless indent=False)"""
+    if USE_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def save_json(data, filename, indent=True):
+    """Serialize data in memory, then write the file in one go"""
+    payload = dumps_json(data, indent)
+    with open(filename, 'wb') as f:
+        f.write(payload)
@@ -4,7 +4,6 @@ Re-enrich movies that are missing posters
 """
 
 import asyncio
-import json
 import os
 import time
 import requests
@@ -12,18 +11,38 @@ from typing import Dict, List, Optional
 
 try:
     from playwright.async_api import async_playwright
-    from bs4 import BeautifulSoup
 except ImportError as e:
     print(f"❌ Missing required package: {e}")
     print("\n💡 Install required packages:")
-    print("   pip3 install playwright beautifulsoup4 requests")
+    print("   pip3 install playwright requests")
     print("   playwright install chromium")
     exit(1)
 
+from config import POSTER_SIZES, tmdb_image_urls, usable_poster_url
+from json_io import load_json, save_json
+
 
 class PosterReEnricher:
     """Re-enrich movies with missing posters"""
 
+    # Binged detail pages loaded at once (one tab each in a shared browser)
+    BINGED_CONCURRENCY = 5
+
+    # Poster images on a Binged detail page (alt match is case-insensitive)
+    POSTER_SELECTOR = (
+        'img.movie-poster, img.show-poster, .movie-image img, .show-image img, img[alt*="poster" i]'
+    )
+
+    # Poster candidates queried inside the page (selector matches first, then og:image),
+    # so the DOM is never serialized and re-parsed in Python
+    POSTER_CANDIDATES_JS = """
+        (selector) => [
+            ...Array.from(document.querySelectorAll(selector),
+                          img => img.getAttribute('src') || img.getAttribute('data-src')),
+            document.querySelector('meta[property="og:image"]')?.getAttribute('content')
+        ]
+    """
+
     def __init__(self):
         self.tmdb_api_key = os.environ.get('TMDB_API_KEY')
         if not self.tmdb_api_key:
@@ -31,11 +50,14 @@ class PosterReEnricher:
             print("   export TMDB_API_KEY='your_key_here'")
             exit(1)
 
+        # One keep-alive session for every TMDB call (no new TLS handshake per lookup)
+        self.session = requests.Session()
+
     def _fetch_with_retry(self, url, params, max_retries=3):
         """Fetch URL with retry logic"""
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, params=params, timeout=15)
+                response = self.session.get(url, params=params, timeout=15)
                 response.raise_for_status()
                 return response.json()
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
@@ -70,57 +92,54 @@ class PosterReEnricher:
         except:
             return []
 
-    async def _fetch_binged_poster(self, movie: Dict) -> Optional[str]:
+    async def _fetch_binged_poster(self, context, movie: Dict) -> Optional[str]:
         """Fallback: Fetch poster from Binged.com content page"""
         url = movie.get('url')
         if not url:
             return None
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-
+            page = await context.new_page()
+            try:
                 await page.goto(url, wait_until='domcontentloaded', timeout=15000)
                 await asyncio.sleep(1)
 
-                content = await page.content()
-                await browser.close()
+                candidates = await page.evaluate(self.POSTER_CANDIDATES_JS, self.POSTER_SELECTOR)
+            finally:
+                await page.close()
 
-                soup = BeautifulSoup(content, 'html.parser')
-
-                # Try multiple selectors for poster
-                poster_selectors = [
-                    'img.movie-poster', 'img.show-poster',
-                    '.movie-image img', '.show-image img',
-                    'img[alt*="poster"]', 'img[alt*="Poster"]'
-                ]
-
-                for selector in poster_selectors:
-                    img = soup.select_one(selector)
-                    if img:
-                        poster_url = img.get('src') or img.get('data-src')
-                        if poster_url and poster_url.startswith('http') and 'Binged.png' not in poster_url:
-                            return poster_url
-
-                # Try og:image
-                og_image = soup.find('meta', property='og:image')
-                if og_image:
-                    poster_url = og_image.get('content')
-                    if poster_url and poster_url.startswith('http') and 'Binged.png' not in poster_url:
-                        return poster_url
+            for candidate in candidates:
+                poster_url = usable_poster_url(candidate)
+                if poster_url:
+                    return poster_url
 
         except Exception as e:
             print(f"    Error fetching from Binged: {str(e)[:50]}")
 
         return None
 
+    async def _fetch_binged_posters(self, movies: List[Dict]) -> List[Optional[str]]:
+        """Fetch Binged posters for several movies at once in one shared browser"""
+        semaphore = asyncio.Semaphore(self.BINGED_CONCURRENCY)
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            context = await browser.new_context()
+
+            async def fetch_bounded(movie):
+                async with semaphore:
+                    return await self._fetch_binged_poster(context, movie)
+
+            try:
+                return await asyncio.gather(*(fetch_bounded(movie) for movie in movies))
+            finally:
+                await browser.close()
+
     async def re_enrich_missing_posters(self):
         """Re-enrich movies missing posters"""
 
         # Load current data
-        with open('movies_enriched.json', 'r', encoding='utf-8') as f:
-            movies = json.load(f)
+        movies = load_json('movies_enriched.json')
 
         # Find movies without posters
         movies_without_posters = [m for m in movies if not m.get('posters')]
@@ -137,10 +156,12 @@ class PosterReEnricher:
         print("="*60 + "\n")
 
         enriched_count = 0
+        binged_pending = []
 
+        total = len(movies_without_posters)
         for i, movie in enumerate(movies_without_posters, 1):
             title = movie.get('title', 'Unknown')
-            print(f"[{i}/{len(movies_without_posters)}] {title[:50]}... ", end='', flush=True)
+            print(f"[{i}/{total}] {title[:50]}... ", end='', flush=True)
 
             try:
                 # If we have TMDB ID, try to get posters from TMDB
@@ -151,26 +172,9 @@ class PosterReEnricher:
                     # Get posters
                     posters = self._get_tmdb_images(tmdb_id, media_type, 'posters')
                     if posters:
-                        movie['posters'] = {
-                            'thumbnail': f"https://image.tmdb.org/t/p/w92{posters[0]}",
-                            'small': f"https://image.tmdb.org/t/p/w185{posters[0]}",
-                            'medium': f"https://image.tmdb.org/t/p/w342{posters[0]}",
-                            'large': f"https://image.tmdb.org/t/p/w500{posters[0]}",
-                            'xlarge': f"https://image.tmdb.org/t/p/w780{posters[0]}",
-                            'original': f"https://image.tmdb.org/t/p/original{posters[0]}"
-                        }
-
-                        movie['all_posters'] = [
-                            {
-                                'thumbnail': f"https://image.tmdb.org/t/p/w92{p}",
-                                'small': f"https://image.tmdb.org/t/p/w185{p}",
-                                'medium': f"https://image.tmdb.org/t/p/w342{p}",
-                                'large': f"https://image.tmdb.org/t/p/w500{p}",
-                                'xlarge': f"https://image.tmdb.org/t/p/w780{p}",
-                                'original': f"https://image.tmdb.org/t/p/original{p}"
-                            }
-                            for p in posters[:5]
-                        ]
+                        movie['posters'] = tmdb_image_urls(posters[0], POSTER_SIZES)
+
+                        movie['all_posters'] = [tmdb_image_urls(p, POSTER_SIZES) for p in posters[:5]]
 
                         movie['poster_url_medium'] = movie['posters']['medium']
                         movie['poster_url_large'] = movie['posters']['large']
@@ -180,8 +184,19 @@ class PosterReEnricher:
                         time.sleep(0.25)
                         continue
 
-                # Fallback: Try Binged.com
-                binged_poster = await self._fetch_binged_poster(movie)
+                # Fallback: Try Binged.com (fetched concurrently below)
+                binged_pending.append(movie)
+                print("→ queued for Binged")
+
+            except Exception as e:
+                print(f"✗ Error: {str(e)[:40]}")
+
+        if binged_pending:
+            print(f"\n🌐 Fetching {len(binged_pending)} posters from Binged ({self.BINGED_CONCURRENCY} at a time)...")
+            binged_posters = await self._fetch_binged_posters(binged_pending)
+
+            for movie, binged_poster in zip(binged_pending, binged_posters):
+                title = movie.get('title', 'Unknown')
                 if binged_poster:
                     movie['poster_url_medium'] = binged_poster
                     movie['poster_url_large'] = binged_poster
@@ -195,18 +210,12 @@ class PosterReEnricher:
                     }
                     movie['poster_source'] = 'binged'
                     enriched_count += 1
-                    print("✓ Binged poster found")
+                    print(f"  {title[:50]}... ✓ Binged poster found")
                 else:
-                    print("✗ No poster found")
-
-                time.sleep(0.5)
-
-            except Exception as e:
-                print(f"✗ Error: {str(e)[:40]}")
+                    print(f"  {title[:50]}... ✗ No poster found")
 
         # Save updated data
-        with open('movies_enriched.json', 'w', encoding='utf-8') as f:
-            json.dump(movies, f, indent=2, ensure_ascii=False)
+        save_json(movies, 'movies_enriched.json')
 
         print(f"\n✅ Re-enriched {enriched_count}/{len(movies_without_posters)} movies with posters")
         print(f"💾 Saved: movies_enriched.json")
@@ -9,9 +9,11 @@ Usage:
     python3 regenerate_placeholders.py
 """
 
-import json
+import hashlib
 import os
 import sys
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Optional, List
 
 # Check for PIL/Pillow
@@ -23,6 +25,59 @@ except ImportError:
     print("   pip install Pillow>=10.0.0")
     sys.exit(1)
 
+# Optional: NumPy builds the gradient background in one vectorized step
+try:
+    import numpy as np
+    USE_NUMPY = True
+except ImportError:
+    USE_NUMPY = False
+
+from json_io import load_json, save_json
+
+# Placeholder rendering is pure CPU, so it runs in one process per core
+MAX_WORKERS = os.cpu_count() or 4
+
+# TrueType fonts tried in order (MUST be TrueType - the default font has a fixed size!)
+FONT_PATHS = [
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",  # macOS
+    "/System/Library/Fonts/HelveticaNeue.ttc",  # macOS alternative
+    "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",  # macOS
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux
+    "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf",  # Linux alternative
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",  # Linux
+    "C:\\Windows\\Fonts\\arialbd.ttf",  # Windows
+]
+
+# Only the fonts present on this machine, checked once at import so missing paths never raise
+AVAILABLE_FONT_PATHS = [path for path in FONT_PATHS if os.path.exists(path)]
+
+# Image dimensions (standard poster size); the title font is 10% of the width (50pt at 500px)
+POSTER_WIDTH, POSTER_HEIGHT = 500, 750
+TITLE_FONT_SIZE = int(POSTER_WIDTH * 0.10)
+
+
+@lru_cache(maxsize=16)
+def _load_title_font(size):
+    """First loadable TrueType font at this size, read from disk once per process"""
+    for font_path in AVAILABLE_FONT_PATHS:
+        try:
+            return ImageFont.truetype(font_path, size), font_path
+        except (OSError, IOError):
+            continue
+    return None, None
+
+
+class _SafeTitleTable(dict):
+    """str.translate table keeping letters, digits, spaces and hyphens; each code point is classified once"""
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = kept = char if char.isalnum() or char in (' ', '-') else None
+        return kept
+
+
+_SAFE_TITLE_TABLE = _SafeTitleTable()
+
 
 class PlaceholderGenerator:
     """Generate placeholder posters for movies without images"""
@@ -42,39 +97,88 @@ class PlaceholderGenerator:
             'default': ('#455A64', '#263238', '#000000')  # Blue-grey glass
         }
 
+        # Advance widths of single words keyed by (font, word); wrapping sums these per line
+        self._word_lengths = {}
+
+        # Finished glass backgrounds keyed by (width, height, colors); every poster of a platform shares one
+        self._gradients = {}
+
         # Create placeholders directory
         os.makedirs('placeholders', exist_ok=True)
 
+    def _platform_palette(self, movie: Dict):
+        """Gradient colors for the movie's primary platform"""
+        platforms = movie.get('platforms', [])
+        primary_platform = platforms[0] if platforms else 'default'
+        return self.platform_colors.get(primary_platform, self.platform_colors['default'])
+
+    def placeholder_paths(self, movie: Dict):
+        """
+        Medium and large placeholder paths for a movie
+        The name carries a hash of the title and palette, so a changed title or platform renders anew
+        """
+        title = movie.get('title', 'Untitled')
+        colors = self._platform_palette(movie)
+
+        # Sanitize title for the filename
+        safe_title = title.translate(_SAFE_TITLE_TABLE).rstrip()
+        safe_title = safe_title.replace(' ', '-').lower()[:50]
+        digest = hashlib.blake2b('|'.join((title,) + colors).encode(), digest_size=6).hexdigest()
+
+        base = f"placeholders/{safe_title}-{digest}"
+        return f"{base}-medium.jpg", f"{base}-large.jpg"
+
+    def _glass_background(self, width, height, colors):
+        """Fresh copy of the glass gradient, rendered once per size and palette"""
+        key = (width, height, colors)
+        background = self._gradients.get(key)
+        if background is None:
+            background = self._gradients[key] = self._create_glass_gradient(width, height, colors)
+        return background.copy()
+
     def _create_glass_gradient(self, width, height, colors):
         """
         Create Apple Glass Design styled gradient with blur and depth
         Uses multi-stop gradient with frosted glass effect
         """
-        # Create base image
-        img = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(img)
-
         # Parse colors (now we have 3 colors: top, middle, bottom)
         r1, g1, b1 = int(colors[0][1:3], 16), int(colors[0][3:5], 16), int(colors[0][5:7], 16)
         r2, g2, b2 = int(colors[1][1:3], 16), int(colors[1][3:5], 16), int(colors[1][5:7], 16)
         r3, g3, b3 = int(colors[2][1:3], 16), int(colors[2][3:5], 16), int(colors[2][5:7], 16)
 
-        # Draw multi-stop gradient (top to middle, then middle to bottom)
-        for y in range(height):
-            if y < height // 2:
-                # Top half: color1 to color2
-                ratio = (y / (height // 2))
-                r = int(r1 + (r2 - r1) * ratio)
-                g = int(g1 + (g2 - g1) * ratio)
-                b = int(b1 + (b2 - b1) * ratio)
-            else:
-                # Bottom half: color2 to color3
-                ratio = ((y - height // 2) / (height // 2))
-                r = int(r2 + (r3 - r2) * ratio)
-                g = int(g2 + (g3 - g2) * ratio)
-                b = int(b2 + (b3 - b2) * ratio)
+        if USE_NUMPY:
+            # Whole multi-stop gradient at once: one row colour per y, broadcast across the width
+            half = height // 2
+            ys = np.arange(height, dtype=np.float64)
+            in_top = (ys < half)[:, None]
+            ratio = np.where(ys < half, ys / half, (ys - half) / half)[:, None]
+            start = np.where(in_top, np.float64([r1, g1, b1]), np.float64([r2, g2, b2]))
+            end = np.where(in_top, np.float64([r2, g2, b2]), np.float64([r3, g3, b3]))
+            rows = (start + (end - start) * ratio).astype(np.uint8)
+            img = Image.fromarray(np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3))), 'RGB')
+        else:
+            # Multi-stop gradient (top to middle, then middle to bottom) computed once per row
+            # into a 1px-wide column, which Pillow then stretches across the width in C
+            rows = []
+            for y in range(height):
+                if y < height // 2:
+                    # Top half: color1 to color2
+                    ratio = (y / (height // 2))
+                    r = int(r1 + (r2 - r1) * ratio)
+                    g = int(g1 + (g2 - g1) * ratio)
+                    b = int(b1 + (b2 - b1) * ratio)
+                else:
+                    # Bottom half: color2 to color3
+                    ratio = ((y - height // 2) / (height // 2))
+                    r = int(r2 + (r3 - r2) * ratio)
+                    g = int(g2 + (g3 - g2) * ratio)
+                    b = int(b2 + (b3 - b2) * ratio)
 
-            draw.line([(0, y), (width, y)], fill=(r, g, b))
+                rows.append((r, g, b))
+
+            column = Image.new('RGB', (1, height))
+            column.putdata(rows)
+            img = column.resize((width, height), Image.Resampling.NEAREST)
 
         # Apply subtle blur for frosted glass effect
         img = img.filter(ImageFilter.GaussianBlur(radius=2))
@@ -102,23 +206,34 @@ class PlaceholderGenerator:
 
         return img
 
+    def _word_length(self, font, word):
+        """Advance width of a word in font (getlength skips vertical metrics), measured once"""
+        key = (font, word)
+        length = self._word_lengths.get(key)
+        if length is None:
+            length = self._word_lengths[key] = font.getlength(word)
+        return length
+
     def _wrap_text(self, text, max_width, font):
-        """Wrap text to fit within max_width"""
+        """Wrap text to fit within max_width (greedy, summing per-word advance widths)"""
         words = text.split()
         lines = []
         current_line = []
+        current_width = 0
+        space_width = self._word_length(font, ' ')
 
         for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = font.getbbox(test_line)
-            width = bbox[2] - bbox[0]
+            word_width = self._word_length(font, word)
+            width = current_width + space_width + word_width if current_line else word_width
 
             if width <= max_width:
                 current_line.append(word)
+                current_width = width
             else:
                 if current_line:
                     lines.append(' '.join(current_line))
                 current_line = [word]
+                current_width = word_width
 
         if current_line:
             lines.append(' '.join(current_line))
@@ -133,55 +248,30 @@ class PlaceholderGenerator:
         """
         try:
             title = movie.get('title', 'Untitled')
-            platforms = movie.get('platforms', [])
+            colors = self._platform_palette(movie)
 
-            # Choose primary platform for color scheme
-            primary_platform = platforms[0] if platforms else 'default'
-            colors = self.platform_colors.get(primary_platform, self.platform_colors['default'])
+            # Medium and large versions
+            filename_medium, filename_large = self.placeholder_paths(movie)
 
-            # Image dimensions (standard poster size)
-            width, height = 500, 750
+            # A previous run already rendered this exact title and palette; reuse it
+            if os.path.exists(filename_medium) and os.path.exists(filename_large):
+                return filename_medium
+
+            width, height = POSTER_WIDTH, POSTER_HEIGHT
 
             # Create Apple Glass Design gradient background
-            img = self._create_glass_gradient(width, height, colors)
+            img = self._glass_background(width, height, colors)
             draw = ImageDraw.Draw(img)
 
-            # Calculate font size proportionally based on poster dimensions
-            # Use 10% of width for good visibility (for 500px width = 50pt)
-            font_size = int(width * 0.10)
-
-            # Try to load TrueType font with multiple fallbacks
-            # MUST use TrueType fonts - default font has fixed size!
-            font_paths = [
-                "/System/Library/Fonts/Supplemental/Arial Bold.ttf",  # macOS
-                "/System/Library/Fonts/HelveticaNeue.ttc",  # macOS alternative
-                "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",  # macOS
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux
-                "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf",  # Linux alternative
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",  # Linux
-                "C:\\Windows\\Fonts\\arialbd.ttf",  # Windows
-            ]
-
-            title_font = None
-            loaded_font_path = None
-            for font_path in font_paths:
-                try:
-                    title_font = ImageFont.truetype(font_path, font_size)
-                    loaded_font_path = font_path
-                    break
-                except (OSError, IOError):
-                    continue
+            font_size = TITLE_FONT_SIZE
+
+            # Load the TrueType font (cached per size, so only the first poster hits the disk);
+            # the parent process has already reported which font this is
+            title_font, _ = _load_title_font(font_size)
 
             # Final fallback - but this will have fixed size
             if title_font is None:
-                print(f"\n⚠️  ERROR: Could not load any TrueType font!")
-                print(f"    Tried: {', '.join(font_paths)}")
-                print(f"    Using default font (fixed size, ignores font_size={font_size})")
                 title_font = ImageFont.load_default()
-            # DEBUG: Print which font was loaded (only on first generation)
-            elif not hasattr(self, '_font_loaded_msg_shown'):
-                print(f"\n✓ Loaded font: {loaded_font_path} (size={font_size})")
-                self._font_loaded_msg_shown = True
 
             # Wrap title text
             max_title_width = width - 60  # 30px padding on each side
@@ -203,26 +293,20 @@ class PlaceholderGenerator:
                 text_width = bbox[2] - bbox[0]
                 x = (width - text_width) // 2
 
-                # Draw text shadow
-                draw.text((x + 2, y_offset + 2), line, fill=(0, 0, 0, 180), font=title_font)
+                # Draw text shadow (solid black: alpha is ignored on an RGB canvas anyway)
+                draw.text((x + 2, y_offset + 2), line, fill=(0, 0, 0), font=title_font)
                 # Draw text
                 draw.text((x, y_offset), line, fill=(255, 255, 255), font=title_font)
                 y_offset += line_height
 
-            # Generate filename (sanitize title)
-            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-')).rstrip()
-            safe_title = safe_title.replace(' ', '-').lower()[:50]
-
-            # Save medium and large versions
-            filename_medium = f"placeholders/{safe_title}-medium.jpg"
-            filename_large = f"placeholders/{safe_title}-large.jpg"
+            # Save medium (500x750). Smooth gradients gain little from the extra Huffman
+            # optimization pass, so encode once: progressive, with 4:2:0 chroma subsampling
+            img.save(filename_medium, 'JPEG', quality=85, progressive=True, subsampling='4:2:0')
 
-            # Save medium (500x750)
-            img.save(filename_medium, 'JPEG', quality=85, optimize=True)
-
-            # Create larger version (1000x1500)
-            img_large = img.resize((1000, 1500), Image.Resampling.LANCZOS)
-            img_large.save(filename_large, 'JPEG', quality=90, optimize=True)
+            # Create larger version (1000x1500); an exact 2x upscale gains nothing from
+            # Lanczos' wider kernel, so the cheaper bilinear filter is used
+            img_large = img.resize((1000, 1500), Image.Resampling.BILINEAR)
+            img_large.save(filename_large, 'JPEG', quality=90, progressive=True, subsampling='4:2:0')
 
             return filename_medium
 
@@ -236,6 +320,15 @@ class PlaceholderGenerator:
         print("🎬 Placeholder Regeneration Tool - All Files")
         print("=" * 60)
 
+        # Every worker picks the same font, so it is chosen and reported once here
+        title_font, loaded_font_path = _load_title_font(TITLE_FONT_SIZE)
+        if title_font is None:
+            print(f"\n⚠️  ERROR: Could not load any TrueType font!")
+            print(f"    Tried: {', '.join(FONT_PATHS)}")
+            print(f"    Using default font (fixed size, ignores font_size={TITLE_FONT_SIZE})")
+        else:
+            print(f"\n✓ Loaded font: {loaded_font_path} (size={TITLE_FONT_SIZE})")
+
         # Files to process
         files_to_process = [
             'movies_enriched.json',
@@ -253,8 +346,7 @@ class PlaceholderGenerator:
                 continue
 
             # Load existing data
-            with open(input_file, 'r', encoding='utf-8') as f:
-                movies = json.load(f)
+            movies = load_json(input_file)
 
             if not movies or len(movies) == 0:
                 print(f"\n⏭️  Skipping {input_file} (empty)")
@@ -277,13 +369,14 @@ class PlaceholderGenerator:
                     (image_url and image_url.startswith('http'))
                 )
 
-                # Check if already has placeholder
+                # Check if already has an up-to-date placeholder (one for an older title or platform is redrawn)
+                filename_medium, filename_large = self.placeholder_paths(movie)
                 has_placeholder = (
-                    (poster_medium and 'placeholders/' in poster_medium) or
-                    (poster_large and 'placeholders/' in poster_large)
+                    poster_medium == filename_medium and poster_large == filename_large and
+                    os.path.exists(filename_medium) and os.path.exists(filename_large)
                 )
 
-                # Need placeholder if: no external poster AND no placeholder yet
+                # Need placeholder if: no external poster AND no current placeholder
                 if not has_external_poster and not has_placeholder:
                     movies_needing_placeholders.append(movie)
 
@@ -294,26 +387,26 @@ class PlaceholderGenerator:
             print(f"   🖼️  Generating {len(movies_needing_placeholders)} placeholders...")
             print("   " + "-" * 57)
 
-            # Generate placeholders
+            # Generate placeholders across worker processes (results come back in order)
             generated_count = 0
-            for i, movie in enumerate(movies_needing_placeholders, 1):
-                title = movie.get('title', 'Untitled')
-                print(f"   [{i}/{len(movies_needing_placeholders)}] {title[:40]}", end='')
-
-                placeholder_path = self.generate_placeholder_poster(movie)
-
-                if placeholder_path:
-                    movie['poster_url_medium'] = placeholder_path
-                    movie['poster_url_large'] = placeholder_path.replace('-medium.jpg', '-large.jpg')
-                    generated_count += 1
-                    total_generated += 1
-                    print(" ✓")
-                else:
-                    print(" ✗")
+            total = len(movies_needing_placeholders)
+            with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                results = executor.map(_generate_placeholder_worker, movies_needing_placeholders)
+                for i, (movie, placeholder_path) in enumerate(zip(movies_needing_placeholders, results), 1):
+                    title = movie.get('title', 'Untitled')
+                    print(f"   [{i}/{total}] {title[:40]}", end='')
+
+                    if placeholder_path:
+                        movie['poster_url_medium'] = placeholder_path
+                        movie['poster_url_large'] = placeholder_path.replace('-medium.jpg', '-large.jpg')
+                        generated_count += 1
+                        total_generated += 1
+                        print(" ✓")
+                    else:
+                        print(" ✗")
 
             # Save updated data
-            with open(input_file, 'w', encoding='utf-8') as f:
-                json.dump(movies, f, indent=2, ensure_ascii=False)
+            save_json(movies, input_file)
 
             print("   " + "-" * 57)
             print(f"   ✅ Generated {generated_count} placeholders for {input_file}")
@@ -324,6 +417,18 @@ class PlaceholderGenerator:
         print("\nDone! 🎉")
 
 
+# Generator owned by each pool worker process (its font and width caches live there)
+_worker_generator = None
+
+
+def _generate_placeholder_worker(movie: Dict) -> Optional[str]:
+    """ProcessPoolExecutor entry point: render one placeholder in a worker process"""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = PlaceholderGenerator()
+    return _worker_generator.generate_placeholder_poster(movie)
+
+
 if __name__ == '__main__':
     generator = PlaceholderGenerator()
     generator.regenerate_all_placeholders()
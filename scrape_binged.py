@@ -8,7 +8,6 @@ Usage:
 """
 
 import asyncio
-import json
 import re
 import sys
 import argparse
@@ -18,14 +17,16 @@ from datetime import datetime
 # Check required packages
 try:
     from playwright.async_api import async_playwright
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError as e:
     print(f"❌ Missing required package: {e}")
     print("\n💡 Install required packages:")
-    print("   pip3 install playwright beautifulsoup4")
+    print("   pip3 install playwright beautifulsoup4 lxml")
     print("   playwright install chromium")
     sys.exit(1)
 
+from json_io import save_json
+
 
 class BingedScraper:
     """Scraper for Binged.com streaming premiere dates"""
@@ -65,11 +66,34 @@ class BingedScraper:
         '74': 'Hoichoi'
     }
 
+    # Platform ID in a logo URL (e.g., /4.webp or /30.png), compiled once for every item
+    _PLATFORM_RE = re.compile(r'/(\d+)\.(?:webp|png)')
+
+    # CSS selectors for the listing table (movie rows exclude the header and loader rows)
+    ITEM_SEL = (
+        'div.bng-movies-table-item'
+        ':not(:has(div.bng-movies-table-item-th, div.bng-movies-table-item-preloader))'
+    )
+    # Only the listing rows are built into the tree (scripts, nav and footer are skipped)
+    ITEM_STRAINER = SoupStrainer('div', class_='bng-movies-table-item')
+    TITLE_SEL = '.bng-movies-table-item-title a'
+    DATE_SEL = '.bng-movies-table-date span'
+    PLATFORM_IMG_SEL = '.bng-movies-table-platform .streaming-item-platform img'
+
+    # Pagination swaps the table rows in place, so wait for the first row's link to change
+    FIRST_ITEM_HREF_JS = """
+        () => document.querySelector('.bng-movies-table-item-title a')?.getAttribute('href') || null
+    """
+    PAGE_CHANGED_JS = """
+        prev => (document.querySelector('.bng-movies-table-item-title a')?.getAttribute('href') || null) !== prev
+    """
+
+    # Resource types aborted by the route handler; rows only need the HTML and img src attributes
+    BLOCKED_RESOURCE_TYPES = {'image', 'font', 'stylesheet', 'media'}
+
     # Configuration constants
     PAGE_LOAD_TIMEOUT = 60000  # 60 seconds
     SELECTOR_WAIT_TIMEOUT = 15000  # 15 seconds
-    INITIAL_LOAD_DELAY = 3  # seconds
-    PAGE_NAVIGATION_DELAY = 2  # seconds
     PAGE_NAVIGATION_DELAY_FALLBACK = 4  # seconds
 
     def __init__(self, max_pages: int = 5, output_file: str = 'scraped_content.json', test_mode: bool = False):
@@ -117,6 +141,7 @@ class BingedScraper:
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             )
+            await context.route('**/*', self._block_heavy_resources)
 
             page = await context.new_page()
 
@@ -131,8 +156,7 @@ class BingedScraper:
                 # Load initial page
                 print(f"📄 Loading initial page...")
                 await page.goto(url, wait_until='domcontentloaded', timeout=self.PAGE_LOAD_TIMEOUT)
-                await page.wait_for_selector('.bng-movies-table-item', timeout=self.SELECTOR_WAIT_TIMEOUT)
-                await asyncio.sleep(self.INITIAL_LOAD_DELAY)
+                await page.wait_for_selector(self.TITLE_SEL, timeout=self.SELECTOR_WAIT_TIMEOUT)
 
                 # Scrape first page
                 current_page = 1
@@ -160,6 +184,13 @@ class BingedScraper:
         print(f"\n✅ Scraping complete: {len(self.movies)} items found")
         return self.movies
 
+    async def _block_heavy_resources(self, route):
+        """Playwright route handler: abort images, fonts, stylesheets and media"""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def _navigate_to_page(self, page, page_num: int) -> bool:
         """
         Navigate to a specific page number
@@ -178,14 +209,16 @@ class BingedScraper:
                 return False
 
             print(f"\n📄 Navigating to page {page_num}...")
+            previous_href = await page.evaluate(self.FIRST_ITEM_HREF_JS)
             await next_button.click()
 
             try:
-                await page.wait_for_load_state('domcontentloaded', timeout=self.SELECTOR_WAIT_TIMEOUT)
-                await asyncio.sleep(self.PAGE_NAVIGATION_DELAY)
-            except asyncio.TimeoutError:
-                # Fallback delay if page load detection fails
-                print(f"  ⚠️  Page load timeout, using fallback delay...")
+                # Wait until the table actually shows different rows
+                await page.wait_for_function(self.PAGE_CHANGED_JS, arg=previous_href,
+                                             timeout=self.SELECTOR_WAIT_TIMEOUT)
+            except Exception:
+                # Fallback delay if row change detection fails
+                print(f"  ⚠️  Page change not detected, using fallback delay...")
                 await asyncio.sleep(self.PAGE_NAVIGATION_DELAY_FALLBACK)
 
             return True
@@ -205,15 +238,10 @@ class BingedScraper:
         try:
             print(f"📋 Scraping page {page_num}...")
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml', parse_only=self.ITEM_STRAINER)
 
             # Find all movie items, excluding headers and loaders
-            movie_items = soup.find_all('div', class_='bng-movies-table-item')
-            movie_items = [
-                item for item in movie_items
-                if not item.find('div', class_='bng-movies-table-item-th')
-                and not item.find('div', class_='bng-movies-table-item-preloader')
-            ]
+            movie_items = soup.select(self.ITEM_SEL)
 
             print(f"  Found {len(movie_items)} entries")
 
@@ -249,53 +277,43 @@ class BingedScraper:
         movie_data: Dict = {}
 
         # Extract title and URL
-        title_div = item.find('div', class_='bng-movies-table-item-title')
-        if title_div:
-            link = title_div.find('a')
-            if link:
-                # Get title (handle cases with separators like "Title | Subtitle")
-                title_text = link.get_text(separator='|', strip=True).split('|')[0].strip()
-                title_text = title_text.replace('\n', ' ').strip()
-                if title_text:
-                    movie_data['title'] = title_text
-
-                # Get URL
-                href = link.get('href', '')
-                if href:
-                    # Make URL absolute if relative
-                    if href.startswith('/'):
-                        movie_data['url'] = f"https://www.binged.com{href}"
-                    else:
-                        movie_data['url'] = href
+        link = item.select_one(self.TITLE_SEL)
+        if link:
+            # Get title (handle cases with separators like "Title | Subtitle")
+            title_text = link.get_text(separator='|', strip=True).split('|')[0].strip()
+            title_text = title_text.replace('\n', ' ').strip()
+            if title_text:
+                movie_data['title'] = title_text
+
+            # Get URL
+            href = link.get('href', '')
+            if href:
+                # Make URL absolute if relative
+                if href.startswith('/'):
+                    movie_data['url'] = f"https://www.binged.com{href}"
+                else:
+                    movie_data['url'] = href
 
         # Extract release date
-        date_div = item.find('div', class_='bng-movies-table-date')
-        if date_div:
-            date_span = date_div.find('span')
-            if date_span:
-                date_text = date_span.get_text(strip=True)
-                if date_text:
-                    movie_data['release_date'] = date_text
+        date_span = item.select_one(self.DATE_SEL)
+        if date_span:
+            date_text = date_span.get_text(strip=True)
+            if date_text:
+                movie_data['release_date'] = date_text
 
         # Extract platforms
-        platform_div = item.find('div', class_='bng-movies-table-platform')
-        if platform_div:
-            platform_container = platform_div.find('div', class_='streaming-item-platform')
-            if platform_container:
-                platform_imgs = platform_container.find_all('img')
-                platforms = []
-                for img in platform_imgs:
-                    src = img.get('src', '')
-                    # Extract platform ID from image URL (e.g., /4.webp or /30.png)
-                    match = re.search(r'/(\d+)\.(webp|png)', src)
-                    if match:
-                        platform_id = match.group(1)
-                        platform_name = self.PLATFORM_MAP.get(platform_id, f'Platform {platform_id}')
-                        if platform_name not in platforms:
-                            platforms.append(platform_name)
-                
-                if platforms:
-                    movie_data['platforms'] = platforms
+        platforms = []
+        for img in item.select(self.PLATFORM_IMG_SEL):
+            # Extract platform ID from image URL (e.g., /4.webp or /30.png)
+            match = self._PLATFORM_RE.search(img.get('src', ''))
+            if match:
+                platform_id = match.group(1)
+                platform_name = self.PLATFORM_MAP.get(platform_id, f'Platform {platform_id}')
+                if platform_name not in platforms:
+                    platforms.append(platform_name)
+
+        if platforms:
+            movie_data['platforms'] = platforms
 
         # Only return if we have at least a title
         return movie_data if movie_data.get('title') else None
@@ -312,8 +330,7 @@ class BingedScraper:
             filename = self.output_file
 
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            save_json(data, filename)
             print(f"\n💾 Saved {len(data)} items to: {filename}")
         except Exception as e:
             print(f"\n❌ Error saving to {filename}: {e}")
@@ -8,14 +8,71 @@ Usage:
 """
 
 from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
-import json
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import sys
 import asyncio
 import argparse
 from typing import List, Dict, Optional
 from config import BINGED_CONFIG, OTT_PLATFORM_FILTERS
+from json_io import dumps_json
+
+# Regexes used per listing item / per detail page, compiled once
+_PLATFORM_RE = re.compile(r'/(\d+)\.(?:webp|png)')
+_BACKGROUND_URL_RE = re.compile(r'url\((https?://[^)]+)\)')
+_ONCLICK_URL_RE = re.compile(r'https?://[^\s\'"]+')
+_URL_TRAILING_JUNK_RE = re.compile(r'["\'>),;]+$')
+
+# Platform domains to look for on detail pages
+PLATFORM_DOMAINS = {
+    'netflix.com': 'Netflix',
+    'primevideo.com': 'Amazon Prime Video',
+    'amazon.com/gp/video': 'Amazon Prime Video',
+    'hotstar.com': 'Jio Hotstar',
+    'jiocinema.com': 'Jio Hotstar',
+    'sonyliv.com': 'Sony LIV',
+    'zee5.com': 'Zee5',
+    'sunnxt.com': 'SunNXT',
+    'manoramamax.com': 'ManoramaMAX',
+    'tv.apple.com': 'Apple TV+',
+    'aha.video': 'Aha Video',
+    'altbalaji.com': 'ALT Balaji',
+    'discoveryplus.in': 'Discovery Plus',
+    'erosnow.com': 'ErosNow',
+    'hoichoi.tv': 'Hoichoi',
+}
+# Any link to one of those domains means the deeplink block has rendered
+_DEEPLINK_SEL = ', '.join(f'a[href*="{domain}"]' for domain in PLATFORM_DOMAINS)
+
+# Movie rows in the listing table; the header and loader rows are excluded by the selector itself
+_ITEM_SEL = (
+    'div.bng-movies-table-item'
+    ':not(:has(div.bng-movies-table-item-th, div.bng-movies-table-item-preloader))'
+)
+# Only the listing rows are built into the tree (scripts, nav and footer are skipped)
+_ITEM_STRAINER = SoupStrainer('div', class_='bng-movies-table-item')
+
+# Detail pages fetched concurrently (one tab each) when collecting deeplinks
+DEEPLINK_CONCURRENCY = 3
+
+# Resource types aborted by the route handler; only the HTML and its attributes are parsed
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'stylesheet', 'media'}
+
+# Pagination swaps the table rows in place, so wait for the first row's link to change
+FIRST_ITEM_HREF_JS = """
+    () => document.querySelector('.bng-movies-table-item-title a')?.getAttribute('href') || null
+"""
+PAGE_CHANGED_JS = """
+    prev => (document.querySelector('.bng-movies-table-item-title a')?.getAttribute('href') || null) !== prev
+"""
+
+
+async def block_heavy_resources(route):
+    """Playwright route handler: abort images, fonts, stylesheets and media"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 async def extract_deeplinks(page, movie_url: str, debug: bool = False) -> Dict[str, str]:
@@ -38,41 +95,19 @@ async def extract_deeplinks(page, movie_url: str, debug: bool = False) -> Dict[s
 
         # Navigate to detail page
         await page.goto(movie_url, wait_until='domcontentloaded', timeout=20000)
-        await asyncio.sleep(2)  # Wait for dynamic content to load
 
-        # Wait for network to be idle to ensure all content is loaded
+        # Wait for a platform link rather than for the network (ads/analytics) to go idle
         try:
-            await page.wait_for_load_state('networkidle', timeout=5000)
+            await page.wait_for_selector(_DEEPLINK_SEL, timeout=5000)
         except:
-            pass  # Continue if timeout
-
-        # Scroll to trigger any lazy-loaded content
-        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await asyncio.sleep(1)
-        await page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(1)
+            # No link rendered yet: scroll to trigger any lazy-loaded content
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await asyncio.sleep(1)
+            await page.evaluate("window.scrollTo(0, 0)")
+            await asyncio.sleep(1)
 
         content = await page.content()
-        soup = BeautifulSoup(content, 'html.parser')
-
-        # Platform domains to look for
-        platform_domains = {
-            'netflix.com': 'Netflix',
-            'primevideo.com': 'Amazon Prime Video',
-            'amazon.com/gp/video': 'Amazon Prime Video',
-            'hotstar.com': 'Jio Hotstar',
-            'jiocinema.com': 'Jio Hotstar',
-            'sonyliv.com': 'Sony LIV',
-            'zee5.com': 'Zee5',
-            'sunnxt.com': 'SunNXT',
-            'manoramamax.com': 'ManoramaMAX',
-            'tv.apple.com': 'Apple TV+',
-            'aha.video': 'Aha Video',
-            'altbalaji.com': 'ALT Balaji',
-            'discoveryplus.in': 'Discovery Plus',
-            'erosnow.com': 'ErosNow',
-            'hoichoi.tv': 'Hoichoi',
-        }
+        soup = BeautifulSoup(content, 'lxml')
 
         # Method 1: Look for "Watch Now" or streaming buttons/links with specific classes
         watch_elements = soup.find_all(['a', 'button', 'div'], class_=re.compile(r'watch|stream|play|platform|btn', re.I))
@@ -85,7 +120,7 @@ async def extract_deeplinks(page, movie_url: str, debug: bool = False) -> Dict[s
 
             # Check href
             if href and href.startswith('http'):
-                for domain, platform in platform_domains.items():
+                for domain, platform in PLATFORM_DOMAINS.items():
                     if domain in href and platform not in deeplinks:
                         # Filter out general homepage links
                         if not href.endswith(domain) and not href.endswith(domain + '/'):
@@ -95,10 +130,10 @@ async def extract_deeplinks(page, movie_url: str, debug: bool = False) -> Dict[s
 
             # Check onclick
             if onclick and 'http' in onclick:
-                for domain, platform in platform_domains.items():
+                for domain, platform in PLATFORM_DOMAINS.items():
                     if domain in onclick and platform not in deeplinks:
                         # Extract URL from onclick
-                        url_match = re.search(r'https?://[^\s\'"]+', onclick)
+                        url_match = _ONCLICK_URL_RE.search(onclick)
                         if url_match:
                             url = url_match.group(0)
                             if domain in url and not url.endswith(domain) and not url.endswith(domain + '/'):
@@ -112,7 +147,7 @@ async def extract_deeplinks(page, movie_url: str, debug: bool = False) -> Dict[s
         for link in all_links:
             href = link.get('href', '')
             if href and href.startswith('http'):
-                for domain, platform in platform_domains.items():
+                for domain, platform in PLATFORM_DOMAINS.items():
                     if domain in href and platform not in deeplinks:
                         # Filter out general homepage links
                         if not href.endswith(domain) and not href.endswith(domain + '/'):
@@ -129,7 +164,7 @@ async def extract_deeplinks(page, movie_url: str, debug: bool = False) -> Dict[s
             for attr in ['data-url', 'data-link', 'data-href']:
                 data_val = elem.get(attr, '')
                 if data_val and 'http' in data_val:
-                    for domain, platform in platform_domains.items():
+                    for domain, platform in PLATFORM_DOMAINS.items():
                         if domain in data_val and platform not in deeplinks:
                             if not data_val.endswith(domain) and not data_val.endswith(domain + '/'):
                                 deeplinks[platform] = data_val
@@ -139,14 +174,14 @@ async def extract_deeplinks(page, movie_url: str, debug: bool = False) -> Dict[s
         # Method 4: Search the entire page content for streaming URLs
         # This catches URLs that might be embedded in JavaScript or other places
         page_content = str(soup)
-        for domain, platform in platform_domains.items():
+        for domain, platform in PLATFORM_DOMAINS.items():
             if platform not in deeplinks and domain in page_content:
                 # Find all URLs containing this domain
                 pattern = rf'(https?://[^\s\'"<>]*{re.escape(domain)}[^\s\'"<>]*)'
                 matches = re.findall(pattern, page_content)
                 for match in matches:
                     # Clean up the URL (remove trailing quotes, brackets, etc.)
-                    clean_url = re.sub(r'["\'>),;]+$', '', match)
+                    clean_url = _URL_TRAILING_JUNK_RE.sub('', match)
                     # Verify it's a valid streaming link (not just homepage)
                     if not clean_url.endswith(domain) and not clean_url.endswith(domain + '/'):
                         deeplinks[platform] = clean_url
@@ -167,7 +202,40 @@ async def extract_deeplinks(page, movie_url: str, debug: bool = False) -> Dict[s
     return deeplinks
 
 
-async def scrape_page(page, page_num: int, platform_map: Dict[str, str], fetch_deeplinks: bool = True, debug: bool = False) -> List[Dict]:
+async def fetch_all_deeplinks(context, movies: List[Dict], debug: bool = False) -> None:
+    """
+    Fetch deeplinks for every movie with a detail URL, a few tabs at a time
+
+    The listing page is never navigated away from, so pagination keeps working
+    while detail pages load in their own tabs.
+
+    Args:
+        context: Playwright browser context
+        movies: Movie dictionaries, updated in place with 'deeplinks'
+        debug: Enable debug output
+    """
+    targets = [movie for movie in movies if movie.get('url')]
+    total = len(targets)
+    semaphore = asyncio.Semaphore(DEEPLINK_CONCURRENCY)
+
+    async def fetch_one(idx: int, movie: Dict) -> None:
+        async with semaphore:
+            print(f"  [{idx}/{total}] Fetching deeplinks for: {movie['title']}", file=sys.stderr)
+            page = await context.new_page()
+            try:
+                deeplinks = await extract_deeplinks(page, movie['url'], debug=debug)
+                if deeplinks:
+                    movie['deeplinks'] = deeplinks
+
+                # Keep each tab's request rate polite to avoid rate limiting
+                await asyncio.sleep(BINGED_CONFIG['request_delay'])
+            finally:
+                await page.close()
+
+    await asyncio.gather(*(fetch_one(idx, movie) for idx, movie in enumerate(targets, 1)))
+
+
+async def scrape_page(page, page_num: int, platform_map: Dict[str, str]) -> List[Dict]:
     """
     Scrape movies from a single page
 
@@ -175,8 +243,6 @@ async def scrape_page(page, page_num: int, platform_map: Dict[str, str], fetch_d
         page: Playwright page object
         page_num: Current page number
         platform_map: Mapping of platform IDs to names
-        fetch_deeplinks: Whether to fetch deeplinks from detail pages
-        debug: Enable debug output
 
     Returns:
         List of movie dictionaries
@@ -186,20 +252,17 @@ async def scrape_page(page, page_num: int, platform_map: Dict[str, str], fetch_d
     print(f"  Parsing page {page_num}...", file=sys.stderr)
     content = await page.content()
 
-    soup = BeautifulSoup(content, 'html.parser')
+    soup = BeautifulSoup(content, 'lxml', parse_only=_ITEM_STRAINER)
 
     # Find movie items
-    movie_items = soup.find_all('div', class_='bng-movies-table-item')
-    movie_items = [item for item in movie_items
-                   if not item.find('div', class_='bng-movies-table-item-th')
-                   and not item.find('div', class_='bng-movies-table-item-preloader')]
+    movie_items = soup.select(_ITEM_SEL)
 
     print(f"  Found {len(movie_items)} entries on page {page_num}", file=sys.stderr)
 
     if len(movie_items) == 0:
         return []
 
-    for idx, item in enumerate(movie_items, 1):
+    for item in movie_items:
         movie_data = {'content_type': 'ott_released'}
 
         # Extract title
@@ -241,7 +304,7 @@ async def scrape_page(page, page_num: int, platform_map: Dict[str, str], fetch_d
                 for img in platform_imgs:
                     src = img.get('src', '')
                     if src:
-                        match = re.search(r'/(\d+)\.(webp|png)', src)
+                        match = _PLATFORM_RE.search(src)
                         if match:
                             platform_id = match.group(1)
                             platform_name = platform_map.get(platform_id, f'Platform {platform_id}')
@@ -256,20 +319,10 @@ async def scrape_page(page, page_num: int, platform_map: Dict[str, str], fetch_d
             placeholder = img_div.find('div', class_='search-block-placeholder')
             if placeholder and placeholder.get('style'):
                 style = placeholder.get('style', '')
-                url_match = re.search(r'url\((https?://[^)]+)\)', style)
+                url_match = _BACKGROUND_URL_RE.search(style)
                 if url_match:
                     movie_data['image_url'] = url_match.group(1)
 
-        # Fetch deeplinks if enabled and we have a URL
-        if fetch_deeplinks and movie_data.get('url'):
-            print(f"  [{idx}/{len(movie_items)}] Fetching deeplinks for: {movie_data['title']}", file=sys.stderr)
-            deeplinks = await extract_deeplinks(page, movie_data['url'], debug=debug)
-            if deeplinks:
-                movie_data['deeplinks'] = deeplinks
-
-            # Add delay to avoid rate limiting
-            await asyncio.sleep(BINGED_CONFIG['request_delay'])
-
         # Only add if we have at least a title
         if movie_data.get('title'):
             movies.append(movie_data)
@@ -308,30 +361,28 @@ async def scrape_ott_releases(max_pages: int = 5, fetch_deeplinks: bool = True,
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             )
+            # Keep full rendering in debug mode so the screenshot is meaningful
+            if not debug:
+                await context.route('**/*', block_heavy_resources)
 
-            page = await context.new_page()
-
-            # Avoid detection
-            await page.add_init_script("""
+            # Avoid detection (context-wide so detail tabs get it too)
+            await context.add_init_script("""
                 Object.defineProperty(navigator, 'webdriver', {
                     get: () => undefined
                 })
             """)
 
+            page = await context.new_page()
+
             print("Navigating to page...", file=sys.stderr)
             await page.goto(url, wait_until='domcontentloaded', timeout=30000)
 
             print("Waiting for content...", file=sys.stderr)
             try:
-                await page.wait_for_selector('#bng-movies-table', timeout=10000)
+                await page.wait_for_selector('#bng-movies-table .bng-movies-table-item-title a', timeout=15000)
                 print("Table found!", file=sys.stderr)
             except:
                 print("Table not found immediately, continuing anyway...", file=sys.stderr)
-
-            # Wait for JavaScript
-            try:
-                await page.wait_for_load_state('networkidle', timeout=15000)
-            except:
                 await asyncio.sleep(5)
 
             # Scroll to trigger lazy loading
@@ -349,15 +400,14 @@ async def scrape_ott_releases(max_pages: int = 5, fetch_deeplinks: bool = True,
             # Scrape first page
             current_page = 1
             print(f"\nScraping page {current_page}...", file=sys.stderr)
-            page_movies = await scrape_page(page, current_page, BINGED_CONFIG['platforms'],
-                                          fetch_deeplinks=fetch_deeplinks, debug=debug)
+            page_movies = await scrape_page(page, current_page, BINGED_CONFIG['platforms'])
             all_movies.extend(page_movies)
 
             # Pagination
             while current_page < max_pages:
                 try:
                     pagination_html = await page.inner_html('.bng-movies-table-pagination')
-                    soup = BeautifulSoup(pagination_html, 'html.parser')
+                    soup = BeautifulSoup(pagination_html, 'lxml')
 
                     page_spans = soup.find_all('span', {'data-page': True})
 
@@ -379,17 +429,18 @@ async def scrape_ott_releases(max_pages: int = 5, fetch_deeplinks: bool = True,
                         break
 
                     print(f"\n  Clicking to page {next_page_num}...", file=sys.stderr)
+                    previous_href = await page.evaluate(FIRST_ITEM_HREF_JS)
                     await page.click(f'.bng-movies-table-pagination span:has-text("{next_button.get_text(strip=True)}")')
 
+                    # Wait until the table actually shows different rows
                     try:
-                        await page.wait_for_load_state('networkidle', timeout=10000)
+                        await page.wait_for_function(PAGE_CHANGED_JS, arg=previous_href, timeout=10000)
                     except:
                         await asyncio.sleep(3)
 
                     current_page = next_page_num
                     print(f"Scraping page {current_page}...", file=sys.stderr)
-                    page_movies = await scrape_page(page, current_page, BINGED_CONFIG['platforms'],
-                                                   fetch_deeplinks=fetch_deeplinks, debug=debug)
+                    page_movies = await scrape_page(page, current_page, BINGED_CONFIG['platforms'])
 
                     if not page_movies:
                         print("  No movies found on this page, stopping", file=sys.stderr)
@@ -401,6 +452,11 @@ async def scrape_ott_releases(max_pages: int = 5, fetch_deeplinks: bool = True,
                     print(f"  Error during pagination: {e}", file=sys.stderr)
                     break
 
+            # Detail pages open in their own tabs once the listing is done
+            if fetch_deeplinks and all_movies:
+                print(f"\nFetching deeplinks ({DEEPLINK_CONCURRENCY} tabs)...", file=sys.stderr)
+                await fetch_all_deeplinks(context, all_movies, debug=debug)
+
             await browser.close()
 
             print(f"\n{'='*60}", file=sys.stderr)
@@ -438,13 +494,16 @@ def main():
     print("="*60, file=sys.stderr)
 
     if movies:
+        # Serialize once; the same JSON goes to stdout and to the file
+        payload = dumps_json(movies)
+
         # Output JSON to stdout
-        print(json.dumps(movies, indent=2, ensure_ascii=False))
+        print(payload.decode('utf-8'))
 
         # Save to file
         output_file = 'ott_releases.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(movies, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(payload)
 
         print(f"\nData saved to {output_file}", file=sys.stderr)
         print(f"Total OTT releases: {len(movies)}", file=sys.stderr)
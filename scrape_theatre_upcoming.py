@@ -9,7 +9,6 @@ Usage:
 
 from playwright.async_api import async_playwright
 from bs4 import BeautifulSoup
-import json
 import re
 import sys
 import asyncio
@@ -17,6 +16,22 @@ import argparse
 from typing import List, Dict, Optional
 from datetime import datetime
 from config import BMS_CONFIG, UPCOMING_THEATRE_DATE_RANGE
+from json_io import dumps_json
+
+# Patterns applied on every movie detail page, compiled once
+_YOUTUBE_EMBED_RE = re.compile(r'/embed/([a-zA-Z0-9_-]+)')
+_YOUTUBE_WATCH_RE = re.compile(r'youtube\.com/watch')
+_YOUTUBE_WATCH_ID_RE = re.compile(r'youtube\.com/watch\?v=([a-zA-Z0-9_-]+)')
+_YOUTUBE_ANY_ID_RE = re.compile(r'(?:youtube\.com/watch\?v=|youtube\.com/embed/|youtu\.be/)([a-zA-Z0-9_-]{11})')
+_TRAILER_CLASS_RE = re.compile(r'trailer|video', re.I)
+_TITLE_CLASS_RE = re.compile(r'title|name', re.I)
+_INFO_CLASS_RE = re.compile(r'info|meta|detail', re.I)
+_DURATION_RE = re.compile(r'(\d+h\s*\d*m?|\d+\s*mins?)', re.I)
+_CBFC_RE = re.compile(r'\b(U/A|UA|U|A)\b')
+_RELEASE_DATE_RE = re.compile(r'(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})', re.I)
+_FORMAT_CLASS_RE = re.compile(r'format|dimension|experience', re.I)
+_FORMAT_RE = re.compile(r'\b(2D|3D|IMAX\s*3D|IMAX\s*2D|IMAX|DOLBY\s*CINEMA\s*3D|DOLBY\s*CINEMA|DOLBY\s*ATMOS|4DX\s*3D|4DX|MX4D\s*3D|MX4D|ICE\s*3D|ICE|SCREEN\s*X|3D\s*SCREEN\s*X)\b', re.I)
+_BOOK_CLASS_RE = re.compile(r'book|ticket', re.I)
 
 
 def parse_release_date(date_str: str) -> Optional[datetime]:
@@ -133,7 +148,7 @@ async def extract_trailer_from_detail_page(page, detail_url: str, debug: bool =
 
         # First, try to find trailer on current page
         content = await page.content()
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, 'lxml')
 
         # Method 1: Try to click on movie poster/image to navigate to media gallery
         # BookMyShow often has trailers accessible through the poster image
@@ -173,7 +188,7 @@ async def extract_trailer_from_detail_page(page, detail_url: str, debug: bool =
             # After clicking, check for trailers in modal or new page
             if clicked:
                 content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
+                soup = BeautifulSoup(content, 'lxml')
 
         except Exception as e:
             if debug:
@@ -185,7 +200,7 @@ async def extract_trailer_from_detail_page(page, detail_url: str, debug: bool =
             src = iframe.get('src', '')
             if 'youtube.com/embed/' in src or 'youtube-nocookie.com/embed/' in src:
                 # Extract video ID
-                match = re.search(r'/embed/([a-zA-Z0-9_-]+)', src)
+                match = _YOUTUBE_EMBED_RE.search(src)
                 if match:
                     video_id = match.group(1)
                     youtube_url = f'https://www.youtube.com/watch?v={video_id}'
@@ -194,7 +209,7 @@ async def extract_trailer_from_detail_page(page, detail_url: str, debug: bool =
                     return youtube_url
 
         # Method 3: Look for YouTube links in anchor tags
-        links = soup.find_all('a', href=re.compile(r'youtube\.com/watch'))
+        links = soup.find_all('a', href=_YOUTUBE_WATCH_RE)
         for link in links:
             href = link.get('href', '')
             if 'youtube.com/watch' in href:
@@ -203,12 +218,12 @@ async def extract_trailer_from_detail_page(page, detail_url: str, debug: bool =
                 return href
 
         # Method 4: Look for trailer buttons/links and try clicking them
-        trailer_elements = soup.find_all(['a', 'button', 'div'], class_=re.compile(r'trailer|video', re.I))
+        trailer_elements = soup.find_all(['a', 'button', 'div'], class_=_TRAILER_CLASS_RE)
         for elem in trailer_elements:
             # Check onclick or data attributes
             onclick = elem.get('onclick', '')
             if 'youtube.com' in onclick:
-                match = re.search(r'youtube\.com/watch\?v=([a-zA-Z0-9_-]+)', onclick)
+                match = _YOUTUBE_WATCH_ID_RE.search(onclick)
                 if match:
                     video_id = match.group(1)
                     youtube_url = f'https://www.youtube.com/watch?v={video_id}'
@@ -249,13 +264,13 @@ async def extract_trailer_from_detail_page(page, detail_url: str, debug: bool =
 
                             # Check for YouTube iframe again after clicking
                             content = await page.content()
-                            soup = BeautifulSoup(content, 'html.parser')
+                            soup = BeautifulSoup(content, 'lxml')
 
                             iframes = soup.find_all('iframe')
                             for iframe in iframes:
                                 src = iframe.get('src', '')
                                 if 'youtube.com/embed/' in src or 'youtube-nocookie.com/embed/' in src:
-                                    match = re.search(r'/embed/([a-zA-Z0-9_-]+)', src)
+                                    match = _YOUTUBE_EMBED_RE.search(src)
                                     if match:
                                         video_id = match.group(1)
                                         youtube_url = f'https://www.youtube.com/watch?v={video_id}'
@@ -271,8 +286,7 @@ async def extract_trailer_from_detail_page(page, detail_url: str, debug: bool =
 
         # Method 6: Search page content for YouTube URLs
         page_text = str(soup)
-        youtube_pattern = r'(?:youtube\.com/watch\?v=|youtube\.com/embed/|youtu\.be/)([a-zA-Z0-9_-]{11})'
-        matches = re.findall(youtube_pattern, page_text)
+        matches = _YOUTUBE_ANY_ID_RE.findall(page_text)
         if matches:
             video_id = matches[0]
             youtube_url = f'https://www.youtube.com/watch?v={video_id}'
@@ -324,39 +338,39 @@ async def extract_movie_details(page, movie_url: str, debug: bool = False) -> Di
             pass
 
         content = await page.content()
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, 'lxml')
 
         # Extract title
-        title_elem = soup.find('h1') or soup.find(['h1', 'h2'], class_=re.compile(r'title|name', re.I))
+        title_elem = soup.find('h1') or soup.find(['h1', 'h2'], class_=_TITLE_CLASS_RE)
         if title_elem:
             details['title'] = title_elem.get_text(strip=True)
 
         # Extract metadata
-        info_elements = soup.find_all(['span', 'div', 'p'], class_=re.compile(r'info|meta|detail', re.I))
+        info_elements = soup.find_all(['span', 'div', 'p'], class_=_INFO_CLASS_RE)
 
         for elem in info_elements:
             text = elem.get_text(strip=True)
 
             # Duration
-            duration_match = re.search(r'(\d+h\s*\d*m?|\d+\s*mins?)', text, re.I)
+            duration_match = _DURATION_RE.search(text)
             if duration_match and 'duration' not in details:
                 details['duration'] = duration_match.group(1)
 
             # CBFC Rating
-            cbfc_match = re.search(r'\b(U/A|UA|U|A)\b', text)
+            cbfc_match = _CBFC_RE.search(text)
             if cbfc_match and 'cbfc_rating' not in details:
                 details['cbfc_rating'] = cbfc_match.group(1)
 
             # Release date
-            date_match = re.search(r'(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})', text, re.I)
+            date_match = _RELEASE_DATE_RE.search(text)
             if date_match and 'release_date' not in details:
                 details['release_date'] = date_match.group(1)
 
         # Extract video formats
-        format_elements = soup.find_all(['button', 'span', 'div', 'a'], class_=re.compile(r'format|dimension|experience', re.I))
+        format_elements = soup.find_all(['button', 'span', 'div', 'a'], class_=_FORMAT_CLASS_RE)
 
         formats = []
-        format_pattern = re.compile(r'\b(2D|3D|IMAX\s*3D|IMAX\s*2D|IMAX|DOLBY\s*CINEMA\s*3D|DOLBY\s*CINEMA|DOLBY\s*ATMOS|4DX\s*3D|4DX|MX4D\s*3D|MX4D|ICE\s*3D|ICE|SCREEN\s*X|3D\s*SCREEN\s*X)\b', re.I)
+        format_pattern = _FORMAT_RE
 
         for elem in format_elements:
             text = elem.get_text(strip=True)
@@ -378,7 +392,7 @@ async def extract_movie_details(page, movie_url: str, debug: bool = False) -> Di
             details['video_formats'] = formats
 
         # Extract booking link
-        book_button = soup.find(['a', 'button'], class_=re.compile(r'book|ticket', re.I))
+        book_button = soup.find(['a', 'button'], class_=_BOOK_CLASS_RE)
         if book_button:
             href = book_button.get('href', '')
             if href:
@@ -519,7 +533,7 @@ async def scrape_theatre_upcoming(city: str = 'bengaluru', debug: bool = False)
 
             print("Extracting movie list...", file=sys.stderr)
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml')
 
             # Find movie links
             movie_links = []
@@ -554,8 +568,9 @@ async def scrape_theatre_upcoming(city: str = 'bengaluru', debug: bool = False)
 
             # Extract details from each movie
             filtered_count = 0
+            total = len(movie_links)
             for idx, movie_url in enumerate(movie_links, 1):
-                print(f"\n[{idx}/{len(movie_links)}] Processing movie...", file=sys.stderr)
+                print(f"\n[{idx}/{total}] Processing movie...", file=sys.stderr)
 
                 details = await extract_movie_details(page, movie_url, debug=debug)
 
@@ -613,13 +628,16 @@ def main():
     print("="*60, file=sys.stderr)
 
     if movies:
+        # Serialize once; the same JSON goes to stdout and to the file
+        payload = dumps_json(movies)
+
         # Output JSON to stdout
-        print(json.dumps(movies, indent=2, ensure_ascii=False))
+        print(payload.decode('utf-8'))
 
         # Save to file
         output_file = f'theatre_upcoming_{args.city}.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(movies, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(payload)
 
         print(f"\nData saved to {output_file}", file=sys.stderr)
         print(f"Total movies: {len(movies)}", file=sys.stderr)
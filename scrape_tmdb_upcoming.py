@@ -5,7 +5,7 @@ Fetches upcoming movies and TV shows from TMDB API with streaming platform infor
 Uses TMDB's discover endpoints and watch providers for accurate, comprehensive data
 """
 
-import json
+import asyncio
 import os
 import sys
 import argparse
@@ -17,11 +17,16 @@ from typing import List, Dict, Optional
 # Check required packages
 try:
     import requests
-except ImportError:
-    print("❌ Missing required package: requests")
-    print("\n💡 Install: pip3 install requests")
+    import aiohttp
+except ImportError as e:
+    print(f"❌ Missing required package: {e.name}")
+    print("\n💡 Install: pip3 install requests aiohttp")
     sys.exit(1)
 
+from config import BACKDROP_SIZES, POSTER_SIZES, tmdb_image_urls
+from json_io import save_json
+from tmdb_client import TMDBClient, is_rate_limited
+
 
 class TMDBUpcomingScraper:
     """Scraper for upcoming movies and TV shows using TMDB API"""
@@ -39,6 +44,9 @@ class TMDBUpcomingScraper:
         # Add more as needed
     }
 
+    # Watch-provider lookups queued at once; the TMDB client paces the actual requests
+    PROVIDER_CONCURRENCY = 8
+
     def __init__(self, days_ahead=60, include_theatrical=True, include_streaming=True):
         """
         Initialize scraper
@@ -69,11 +77,17 @@ class TMDBUpcomingScraper:
         self.movies = []
         self.tv_shows = []
 
+        # Rate-limited TMDB requests over one pooled aiohttp session (opened while fetching watch providers)
+        self.tmdb = TMDBClient(self.tmdb_api_key)
+
+        # One keep-alive session for every TMDB call (no new TLS handshake per page)
+        self.session = requests.Session()
+
     def _fetch_with_retry(self, url, params, max_retries=3):
         """Fetch URL with retry logic"""
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, params=params, timeout=15)
+                response = self.session.get(url, params=params, timeout=15)
                 response.raise_for_status()
                 return response.json()
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
@@ -85,13 +99,13 @@ class TMDBUpcomingScraper:
             except Exception:
                 raise
 
-    def _get_watch_providers(self, item_id: int, media_type: str) -> List[str]:
+    async def _get_watch_providers(self, item_id: int, media_type: str) -> List[str]:
         """Get streaming platforms for a movie/TV show in India"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{item_id}/watch/providers"
             params = {'api_key': self.tmdb_api_key}
 
-            data = self._fetch_with_retry(url, params)
+            data = await self.tmdb.fetch(url, params)
 
             # Get India-specific providers
             india_providers = data.get('results', {}).get('IN', {})
@@ -109,6 +123,8 @@ class TMDBUpcomingScraper:
             return platforms
 
         except Exception as e:
+            if is_rate_limited(e):
+                raise
             return []
 
     def discover_movies(self):
@@ -208,17 +224,21 @@ class TMDBUpcomingScraper:
         print(f"FETCHING STREAMING PLATFORMS FOR {media_type.upper()}")
         print("="*70 + "\n")
 
+        # Look up every item's watch providers concurrently, then build the output in order
+        all_platforms = asyncio.run(self._fetch_all_providers(items, media_type))
+
         enriched_items = []
+        failed = 0
+
+        for item, platforms in zip(items, all_platforms):
+            # Lookup failed (e.g. still rate-limited): leave it out rather than guess "theatrical only"
+            if platforms is None:
+                failed += 1
+                continue
 
-        for i, item in enumerate(items, 1):
             item_id = item['id']
             title = item.get('title') or item.get('name', 'Unknown')
 
-            print(f"[{i}/{len(items)}] {title[:50]}... ", end='', flush=True)
-
-            # Get watch providers
-            platforms = self._get_watch_providers(item_id, media_type)
-
             # Only include if has streaming platform OR if include_theatrical is True
             if platforms or self.include_theatrical:
                 # Build structured data
@@ -241,46 +261,62 @@ class TMDBUpcomingScraper:
                 # Add posters
                 if item.get('poster_path'):
                     poster_path = item['poster_path']
-                    enriched_item['posters'] = {
-                        'thumbnail': f"https://image.tmdb.org/t/p/w92{poster_path}",
-                        'small': f"https://image.tmdb.org/t/p/w185{poster_path}",
-                        'medium': f"https://image.tmdb.org/t/p/w342{poster_path}",
-                        'large': f"https://image.tmdb.org/t/p/w500{poster_path}",
-                        'xlarge': f"https://image.tmdb.org/t/p/w780{poster_path}",
-                        'original': f"https://image.tmdb.org/t/p/original{poster_path}"
-                    }
+                    enriched_item['posters'] = tmdb_image_urls(poster_path, POSTER_SIZES)
                     enriched_item['poster_url_medium'] = enriched_item['posters']['medium']
                     enriched_item['poster_url_large'] = enriched_item['posters']['large']
 
                 # Add backdrops
                 if item.get('backdrop_path'):
                     backdrop_path = item['backdrop_path']
-                    enriched_item['backdrops'] = {
-                        'small': f"https://image.tmdb.org/t/p/w300{backdrop_path}",
-                        'medium': f"https://image.tmdb.org/t/p/w780{backdrop_path}",
-                        'large': f"https://image.tmdb.org/t/p/w1280{backdrop_path}",
-                        'original': f"https://image.tmdb.org/t/p/original{backdrop_path}"
-                    }
+                    enriched_item['backdrops'] = tmdb_image_urls(backdrop_path, BACKDROP_SIZES)
                     enriched_item['backdrop_url'] = enriched_item['backdrops']['original']
 
                 enriched_items.append(enriched_item)
 
-                if platforms:
-                    print(f"✓ {len(platforms)} platform(s): {', '.join(platforms[:2])}")
-                else:
-                    print(f"⊙ Theatrical only")
-            else:
-                print(f"✗ No streaming platforms")
-
-            time.sleep(0.25)  # Rate limiting
-
         print(f"\n✅ Enriched {len(enriched_items)} items with platform info")
+        if failed:
+            print(f"⚠️  Skipped {failed} items whose watch providers could not be fetched")
         return enriched_items
 
+    async def _fetch_all_providers(self, items: List[Dict], media_type: str) -> List[Optional[List[str]]]:
+        """Fetch watch providers for every item over one pooled, rate-limited session (None where it failed)"""
+        total = len(items)
+        semaphore = asyncio.Semaphore(self.PROVIDER_CONCURRENCY)
+
+        # The client closes its session (and drops it) on the way out, even if a lookup raised
+        async with self.tmdb:
+            results = await asyncio.gather(*(
+                self._get_watch_providers_bounded(semaphore, i, total, item, media_type)
+                for i, item in enumerate(items, 1)
+            ))
+
+        return results
+
+    async def _get_watch_providers_bounded(self, semaphore, index: int, total: int,
+                                           item: Dict, media_type: str) -> Optional[List[str]]:
+        """Fetch one item's providers under the concurrency limit and print its status line"""
+        title = item.get('title') or item.get('name', 'Unknown')
+
+        async with semaphore:
+            try:
+                platforms = await self._get_watch_providers(item['id'], media_type)
+            except Exception as e:
+                print(f"[{index}/{total}] {title[:50]}... ✗ Error: {str(e)[:40]}")
+                return None
+
+        if platforms:
+            status = f"✓ {len(platforms)} platform(s): {', '.join(platforms[:2])}"
+        elif self.include_theatrical:
+            status = "⊙ Theatrical only"
+        else:
+            status = "✗ No streaming platforms"
+
+        print(f"[{index}/{total}] {title[:50]}... {status}")
+        return platforms
+
     def save_json(self, data, filename):
         """Save data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        save_json(data, filename)
         print(f"💾 Saved: {filename}")
 
     def run(self):
@@ -6,11 +6,12 @@ Released: Start of month → Today
 Upcoming: Tomorrow → End of month
 """
 
-import json
 from datetime import datetime, timedelta
 from dateutil import parser
 import calendar
 
+from json_io import load_json, save_json
+
 
 def parse_date(date_string):
     """Parse various date formats"""
@@ -28,8 +29,7 @@ def split_by_date():
     """Split ottplay data into released and upcoming"""
 
     # Load the transformed data
-    with open('ottplay_releases.json', 'r', encoding='utf-8') as f:
-        all_items = json.load(f)
+    all_items = load_json('ottplay_releases.json')
 
     print(f"✓ Loaded {len(all_items)} items from ottplay_releases.json")
 
@@ -102,13 +102,11 @@ def split_by_date():
     print(f"   • No date/TBA: {len(no_date_items)} items (added to upcoming)")
 
     # Save released items
-    with open('ottplay_releases.json', 'w', encoding='utf-8') as f:
-        json.dump(released_items, f, indent=2, ensure_ascii=False)
+    save_json(released_items, 'ottplay_releases.json')
     print(f"\n💾 Saved: ottplay_releases.json ({len(released_items)} items)")
 
     # Save upcoming items
-    with open('ottplay_upcoming.json', 'w', encoding='utf-8') as f:
-        json.dump(upcoming_items, f, indent=2, ensure_ascii=False)
+    save_json(upcoming_items, 'ottplay_upcoming.json')
     print(f"💾 Saved: ottplay_upcoming.json ({len(upcoming_items)} items)")
 
     # Show sample dates
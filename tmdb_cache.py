@@ -0,0 +1,81 @@
+"""
+On-disk cache of TMDB responses, shared by the enrichers
+Entries are {'fetched_at', 'data'} (plus any validators such as the ETag) keyed by request;
+each run loads the file once, and entries past the TTL are dropped when it is saved
+"""
+
+import hashlib
+import os
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from json_io import load_json, save_json
+
+
+class ResponseCache:
+    """TMDB responses persisted in one JSON file between runs"""
+
+    def __init__(self, filename: str, ttl: int, enabled: bool = True,
+                 ttl_for: Optional[Callable[[str, object], int]] = None):
+        self.filename = filename
+        self.ttl = ttl  # Longest an entry is kept; also the freshness window unless ttl_for says otherwise
+        self.ttl_for = ttl_for  # Optional (url, data) -> seconds for entries that go stale sooner
+        self.enabled = enabled
+        self.entries = {}
+        self.dirty = False
+
+    def __len__(self):
+        return len(self.entries)
+
+    def load(self) -> int:
+        """Read the cache file (empty if missing or unreadable); returns the entry count"""
+        if not self.enabled or not os.path.exists(self.filename):
+            return 0
+        try:
+            self.entries = load_json(self.filename)
+        except (OSError, ValueError):
+            self.entries = {}
+        return len(self.entries)
+
+    def save(self):
+        """Drop expired entries and write the file, only when something changed"""
+        if not self.enabled:
+            return
+        cutoff = time.time() - self.ttl
+        live = {key: entry for key, entry in self.entries.items() if entry.get('fetched_at', 0) >= cutoff}
+        if not self.dirty and len(live) == len(self.entries):
+            return
+        self.entries = live
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        save_json(live, self.filename, indent=False)
+        self.dirty = False
+
+    @staticmethod
+    def request_key(url: str, params: Dict) -> str:
+        """Cache key for a TMDB request (API key excluded)"""
+        query = '&'.join(f"{k}={v}" for k, v in sorted(params.items()) if k != 'api_key')
+        return hashlib.md5(f"{url}?{query}".encode()).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[Dict]:
+        """Entry stored under key, fresh or not"""
+        return self.entries.get(key) if self.enabled and key else None
+
+    def is_fresh(self, entry: Dict, url: str = '') -> bool:
+        """Whether an entry is still inside its freshness window"""
+        ttl = self.ttl_for(url, entry.get('data')) if self.ttl_for else self.ttl
+        return time.time() - entry.get('fetched_at', 0) < ttl
+
+    def lookup(self, url: str, params: Dict) -> Tuple[Optional[str], Optional[Dict], bool]:
+        """Cache key, stored entry and whether it is still fresh, for a TMDB request"""
+        if not self.enabled:
+            return None, None, False
+        key = self.request_key(url, params)
+        entry = self.entries.get(key)
+        return key, entry, bool(entry) and self.is_fresh(entry, url)
+
+    def store(self, key: Optional[str], data, **validators):
+        """Remember a response (validators such as etag are kept alongside it)"""
+        if not self.enabled or not key:
+            return
+        self.entries[key] = {'fetched_at': int(time.time()), **validators, 'data': data}
+        self.dirty = True
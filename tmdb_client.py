@@ -0,0 +1,187 @@
+"""
+Rate-limited TMDB requests shared by the enrichers
+One pooled aiohttp session; every request takes a token-bucket slot (TMDB allows roughly
+40 requests/second), runs under an AIMD cap on in-flight requests, and is retried after
+Retry-After on a 429 or with backoff on connection errors
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+import aiohttp
+
+from json_io import loads_json
+from tmdb_cache import ResponseCache
+
+
+class TokenBucket:
+    """Async token bucket limiting the request rate to a host"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Take one token, sleeping only when the bucket is empty"""
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.updated = time.monotonic()
+                self.tokens = 1
+            self.tokens -= 1
+
+    async def pause_until(self, reset_epoch):
+        """Hold back every caller until the server's rate-limit window resets"""
+        async with self.lock:
+            delay = reset_epoch - time.time()
+            if delay > 0:
+                await asyncio.sleep(min(delay, 10))
+            self.tokens = 0
+            self.updated = time.monotonic()
+
+
+class AdaptiveLimiter:
+    """AIMD cap on in-flight requests: grows by one after a window of successes, halves on overload"""
+
+    def __init__(self, initial, maximum, minimum=1):
+        self.limit = initial
+        self.maximum = maximum
+        self.minimum = minimum
+        self.in_flight = 0
+        self.successes = 0
+        self.condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def on_success(self):
+        """Additive increase: one more slot per `limit` consecutive successes"""
+        self.successes += 1
+        if self.successes >= self.limit and self.limit < self.maximum:
+            self.limit += 1
+            self.successes = 0
+
+    def on_overload(self):
+        """Multiplicative decrease on a 429 or timeout"""
+        self.limit = max(self.minimum, self.limit // 2)
+        self.successes = 0
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Whether an exception is TMDB still answering 429 after every retry"""
+    return isinstance(error, aiohttp.ClientResponseError) and error.status == 429
+
+
+class TMDBClient:
+    """TMDB fetches over one aiohttp session, rate limited and answered from a ResponseCache when fresh"""
+
+    # TMDB allows roughly 40 requests/second; back off harder once headers say we're close
+    RATE = 40
+    RATE_LOW_WATERMARK = 5
+    MAX_BACKOFF = 32
+
+    # In-flight requests start here and adapt (AIMD) up to the max as 429s allow
+    REQUESTS_INITIAL = 8
+    REQUESTS_MAX = 32
+
+    def __init__(self, api_key: str, cache: Optional[ResponseCache] = None):
+        self.api_key = api_key
+        self.cache = cache if cache is not None else ResponseCache('', 0, enabled=False)
+        self.http = None
+        self.rate_limiter = None
+        self.request_limiter = None
+
+    async def open(self):
+        """Open the pooled session and fresh rate limits"""
+        self.rate_limiter = TokenBucket(rate=self.RATE, burst=self.RATE)
+        self.request_limiter = AdaptiveLimiter(self.REQUESTS_INITIAL, self.REQUESTS_MAX)
+        connector = aiohttp.TCPConnector(limit_per_host=self.REQUESTS_MAX, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=15)
+        self.http = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def close(self):
+        """Close the pooled session"""
+        if self.http:
+            await self.http.close()
+            self.http = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def fetch(self, url: str, params: Optional[Dict] = None, max_retries: int = 3, use_cache: bool = True):
+        """GET a TMDB URL and parse the JSON, backing off when TMDB rate-limits us"""
+        params = {'api_key': self.api_key, **(params or {})}
+        cache_key, cached, fresh = self.cache.lookup(url, params) if use_cache else (None, None, False)
+        if fresh:
+            return cached['data']
+
+        # Stale entries are revalidated instead of re-downloaded
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        for attempt in range(max_retries):
+            await self.rate_limiter.acquire()
+            try:
+                # Only read the response while holding the limiter slot; any waiting happens after it is released
+                async with self.request_limiter, self.http.get(url, params=params, headers=headers) as response:
+                    rate_limited = response.status == 429
+                    retry_after = response.headers.get('Retry-After', '')
+                    remaining = response.headers.get('X-RateLimit-Remaining', '')
+                    reset = response.headers.get('X-RateLimit-Reset', '')
+                    if rate_limited:
+                        self.request_limiter.on_overload()
+                        if attempt == max_retries - 1:
+                            response.raise_for_status()
+                    else:
+                        response.raise_for_status()
+                        self.request_limiter.on_success()
+                        if response.status == 304 and cached:
+                            data = cached['data']
+                            self.cache.store(cache_key, data, etag=cached.get('etag'),
+                                             last_modified=cached.get('last_modified'))
+                        else:
+                            data = loads_json(await response.read())
+                            self.cache.store(cache_key, data, etag=response.headers.get('ETag'),
+                                             last_modified=response.headers.get('Last-Modified'))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                self.request_limiter.on_overload()
+                if attempt < max_retries - 1:
+                    await asyncio.sleep((attempt + 1) * 2)
+                    continue
+                elif cached:
+                    # TMDB unreachable: a stale answer beats none
+                    return cached['data']
+                else:
+                    raise
+
+            if rate_limited:
+                wait_time = int(retry_after) if retry_after.isdigit() else 2 ** attempt
+                await asyncio.sleep(min(wait_time, self.MAX_BACKOFF))
+                continue
+
+            # Nearly out of quota: hold every caller back until the window resets
+            if remaining.isdigit() and int(remaining) < self.RATE_LOW_WATERMARK and reset.isdigit():
+                await self.rate_limiter.pause_until(int(reset))
+            return data
@@ -6,16 +6,16 @@ Input: ottplay_complete_enriched.json (wrapped with metadata)
 Output: ottplay_releases.json (direct array like other data files)
 """
 
-import json
 from datetime import datetime
 
+from json_io import load_json, save_json
+
 
 def transform_ottplay_data():
     """Transform ottplay data to match the expected webpage format"""
 
     # Load the enriched ottplay data
-    with open('ottplay_complete_enriched.json', 'r', encoding='utf-8') as f:
-        ottplay_data = json.load(f)
+    ottplay_data = load_json('ottplay_complete_enriched.json')
 
     # Extract the content array
     content_items = ottplay_data.get('content', [])
@@ -151,8 +151,7 @@ def transform_ottplay_data():
     print(f"✓ Transformed {len(transformed_items)} items (skipped {len(content_items) - len(transformed_items)} without posters)")
 
     # Save the transformed data
-    with open('ottplay_releases.json', 'w', encoding='utf-8') as f:
-        json.dump(transformed_items, f, indent=2, ensure_ascii=False)
+    save_json(transformed_items, 'ottplay_releases.json')
 
     print(f"💾 Saved: ottplay_releases.json")
 
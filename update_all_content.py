@@ -12,7 +12,7 @@ Usage:
 """
 
 import asyncio
-import json
+import re
 import sys
 import os
 import argparse
@@ -26,12 +26,16 @@ from scrape_theatre_upcoming import scrape_theatre_upcoming
 
 # Import existing enrichment tools
 try:
-    from update_content import ContentUpdater
+    from update_content import TMDBContentUpdater
 except ImportError:
-    print("Warning: Could not import ContentUpdater. Some enrichment features may be limited.", file=sys.stderr)
-    ContentUpdater = None
+    print("Warning: Could not import TMDBContentUpdater. Some enrichment features may be limited.", file=sys.stderr)
+    TMDBContentUpdater = None
 
 from config import CONTENT_TYPES, BMS_CONFIG
+from json_io import save_json
+
+# YouTube video ID in a BookMyShow trailer URL
+_YOUTUBE_ID_RE = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]+)')
 
 
 class MasterContentOrchestrator:
@@ -80,9 +84,9 @@ class MasterContentOrchestrator:
             print("2. Scraping OTT Upcoming Releases")
             print("-"*70)
             try:
-                # Use existing ContentUpdater for upcoming OTT
-                if ContentUpdater:
-                    updater = ContentUpdater(max_pages=self.ott_pages)
+                # Use existing TMDBContentUpdater for upcoming OTT
+                if TMDBContentUpdater and os.environ.get('TMDB_API_KEY'):
+                    updater = TMDBContentUpdater(max_pages=self.ott_pages)
                     await updater.scrape_movies()
                     self.content['ott_upcoming'] = updater.movies
                     # Add content_type marker
@@ -90,8 +94,10 @@ class MasterContentOrchestrator:
                         movie['content_type'] = 'ott_upcoming'
                     print(f"✅ Scraped {len(self.content['ott_upcoming'])} upcoming OTT releases")
                     self._save_raw_data('ott_upcoming', 'ott_upcoming.json')
+                elif TMDBContentUpdater:
+                    print("⚠️  TMDB_API_KEY not set, skipping OTT upcoming", file=sys.stderr)
                 else:
-                    print("⚠️  ContentUpdater not available, skipping OTT upcoming", file=sys.stderr)
+                    print("⚠️  TMDBContentUpdater not available, skipping OTT upcoming", file=sys.stderr)
             except Exception as e:
                 print(f"❌ Error scraping OTT upcoming: {e}", file=sys.stderr)
 
@@ -130,7 +136,7 @@ class MasterContentOrchestrator:
         print("="*70)
         self._print_scraping_summary()
 
-    def enrich_all(self):
+    async def enrich_all(self):
         """Enrich all content types with TMDB, IMDb, YouTube data"""
         print("\n" + "="*70)
         print("MASTER CONTENT ENRICHER - Enriching All Content")
@@ -142,14 +148,14 @@ class MasterContentOrchestrator:
                 print(f"\n{'='*70}")
                 print(f"Enriching: {CONTENT_TYPES[content_type]['name']}")
                 print(f"{'='*70}")
-                self._enrich_content_type(content_type)
+                await self._enrich_content_type(content_type)
 
         print("\n" + "="*70)
         print("ENRICHMENT COMPLETE")
         print("="*70)
         self._print_enrichment_summary()
 
-    def _enrich_content_type(self, content_type: str):
+    async def _enrich_content_type(self, content_type: str):
         """Enrich a specific content type"""
         items = self.content[content_type]
 
@@ -159,39 +165,23 @@ class MasterContentOrchestrator:
 
         print(f"📋 Enriching {len(items)} items...\n")
 
-        if ContentUpdater:
-            # Use existing ContentUpdater enrichment methods
-            updater = ContentUpdater(
-                enable_posters=True,
-                enable_trailers=True,
-                generate_placeholders=True
-            )
-
-            # Set the movies to enrich
-            updater.movies = items
-
-            # Step 1: TMDB Enrichment (all content types)
-            print("\n--- TMDB Enrichment ---")
-            updater.enrich_with_tmdb_complete()
-
-            # Step 2: IMDb Enrichment (fallback)
-            print("\n--- IMDb Enrichment ---")
-            updater.enrich_with_imdb_fallback()
-
-            # Step 3: YouTube Trailers
-            print("\n--- YouTube Trailer Enrichment ---")
-            if content_type.startswith('theatre'):
-                # For theatre content, prioritize BookMyShow trailers
-                self._enrich_theatre_trailers(updater.movies)
-            else:
-                # For OTT content, use standard YouTube search
-                updater.enrich_with_youtube_trailers()
-
-            # Update our content
-            self.content[content_type] = updater.movies
-
+        # For theatre content, prioritize BookMyShow trailers (TMDB only fills the gaps)
+        if content_type.startswith('theatre'):
+            print("\n--- BookMyShow Trailers ---")
+            self._enrich_theatre_trailers(items)
+
+        # TMDBContentUpdater exits the process without an API key, so check before building it
+        if TMDBContentUpdater and os.environ.get('TMDB_API_KEY'):
+            # One pass per movie: TMDB search → details + IMDb ID → posters → cast → trailer,
+            # with movies processed concurrently instead of three whole-list stages
+            print("\n--- TMDB / IMDb / Trailer Enrichment ---")
+            updater = TMDBContentUpdater(enable_trailers=True)
+            results = await updater.enrich_movies(items)
+            print(f"\n✅ Enriched {sum(results)}/{len(items)} items with TMDB data")
+        elif TMDBContentUpdater:
+            print("⚠️  TMDB_API_KEY not set, skipping TMDB enrichment", file=sys.stderr)
         else:
-            print("⚠️  ContentUpdater not available, enrichment limited", file=sys.stderr)
+            print("⚠️  TMDBContentUpdater not available, enrichment limited", file=sys.stderr)
 
         # Save enriched data
         output_file = CONTENT_TYPES[content_type]['output_file']
@@ -206,9 +196,10 @@ class MasterContentOrchestrator:
         print(f"🎬 Processing {len(movies)} theatre movies for trailers...")
 
         enriched_count = 0
+        total = len(movies)
         for i, movie in enumerate(movies, 1):
             title = movie.get('title', '')
-            print(f"[{i}/{len(movies)}] {title[:40]}... ", end='', flush=True)
+            print(f"[{i}/{total}] {title[:40]}... ", end='', flush=True)
 
             # Check if already has YouTube data
             if movie.get('youtube_id') or movie.get('youtube_url'):
@@ -221,8 +212,7 @@ class MasterContentOrchestrator:
                 bms_url = movie['trailer_bms_url']
 
                 # Extract YouTube ID from BookMyShow trailer URL
-                import re
-                match = re.search(r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]+)', bms_url)
+                match = _YOUTUBE_ID_RE.search(bms_url)
                 if match:
                     youtube_id = match.group(1)
                     movie['youtube_id'] = youtube_id
@@ -231,23 +221,19 @@ class MasterContentOrchestrator:
                     print(f"✓ From BookMyShow")
                     continue
 
-            # Fallback: YouTube search (would need ContentUpdater's method)
-            print("⊙ No trailer")
+            # Fallback: TMDB trailer lookup in the enrichment pass
+            print("⊙ No BookMyShow trailer")
 
         print(f"\n✅ Enriched {enriched_count}/{len(movies)} movies with trailers")
 
     def _save_raw_data(self, content_type: str, filename: str):
         """Save raw scraped data"""
-        data = self.content[content_type]
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        save_json(self.content[content_type], filename)
         print(f"💾 Saved raw data to {filename}", file=sys.stderr)
 
     def _save_enriched_data(self, content_type: str, filename: str):
         """Save enriched data"""
-        data = self.content[content_type]
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        save_json(self.content[content_type], filename)
         print(f"💾 Saved enriched data to {filename}")
 
     def _print_scraping_summary(self):
@@ -275,10 +261,16 @@ class MasterContentOrchestrator:
             name = CONTENT_TYPES[content_type]['name']
             count = len(items)
 
-            with_tmdb = sum(1 for m in items if m.get('tmdb_id'))
-            with_imdb = sum(1 for m in items if m.get('imdb_id'))
-            with_youtube = sum(1 for m in items if m.get('youtube_id'))
-            with_posters = sum(1 for m in items if m.get('poster_url_medium') or m.get('poster_url_large'))
+            # Count coverage in a single pass over the items
+            with_tmdb = with_imdb = with_youtube = with_posters = 0
+            with_deeplinks = with_formats = 0
+            for m in items:
+                if m.get('tmdb_id'): with_tmdb += 1
+                if m.get('imdb_id'): with_imdb += 1
+                if m.get('youtube_id'): with_youtube += 1
+                if m.get('poster_url_medium') or m.get('poster_url_large'): with_posters += 1
+                if m.get('deeplinks'): with_deeplinks += 1
+                if m.get('video_formats'): with_formats += 1
 
             print(f"\n{name} ({count} items):")
             print(f"  TMDB data:     {with_tmdb:>3}/{count} ({with_tmdb*100//count if count else 0}%)")
@@ -288,11 +280,9 @@ class MasterContentOrchestrator:
 
             # Additional stats for specific content types
             if content_type == 'ott_released':
-                with_deeplinks = sum(1 for m in items if m.get('deeplinks'))
                 print(f"  Deeplinks:     {with_deeplinks:>3}/{count} ({with_deeplinks*100//count if count else 0}%)")
 
             if content_type.startswith('theatre'):
-                with_formats = sum(1 for m in items if m.get('video_formats'))
                 print(f"  Video formats: {with_formats:>3}/{count} ({with_formats*100//count if count else 0}%)")
 
         print("\n" + "-" * 70)
@@ -352,7 +342,7 @@ async def main():
 
     # Phase 2: Enrichment
     if not args.skip_enrichment:
-        orchestrator.enrich_all()
+        await orchestrator.enrich_all()
     else:
         print("\n⏭️  Skipping enrichment phase")
 
@@ -4,40 +4,154 @@ Unified Content Update Script - TMDB-Focused
 Fetches comprehensive metadata from TMDB including all posters, backdrops, cast, genres, etc.
 
 Usage:
-    python3 update_content.py [--pages N] [--no-trailers] [--test]
+    python3 update_content.py [--pages N] [--no-trailers] [--test] [--no-cache] [--checkpoint] [--primary-images]
 """
 
 import asyncio
-import json
 import re
 import sys
 import os
 import time
 import argparse
+import importlib.util
 from typing import List, Dict, Optional
 from datetime import datetime
+from functools import lru_cache
 
-# Check required packages
+# Check required packages (playwright and bs4 are only imported where they are used,
+# so importing this module for its helpers doesn't pay for them)
+_missing_packages = [name for name in ('playwright', 'bs4') if importlib.util.find_spec(name) is None]
 try:
-    from playwright.async_api import async_playwright
-    from bs4 import BeautifulSoup
-    import requests
-except ImportError as e:
-    print(f"❌ Missing required package: {e}")
+    import aiohttp
+except ImportError:
+    _missing_packages.append('aiohttp')
+if _missing_packages:
+    print(f"❌ Missing required package: {', '.join(_missing_packages)}")
     print("\n💡 Install required packages:")
-    print("   pip3 install playwright beautifulsoup4 requests")
+    print("   pip3 install playwright beautifulsoup4 lxml aiohttp")
     print("   playwright install chromium")
     sys.exit(1)
 
+from config import (BACKDROP_SIZES, POSTER_SIZES, SEASON_SUFFIX_RE, clean_search_title,
+                    tmdb_image_url, tmdb_image_urls, usable_poster_url)
+from json_io import dumps_json, save_json
+from tmdb_cache import ResponseCache
+from tmdb_client import TMDBClient, is_rate_limited
+
+
+# Regexes used per movie / per platform image, compiled once
+_PLATFORM_IMG_RE = re.compile(r'/(\d+)\.(?:webp|png)')
+
+# Language slugs that appear in Binged URLs (e.g. ".../left-handed-girl-mandarin-movie-...")
+_URL_LANGUAGES = {
+    'hindi': 'Hindi', 'tamil': 'Tamil', 'telugu': 'Telugu',
+    'malayalam': 'Malayalam', 'kannada': 'Kannada', 'bengali': 'Bengali',
+    'marathi': 'Marathi', 'punjabi': 'Punjabi', 'gujarati': 'Gujarati',
+    'korean': 'Korean', 'japanese': 'Japanese', 'mandarin': 'Chinese',
+    'spanish': 'Spanish', 'french': 'French', 'german': 'German',
+    'italian': 'Italian', 'portuguese': 'Portuguese', 'russian': 'Russian'
+}
+_URL_LANGUAGE_RE = re.compile(r'[-/](' + '|'.join(_URL_LANGUAGES) + r')-', re.IGNORECASE)
+
+# ISO 639-1 codes TMDB reports as original_language, for the languages above
+_LANGUAGE_CODES = {
+    'Hindi': 'hi', 'Tamil': 'ta', 'Telugu': 'te', 'Malayalam': 'ml', 'Kannada': 'kn',
+    'Bengali': 'bn', 'Marathi': 'mr', 'Punjabi': 'pa', 'Gujarati': 'gu', 'Korean': 'ko',
+    'Japanese': 'ja', 'Chinese': 'zh', 'Spanish': 'es', 'French': 'fr', 'German': 'de',
+    'Italian': 'it', 'Portuguese': 'pt', 'Russian': 'ru'
+}
+
+
+@lru_cache(maxsize=4096)
+def _language_from_url(url):
+    """Memoized language lookup for a Binged URL"""
+    match = _URL_LANGUAGE_RE.search(url)
+    return _URL_LANGUAGES[match.group(1).lower()] if match else None
+
 
 class TMDBContentUpdater:
     """Content scraper with comprehensive TMDB enrichment"""
 
-    def __init__(self, max_pages=5, enable_trailers=True, test_mode=False):
+    # Extract the movie rows inside the page (header/preloader rows skipped), so the
+    # rendered DOM never has to be serialized and re-parsed in Python
+    MOVIE_ITEMS_JS = """
+        () => {
+            const firstText = el => {
+                const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+                for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                    const text = node.textContent.trim();
+                    if (text) return text;
+                }
+                return null;
+            };
+            return Array.from(document.querySelectorAll('.bng-movies-table-item'))
+                .filter(n => !n.querySelector('.bng-movies-table-item-th, .bng-movies-table-item-preloader'))
+                .map(n => {
+                    const link = n.querySelector('.bng-movies-table-item-title a');
+                    const date = n.querySelector('.bng-movies-table-date span');
+                    return {
+                        title: link ? firstText(link) : null,
+                        url: link ? link.getAttribute('href') : null,
+                        release_date: date ? date.textContent.trim() : null,
+                        platform_srcs: Array.from(
+                            n.querySelectorAll('.bng-movies-table-platform .streaming-item-platform img'),
+                            img => img.getAttribute('src') || ''
+                        )
+                    };
+                });
+        }
+    """
+
+    # The scraper only reads DOM attributes, so never download these
+    BLOCKED_RESOURCE_TYPES = {'image', 'font', 'stylesheet', 'media'}
+    # Third-party trackers whose scripts only burn renderer time
+    BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'connect.facebook.net')
+
+    # Detail link of the first movie row, used to detect when pagination has swapped rows
+    FIRST_ITEM_HREF_JS = """
+        () => document.querySelector('.bng-movies-table-item-title a')?.getAttribute('href') || null
+    """
+    PAGE_CHANGED_JS = """
+        prev => (document.querySelector('.bng-movies-table-item-title a')?.getAttribute('href') || null) !== prev
+    """
+
+    # Concurrent movies in flight during TMDB enrichment
+    TMDB_CONCURRENCY = 16
+
+    USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+    # Browser context settings for Binged (headless Chromium with the webdriver flag hidden)
+    VIEWPORT = {'width': 1920, 'height': 1080}
+    HIDE_WEBDRIVER_JS = """
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined
+        })
+    """
+
+    # Concurrent Binged detail-page requests for the poster fallback
+    BINGED_POSTER_CONCURRENCY = 4
+
+    # Poster images on a Binged detail page (alt match is case-insensitive)
+    POSTER_SELECTOR = (
+        'img.movie-poster, img.show-poster, .movie-image img, .show-image img, img[alt*="poster" i]'
+    )
+
+    # On-disk cache of TMDB responses (upcoming release data shifts, so entries expire)
+    CACHE_FILE = '.cache/tmdb_cache.json'
+    CACHE_TTL = 7 * 24 * 3600
+    CACHE_TTL_AIRING = 24 * 3600  # Series still in production gain episodes and air dates
+
+    def __init__(self, max_pages=5, enable_trailers=True, test_mode=False, use_cache=True, checkpoint=False,
+                 primary_images_only=False):
         self.max_pages = max_pages
         self.enable_trailers = enable_trailers
+        self.primary_images_only = primary_images_only  # Keep only the details' poster/backdrop, skipping /images
         self.test_mode = test_mode
+        self.use_cache = use_cache
+        self.checkpoint = checkpoint  # Also write movies.json and movies_enriched.jsonl as the run goes
         self.movies = []
+        self.cache = ResponseCache(self.CACHE_FILE, self.CACHE_TTL, enabled=use_cache, ttl_for=self._cache_ttl)
+        self._checkpoint_file = None
 
         # TMDB API (required)
         self.tmdb_api_key = os.environ.get('TMDB_API_KEY')
@@ -58,6 +172,10 @@ class TMDBContentUpdater:
         # YouTube API (optional)
         self.youtube_api_key = os.environ.get('YOUTUBE_API_KEY')
 
+        # Rate-limited TMDB client; its pooled aiohttp session is shared for the enrichment step
+        self.tmdb = TMDBClient(self.tmdb_api_key, self.cache)
+        self.http = None
+
         # Platform mapping (standardized with config.py)
         self.platform_map = {
             '4': 'Amazon Prime Video',
@@ -75,50 +193,40 @@ class TMDBContentUpdater:
             '74': 'Hoichoi'
         }
 
-    async def scrape_movies(self):
-        """Step 1: Scrape movies from Binged.com"""
+    async def scrape_movies(self, on_movie=None):
+        """
+        Step 1: Scrape movies from Binged.com
+        on_movie, if given, receives a copy of each row as soon as it is parsed
+        """
         print("\n" + "="*60)
         print("STEP 1: SCRAPING MOVIES FROM BINGED.COM")
         print("="*60 + "\n")
 
         url = "https://www.binged.com/streaming-premiere-dates/?mode=streaming-soon-month&platform[]=Aha%20Video&platform[]=Amazon&platform[]=Apple%20Tv%20Plus&platform[]=Jio%20Hotstar&platform[]=Manorama%20MAX&platform[]=Netflix&platform[]=Sony%20LIV&platform[]=Sun%20NXT&platform[]=Zee5"
 
+        from playwright.async_api import async_playwright
+
         async with async_playwright() as p:
             browser = await p.chromium.launch(
                 headless=True,
-                args=['--disable-blink-features=AutomationControlled']
+                args=['--disable-blink-features=AutomationControlled', '--blink-settings=imagesEnabled=false']
             )
 
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            )
+            context = await self._new_hardened_context(browser)
+            await context.route('**/*', self._block_heavy_resources)
 
             page = await context.new_page()
 
-            await page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                })
-            """)
-
             try:
                 print(f"📄 Loading initial page...")
                 await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-                await page.wait_for_selector('.bng-movies-table-item', timeout=15000)
-                await asyncio.sleep(3)
+                await page.wait_for_selector('.bng-movies-table-item-title a', state='attached', timeout=15000)
 
                 current_page = 1
 
                 # Scrape first page
                 print(f"Scraping page {current_page}...")
-                content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-
-                movie_items = soup.find_all('div', class_='bng-movies-table-item')
-                movie_items = [item for item in movie_items
-                               if not item.find('div', class_='bng-movies-table-item-th')
-                               and not item.find('div', class_='bng-movies-table-item-preloader')]
+                movie_items = await page.evaluate(self.MOVIE_ITEMS_JS)
 
                 print(f"  Found {len(movie_items)} entries")
 
@@ -126,6 +234,8 @@ class TMDBContentUpdater:
                     movie_data = self._parse_movie_item(item)
                     if movie_data and movie_data.get('title'):
                         self.movies.append(movie_data)
+                        if on_movie:
+                            on_movie(dict(movie_data))
 
                 # Paginate
                 for page_num in range(2, self.max_pages + 1):
@@ -136,24 +246,19 @@ class TMDBContentUpdater:
                             break
 
                         print(f"\n📄 Clicking to page {page_num}...")
+                        previous_href = await page.evaluate(self.FIRST_ITEM_HREF_JS)
                         await next_button.click()
 
+                        # Wait until the table actually shows different rows
                         try:
-                            await page.wait_for_load_state('domcontentloaded', timeout=15000)
-                            await asyncio.sleep(2)
+                            await page.wait_for_function(self.PAGE_CHANGED_JS, arg=previous_href, timeout=15000)
                         except:
-                            await asyncio.sleep(4)
+                            await asyncio.sleep(2)
 
                         current_page = page_num
                         print(f"Scraping page {current_page}...")
 
-                        content = await page.content()
-                        soup = BeautifulSoup(content, 'html.parser')
-
-                        movie_items = soup.find_all('div', class_='bng-movies-table-item')
-                        movie_items = [item for item in movie_items
-                                       if not item.find('div', class_='bng-movies-table-item-th')
-                                       and not item.find('div', class_='bng-movies-table-item-preloader')]
+                        movie_items = await page.evaluate(self.MOVIE_ITEMS_JS)
 
                         print(f"  Found {len(movie_items)} entries")
 
@@ -165,6 +270,8 @@ class TMDBContentUpdater:
                             movie_data = self._parse_movie_item(item)
                             if movie_data and movie_data.get('title'):
                                 self.movies.append(movie_data)
+                                if on_movie:
+                                    on_movie(dict(movie_data))
 
                     except Exception as e:
                         print(f"  ⚠️  Error on page {page_num}: {e}")
@@ -176,51 +283,49 @@ class TMDBContentUpdater:
             await browser.close()
 
         print(f"\n✅ Scraped {len(self.movies)} movies total")
-        self._save_json(self.movies, 'movies.json')
-
-    def _parse_movie_item(self, item) -> Optional[Dict]:
-        """Parse a single movie item from HTML"""
+        if self.checkpoint:
+            # Enrichment is still running on the loop; serialize a snapshot off-thread
+            await asyncio.to_thread(self._save_json, list(self.movies), 'movies.json')
+
+    async def _new_hardened_context(self, browser):
+        """New browser context with the desktop viewport/UA and the webdriver flag hidden on every page"""
+        context = await browser.new_context(viewport=self.VIEWPORT, user_agent=self.USER_AGENT)
+        await context.add_init_script(self.HIDE_WEBDRIVER_JS)
+        return context
+
+    async def _block_heavy_resources(self, route):
+        """Playwright route handler: abort images, fonts, stylesheets, media and trackers"""
+        request = route.request
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES or any(host in request.url for host in self.BLOCKED_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _parse_movie_item(self, item: Dict) -> Optional[Dict]:
+        """Normalize a movie row extracted in-page by MOVIE_ITEMS_JS"""
         movie_data = {}
 
         # Title
-        title_div = item.find('div', class_='bng-movies-table-item-title')
-        if title_div:
-            link = title_div.find('a')
-            if link:
-                title_text = link.get_text(separator='|', strip=True).split('|')[0].strip()
-                title_text = title_text.replace('\n', ' ').strip()
-                if title_text:
-                    movie_data['title'] = title_text
-                href = link.get('href', '')
-                if href:
-                    movie_data['url'] = href
+        title_text = (item.get('title') or '').replace('\n', ' ').strip()
+        if title_text:
+            movie_data['title'] = title_text
+        href = item.get('url') or ''
+        if href:
+            movie_data['url'] = href
 
         # Release date
-        date_div = item.find('div', class_='bng-movies-table-date')
-        if date_div:
-            date_span = date_div.find('span')
-            if date_span:
-                date_text = date_span.get_text(strip=True)
-                if date_text:
-                    movie_data['release_date'] = date_text
-
-        # Platforms
-        platform_div = item.find('div', class_='bng-movies-table-platform')
-        if platform_div:
-            platform_container = platform_div.find('div', class_='streaming-item-platform')
-            if platform_container:
-                platform_imgs = platform_container.find_all('img')
-                platforms = []
-                for img in platform_imgs:
-                    src = img.get('src', '')
-                    match = re.search(r'/(\d+)\.(webp|png)', src)
-                    if match:
-                        platform_id = match.group(1)
-                        platform_name = self.platform_map.get(platform_id, f'Platform {platform_id}')
-                        if platform_name not in platforms:
-                            platforms.append(platform_name)
-                if platforms:
-                    movie_data['platforms'] = platforms
+        date_text = item.get('release_date')
+        if date_text:
+            movie_data['release_date'] = date_text
+
+        # Platforms (one regex scan over all logo srcs; newlines keep matches per-src)
+        platform_ids = _PLATFORM_IMG_RE.findall('\n'.join(item.get('platform_srcs', [])))
+        platforms = list(dict.fromkeys(
+            self.platform_map.get(platform_id, f'Platform {platform_id}')
+            for platform_id in platform_ids
+        ))
+        if platforms:
+            movie_data['platforms'] = platforms
 
         return movie_data if movie_data.get('title') else None
 
@@ -229,58 +334,38 @@ class TMDBContentUpdater:
         if not url:
             return None
 
-        language_patterns = {
-            'hindi': 'Hindi', 'tamil': 'Tamil', 'telugu': 'Telugu',
-            'malayalam': 'Malayalam', 'kannada': 'Kannada', 'bengali': 'Bengali',
-            'marathi': 'Marathi', 'punjabi': 'Punjabi', 'gujarati': 'Gujarati',
-            'korean': 'Korean', 'japanese': 'Japanese', 'mandarin': 'Chinese',
-            'spanish': 'Spanish', 'french': 'French', 'german': 'German',
-            'italian': 'Italian', 'portuguese': 'Portuguese', 'russian': 'Russian'
-        }
-
-        url_lower = url.lower()
-        for pattern, language in language_patterns.items():
-            if f'-{pattern}-' in url_lower or f'/{pattern}-' in url_lower:
-                return language
-
-        return None
+        return _language_from_url(url)
 
     def _clean_title_for_search(self, title):
         """Clean up title for better search results"""
         if not title:
             return title
 
-        cleaned = title
-        cleaned = re.sub(r'\([^)]*\)', '', cleaned)  # Remove parentheses
-        cleaned = ' '.join(cleaned.split())  # Remove extra whitespace
-        cleaned = cleaned.strip(' -:')  # Remove trailing punctuation
+        return clean_search_title(title, strip_season=False)
 
-        return cleaned
+    def _load_cache(self):
+        """Load cached TMDB responses from disk"""
+        if self.cache.load():
+            print(f"📦 Loaded {len(self.cache)} cached TMDB responses")
 
-    def _fetch_with_retry(self, url, params, max_retries=3):
-        """Fetch URL with retry logic"""
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, params=params, timeout=15)
-                response.raise_for_status()
-                return response.json()
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-                if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise
-            except Exception:
-                raise
+    def _cache_ttl(self, url, data):
+        """How long a cached TMDB response stays fresh"""
+        if isinstance(data, dict) and data.get('in_production'):
+            return self.CACHE_TTL_AIRING
+        return self.CACHE_TTL
 
-    def _search_tmdb(self, movie: Dict) -> Optional[Dict]:
+    async def _fetch_with_retry(self, url, params, max_retries=3):
+        """Fetch a TMDB URL through the shared rate-limited client (cached, retried on 429s)"""
+        return await self.tmdb.fetch(url, params, max_retries=max_retries)
+
+    async def _search_tmdb(self, movie: Dict) -> Optional[Dict]:
         """Search TMDB with multiple strategies"""
         title = movie.get('title', '')
         url = movie.get('url', '')
 
         language = self._extract_language_from_url(url)
         clean_title = self._clean_title_for_search(title)
+        release_date = self._parse_release_date(movie.get('release_date'))
 
         # Try multiple search strategies
         search_queries = []
@@ -298,11 +383,14 @@ class TMDBContentUpdater:
 
         # Strategy 4: For TV shows, try without "Season X"
         if 'Season' in title:
-            base_title = re.sub(r'\s+Season\s+\d+.*', '', title, flags=re.IGNORECASE).strip()
+            base_title = SEASON_SUFFIX_RE.sub('', title).strip()
             search_queries.append(base_title)
             if language:
                 search_queries.append(f"{base_title} {language}")
 
+        # Strategies can collapse into the same (or an empty) query; send each distinct one once
+        search_queries = list(dict.fromkeys(query for query in search_queries if query))
+
         for query in search_queries:
             try:
                 url = "https://api.themoviedb.org/3/search/multi"
@@ -312,56 +400,67 @@ class TMDBContentUpdater:
                     'language': 'en-US'
                 }
 
-                data = self._fetch_with_retry(url, params)
+                data = await self._fetch_with_retry(url, params)
 
-                if data.get('results') and len(data['results']) > 0:
-                    return data['results'][0]
-            except:
+                match = self._best_search_match(data.get('results', []), language, release_date)
+                if match:
+                    return match
+            except Exception as e:
+                if is_rate_limited(e):
+                    raise
                 continue
 
         return None
 
-    async def _fetch_binged_poster(self, movie: Dict) -> Optional[str]:
-        """Fallback: Fetch poster from Binged.com content page"""
-        url = movie.get('url')
-        if not url:
+    def _best_search_match(self, results: List[Dict], language: Optional[str], release_date) -> Optional[Dict]:
+        """
+        Pick among multi-search results: people are skipped, and a title in the Binged
+        language or released within a year of the Binged date outranks TMDB's popularity order
+        """
+        candidates = [r for r in results if r.get('media_type') in ('movie', 'tv')]
+        if not candidates:
             return None
 
-        try:
-            from playwright.async_api import async_playwright
+        language_code = _LANGUAGE_CODES.get(language)
 
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+        def score(result):
+            same_language = bool(language_code) and result.get('original_language') == language_code
+            year = (result.get('release_date') or result.get('first_air_date') or '')[:4]
+            near_year = bool(release_date) and year.isdigit() and abs(int(year) - release_date.year) <= 1
+            return same_language + near_year
 
-                await page.goto(url, wait_until='domcontentloaded', timeout=15000)
-                await asyncio.sleep(1)
+        # max() keeps the first of equal scores, so ties stay in TMDB's order
+        return max(candidates, key=score)
 
-                content = await page.content()
-                await browser.close()
-
-                soup = BeautifulSoup(content, 'html.parser')
-
-                # Try multiple selectors for poster
-                poster_selectors = [
-                    'img.movie-poster', 'img.show-poster',
-                    '.movie-image img', '.show-image img',
-                    'img[alt*="poster"]', 'img[alt*="Poster"]'
-                ]
+    async def _fetch_binged_poster(self, movie: Dict) -> Optional[str]:
+        """Fallback: Fetch poster from Binged.com content page"""
+        url = movie.get('url')
+        if not url:
+            return None
 
-                for selector in poster_selectors:
-                    img = soup.select_one(selector)
-                    if img:
-                        poster_url = img.get('src') or img.get('data-src')
-                        if poster_url and poster_url.startswith('http'):
-                            return poster_url
+        from bs4 import BeautifulSoup
 
-                # Try og:image
-                og_image = soup.find('meta', property='og:image')
-                if og_image:
-                    poster_url = og_image.get('content')
-                    if poster_url and poster_url.startswith('http'):
-                        return poster_url
+        try:
+            # The poster <img> and og:image are server-rendered, so a plain GET is enough
+            async with self._binged_semaphore:
+                async with self.http.get(url, headers={'User-Agent': self.USER_AGENT}) as response:
+                    response.raise_for_status()
+                    content = await response.text()
+
+            soup = BeautifulSoup(content, 'lxml')
+
+            # All poster selectors in one tree walk
+            for img in soup.select(self.POSTER_SELECTOR):
+                poster_url = usable_poster_url(img.get('src') or img.get('data-src'))
+                if poster_url:
+                    return poster_url
+
+            # Try og:image
+            og_image = soup.find('meta', property='og:image')
+            if og_image:
+                poster_url = usable_poster_url(og_image.get('content'))
+                if poster_url:
+                    return poster_url
 
         except:
             pass
@@ -384,266 +483,276 @@ class TMDBContentUpdater:
         print("STEP 2: COMPREHENSIVE TMDB ENRICHMENT WITH FALLBACKS")
         print("="*60 + "\n")
 
-        enriched_count = 0
-
-        for i, movie in enumerate(self.movies, 1):
-            title = movie.get('title', '')
-
-            print(f"[{i}/{len(self.movies)}] {title[:50]}... ", end='', flush=True)
-
-            try:
-                # 2a. Search TMDB
-                tmdb_result = self._search_tmdb(movie)
-
-                if not tmdb_result:
-                    # Fallback: Try to get poster from Binged.com
-                    binged_poster = await self._fetch_binged_poster(movie)
-                    if binged_poster:
-                        movie['poster_url_medium'] = binged_poster
-                        movie['poster_url_large'] = binged_poster
-                        movie['posters'] = {
-                            'thumbnail': binged_poster,
-                            'small': binged_poster,
-                            'medium': binged_poster,
-                            'large': binged_poster,
-                            'xlarge': binged_poster,
-                            'original': binged_poster
-                        }
-                        print("⊙ Binged poster only")
-                    else:
-                        print("✗ Not found (no poster)")
-                    continue
-
-                tmdb_id = tmdb_result['id']
-                media_type = tmdb_result.get('media_type', 'movie')
-
-                # Store basic TMDB data
-                movie['tmdb_id'] = tmdb_id
-                movie['tmdb_media_type'] = media_type
-
-                # 2b. Get full details
-                details = self._get_tmdb_details(tmdb_id, media_type)
-                if details:
-                    # Overview/Description
-                    movie['overview'] = details.get('overview', '')
-                    movie['description'] = details.get('overview', '')  # Alias
-
-                    # Genres
-                    genres = details.get('genres', [])
-                    movie['genres'] = [g['name'] for g in genres]
-
-                    # Runtime (for movies)
-                    if media_type == 'movie':
-                        movie['runtime'] = details.get('runtime')
-
-                    # Episode runtime (for TV shows)
-                    if media_type == 'tv':
-                        movie['episode_runtime'] = details.get('episode_run_time', [])
-                        movie['number_of_seasons'] = details.get('number_of_seasons')
-                        movie['number_of_episodes'] = details.get('number_of_episodes')
-
-                    # Release info
-                    movie['tmdb_release_date'] = details.get('release_date') or details.get('first_air_date')
-                    movie['status'] = details.get('status')
-
-                    # Ratings
-                    movie['tmdb_rating'] = details.get('vote_average')
-                    movie['tmdb_vote_count'] = details.get('vote_count')
-
-                    # Original title and language
-                    movie['original_title'] = details.get('original_title') or details.get('original_name')
-                    movie['original_language'] = details.get('original_language')
-
-                # 2c. Get external IDs (IMDb)
-                external_ids = self._get_tmdb_external_ids(tmdb_id, media_type)
-                if external_ids:
-                    imdb_id = external_ids.get('imdb_id')
-                    if imdb_id:
-                        movie['imdb_id'] = imdb_id
-
-                # 2d. Get all posters (multiple sizes)
-                posters = self._get_tmdb_images(tmdb_id, media_type, 'posters')
-                if posters:
-                    movie['posters'] = {
-                        'thumbnail': f"https://image.tmdb.org/t/p/w92{posters[0]}",
-                        'small': f"https://image.tmdb.org/t/p/w185{posters[0]}",
-                        'medium': f"https://image.tmdb.org/t/p/w342{posters[0]}",
-                        'large': f"https://image.tmdb.org/t/p/w500{posters[0]}",
-                        'xlarge': f"https://image.tmdb.org/t/p/w780{posters[0]}",
-                        'original': f"https://image.tmdb.org/t/p/original{posters[0]}"
-                    }
-
-                    # Also store all available posters
-                    movie['all_posters'] = [
-                        {
-                            'thumbnail': f"https://image.tmdb.org/t/p/w92{p}",
-                            'small': f"https://image.tmdb.org/t/p/w185{p}",
-                            'medium': f"https://image.tmdb.org/t/p/w342{p}",
-                            'large': f"https://image.tmdb.org/t/p/w500{p}",
-                            'xlarge': f"https://image.tmdb.org/t/p/w780{p}",
-                            'original': f"https://image.tmdb.org/t/p/original{p}"
-                        }
-                        for p in posters[:5]  # Limit to top 5 posters
-                    ]
-
-                    # Legacy fields for backward compatibility
-                    movie['poster_url_medium'] = movie['posters']['medium']
-                    movie['poster_url_large'] = movie['posters']['large']
-                else:
-                    # Fallback: Try Binged.com if TMDB has no posters
-                    binged_poster = await self._fetch_binged_poster(movie)
-                    if binged_poster:
-                        movie['poster_url_medium'] = binged_poster
-                        movie['poster_url_large'] = binged_poster
-                        movie['posters'] = {
-                            'thumbnail': binged_poster,
-                            'small': binged_poster,
-                            'medium': binged_poster,
-                            'large': binged_poster,
-                            'xlarge': binged_poster,
-                            'original': binged_poster
-                        }
-                        movie['poster_source'] = 'binged'
-
-                # 2e. Get all backdrops
-                backdrops = self._get_tmdb_images(tmdb_id, media_type, 'backdrops')
-                if backdrops:
-                    movie['backdrops'] = {
-                        'small': f"https://image.tmdb.org/t/p/w300{backdrops[0]}",
-                        'medium': f"https://image.tmdb.org/t/p/w780{backdrops[0]}",
-                        'large': f"https://image.tmdb.org/t/p/w1280{backdrops[0]}",
-                        'original': f"https://image.tmdb.org/t/p/original{backdrops[0]}"
-                    }
-
-                    # All available backdrops
-                    movie['all_backdrops'] = [
-                        {
-                            'small': f"https://image.tmdb.org/t/p/w300{b}",
-                            'medium': f"https://image.tmdb.org/t/p/w780{b}",
-                            'large': f"https://image.tmdb.org/t/p/w1280{b}",
-                            'original': f"https://image.tmdb.org/t/p/original{b}"
-                        }
-                        for b in backdrops[:5]  # Limit to top 5
-                    ]
-
-                    # Legacy field
-                    movie['backdrop_url'] = movie['backdrops']['original']
-
-                # 2f. Get cast and crew
-                credits = self._get_tmdb_credits(tmdb_id, media_type)
-                if credits:
-                    cast = credits.get('cast', [])
-                    crew = credits.get('crew', [])
-
-                    # Top cast members
-                    movie['cast'] = [
-                        {
-                            'name': c['name'],
-                            'character': c.get('character', ''),
-                            'profile_path': f"https://image.tmdb.org/t/p/w185{c['profile_path']}" if c.get('profile_path') else None
-                        }
-                        for c in cast[:10]  # Top 10 cast
-                    ]
-
-                    # Directors
-                    directors = [c['name'] for c in crew if c.get('job') == 'Director']
-                    movie['directors'] = directors
-
-                    # Writers
-                    writers = [c['name'] for c in crew if c.get('job') in ['Writer', 'Screenplay']]
-                    movie['writers'] = writers[:5]  # Top 5
-
-                # 2g. Get videos (trailers from TMDB)
-                videos = self._get_tmdb_videos(tmdb_id, media_type)
-                if videos:
-                    trailers = [v for v in videos if v.get('type') == 'Trailer' and v.get('site') == 'YouTube']
-                    if trailers:
-                        # Use official trailer
-                        official_trailer = next((t for t in trailers if t.get('official')), trailers[0])
-                        movie['youtube_id'] = official_trailer['key']
-                        movie['youtube_url'] = f"https://www.youtube.com/watch?v={official_trailer['key']}"
-                        movie['youtube_title'] = official_trailer.get('name', '')
-
-                enriched_count += 1
-                print(f"✓ Complete")
-
-                time.sleep(0.25)  # Rate limiting
+        results = await self.enrich_movies(self.movies)
+        self._report_enrichment(results)
 
-            except Exception as e:
-                print(f"✗ Error: {str(e)[:40]}")
+    async def enrich_movies(self, movies: List[Dict]) -> List[bool]:
+        """Run the single per-movie pipeline (search, details + IMDb ID, images, credits, trailer)"""
+        await self._start_enrichment()
+        try:
+            for movie in movies:
+                self._schedule_enrichment(movie, total=len(movies))
+        finally:
+            results = await self._finish_enrichment()
+
+        return results
+
+    async def _start_enrichment(self):
+        """Open the shared HTTP session, cache and limits used while enriching"""
+        self._load_cache()
+        self._tmdb_semaphore = asyncio.Semaphore(self.TMDB_CONCURRENCY)
+        self._binged_semaphore = asyncio.Semaphore(self.BINGED_POSTER_CONCURRENCY)
+        self._enrich_tasks = []
+
+        await self.tmdb.open()
+        self.http = self.tmdb.http
+
+        if self.checkpoint:
+            # One JSON line per movie as soon as it is enriched, so a crash keeps the progress
+            self._checkpoint_file = open('movies_enriched.jsonl', 'wb')
+
+    def _schedule_enrichment(self, movie: Dict, total: Optional[int] = None):
+        """Start enriching a movie in the background"""
+        index = len(self._enrich_tasks) + 1
+        self._enrich_tasks.append(asyncio.create_task(
+            self._enrich_movie_bounded(self._tmdb_semaphore, index, total, movie)
+        ))
+
+    async def _finish_enrichment(self) -> List[bool]:
+        """Wait for scheduled enrichment, then close the session and persist the cache"""
+        try:
+            return await asyncio.gather(*self._enrich_tasks)
+        finally:
+            await self.tmdb.close()
+            self.http = None
+            self.cache.save()
+            if self._checkpoint_file:
+                self._checkpoint_file.close()
+                self._checkpoint_file = None
+
+    def _report_enrichment(self, results: List[bool]):
+        """Print the enrichment tally and save the final JSON"""
+        enriched_count = sum(results)
 
         print(f"\n✅ Enriched {enriched_count}/{len(self.movies)} movies with comprehensive TMDB data")
         self._save_json(self.movies, 'movies_enriched.json')
 
-    def _get_tmdb_details(self, tmdb_id: int, media_type: str) -> Optional[Dict]:
-        """Get full movie/show details from TMDB"""
+    async def _enrich_movie_bounded(self, semaphore, index: int, total: Optional[int], movie: Dict) -> bool:
+        """Enrich one movie under the concurrency limit and print its status line"""
+        async with semaphore:
+            try:
+                enriched, status = await self._enrich_movie(movie)
+            except Exception as e:
+                enriched, status = False, f"✗ Error: {str(e)[:40]}"
+
+        position = f"{index}/{total}" if total else f"{index}"
+        print(f"[{position}] {movie.get('title', '')[:50]}... {status}")
+        if self._checkpoint_file:
+            self._write_checkpoint_line(movie)
+        return enriched
+
+    def _write_checkpoint_line(self, movie: Dict):
+        """Append one enriched movie to the JSONL checkpoint"""
+        self._checkpoint_file.write(dumps_json(movie, indent=False) + b'\n')
+        self._checkpoint_file.flush()
+
+    async def _enrich_movie(self, movie: Dict):
+        """Enrich a single movie with TMDB data; returns (enriched, status)"""
+        # Posters the scrapers already found (theatre/OTT) are kept; TMDB and Binged only fill the gap
+        has_poster = bool(movie.get('posters'))
+
+        # 2a. Search TMDB
+        tmdb_result = await self._search_tmdb(movie)
+
+        if not tmdb_result:
+            if has_poster:
+                return False, "✗ Not found (kept existing poster)"
+
+            # Fallback: Try to get poster from Binged.com
+            binged_poster = await self._fetch_binged_poster(movie)
+            if binged_poster:
+                movie['poster_url_medium'] = binged_poster
+                movie['poster_url_large'] = binged_poster
+                movie['posters'] = {
+                    'thumbnail': binged_poster,
+                    'small': binged_poster,
+                    'medium': binged_poster,
+                    'large': binged_poster,
+                    'xlarge': binged_poster,
+                    'original': binged_poster
+                }
+                return False, "⊙ Binged poster only"
+            return False, "✗ Not found (no poster)"
+
+        tmdb_id = tmdb_result['id']
+        media_type = tmdb_result.get('media_type', 'movie')
+
+        # Store basic TMDB data
+        movie['tmdb_id'] = tmdb_id
+        movie['tmdb_media_type'] = media_type
+
+        # 2b. Get full details (with IDs, credits and videos appended) and images
+        want_videos = self.enable_trailers and not movie.get('youtube_id')
+        append = ['external_ids', 'credits'] + (['videos'] if want_videos else [])
+        if self.primary_images_only:
+            # The primary poster/backdrop come with the details; /images only when there is no poster
+            details = await self._get_tmdb_details(tmdb_id, media_type, append) or {}
+            images = self._primary_images(details)
+            if not images['posters'] and not has_poster:
+                images = await self._get_tmdb_images(tmdb_id, media_type)
+        else:
+            details, images = await asyncio.gather(
+                self._get_tmdb_details(tmdb_id, media_type, append),
+                self._get_tmdb_images(tmdb_id, media_type)
+            )
+            details = details or {}
+        if details:
+            # Overview/Description
+            movie['overview'] = details.get('overview', '')
+            movie['description'] = details.get('overview', '')  # Alias
+
+            # Genres
+            genres = details.get('genres', [])
+            movie['genres'] = [g['name'] for g in genres]
+
+            # Runtime (for movies)
+            if media_type == 'movie':
+                movie['runtime'] = details.get('runtime')
+
+            # Episode runtime (for TV shows)
+            if media_type == 'tv':
+                movie['episode_runtime'] = details.get('episode_run_time', [])
+                movie['number_of_seasons'] = details.get('number_of_seasons')
+                movie['number_of_episodes'] = details.get('number_of_episodes')
+
+            # Release info
+            movie['tmdb_release_date'] = details.get('release_date') or details.get('first_air_date')
+            movie['status'] = details.get('status')
+
+            # Ratings
+            movie['tmdb_rating'] = details.get('vote_average')
+            movie['tmdb_vote_count'] = details.get('vote_count')
+
+            # Original title and language
+            movie['original_title'] = details.get('original_title') or details.get('original_name')
+            movie['original_language'] = details.get('original_language')
+
+        # 2c. External IDs (IMDb) - movie details carry imdb_id directly
+        imdb_id = details.get('imdb_id') or (details.get('external_ids') or {}).get('imdb_id')
+        if imdb_id:
+            movie['imdb_id'] = imdb_id
+
+        # 2d. All posters (multiple sizes), unless the movie already has one
+        posters = [] if has_poster else self._sorted_image_paths(images, 'posters')
+        if posters:
+            # Top 5 posters; the best one is also the primary set
+            movie['all_posters'] = [tmdb_image_urls(p, POSTER_SIZES) for p in posters[:5]]
+            movie['posters'] = dict(movie['all_posters'][0])
+
+            # Legacy fields for backward compatibility
+            movie['poster_url_medium'] = movie['posters']['medium']
+            movie['poster_url_large'] = movie['posters']['large']
+        elif not has_poster:
+            # Fallback: Try Binged.com if TMDB has no posters
+            binged_poster = await self._fetch_binged_poster(movie)
+            if binged_poster:
+                movie['poster_url_medium'] = binged_poster
+                movie['poster_url_large'] = binged_poster
+                movie['posters'] = {
+                    'thumbnail': binged_poster,
+                    'small': binged_poster,
+                    'medium': binged_poster,
+                    'large': binged_poster,
+                    'xlarge': binged_poster,
+                    'original': binged_poster
+                }
+                movie['poster_source'] = 'binged'
+
+        # 2e. All backdrops
+        backdrops = self._sorted_image_paths(images, 'backdrops')
+        if backdrops:
+            # Top 5 backdrops; the best one is also the primary set
+            movie['all_backdrops'] = [tmdb_image_urls(b, BACKDROP_SIZES) for b in backdrops[:5]]
+            movie['backdrops'] = dict(movie['all_backdrops'][0])
+
+            # Legacy field
+            movie['backdrop_url'] = movie['backdrops']['original']
+
+        # 2f. Cast and crew
+        credits = details.get('credits')
+        if credits:
+            cast = credits.get('cast', [])
+            crew = credits.get('crew', [])
+
+            # Top cast members
+            movie['cast'] = [
+                {
+                    'name': c['name'],
+                    'character': c.get('character', ''),
+                    'profile_path': tmdb_image_url(c['profile_path'], 'w185') if c.get('profile_path') else None
+                }
+                for c in cast[:10]  # Top 10 cast
+            ]
+
+            # Directors
+            directors = [c['name'] for c in crew if c.get('job') == 'Director']
+            movie['directors'] = directors
+
+            # Writers
+            writers = [c['name'] for c in crew if c.get('job') in ['Writer', 'Screenplay']]
+            movie['writers'] = writers[:5]  # Top 5
+
+        # 2g. Videos (trailers from TMDB)
+        videos = (details.get('videos') or {}).get('results', [])
+        if videos:
+            trailers = [v for v in videos if v.get('type') == 'Trailer' and v.get('site') == 'YouTube']
+            if trailers:
+                # Use official trailer
+                official_trailer = next((t for t in trailers if t.get('official')), trailers[0])
+                movie['youtube_id'] = official_trailer['key']
+                movie['youtube_url'] = f"https://www.youtube.com/watch?v={official_trailer['key']}"
+                movie['youtube_title'] = official_trailer.get('name', '')
+
+        return True, "✓ Complete"
+
+    async def _get_tmdb_details(self, tmdb_id: int, media_type: str, append: List[str] = ()) -> Optional[Dict]:
+        """Get full movie/show details from TMDB, with sub-resources appended to the same response"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}"
             params = {
                 'api_key': self.tmdb_api_key,
                 'language': 'en-US'
             }
-            return self._fetch_with_retry(url, params)
+            if append:
+                params['append_to_response'] = ','.join(append)
+            return await self._fetch_with_retry(url, params)
         except:
             return None
 
-    def _get_tmdb_external_ids(self, tmdb_id: int, media_type: str) -> Optional[Dict]:
-        """Get external IDs (IMDb, etc.) from TMDB"""
-        try:
-            url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/external_ids"
-            params = {'api_key': self.tmdb_api_key}
-            return self._fetch_with_retry(url, params)
-        except:
-            return None
-
-    def _get_tmdb_images(self, tmdb_id: int, media_type: str, image_type: str) -> List[str]:
-        """Get all images (posters or backdrops) from TMDB"""
+    async def _get_tmdb_images(self, tmdb_id: int, media_type: str) -> Dict:
+        """Get all images (posters and backdrops, every language) from TMDB"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/images"
             params = {'api_key': self.tmdb_api_key}
-
-            data = self._fetch_with_retry(url, params)
-
-            if image_type == 'posters':
-                images = data.get('posters', [])
-            else:
-                images = data.get('backdrops', [])
-
-            # Sort by vote average (quality)
-            images.sort(key=lambda x: x.get('vote_average', 0), reverse=True)
-
-            # Return file paths
-            return [img['file_path'] for img in images if img.get('file_path')]
-
+            return await self._fetch_with_retry(url, params) or {}
         except:
-            return []
+            return {}
 
-    def _get_tmdb_credits(self, tmdb_id: int, media_type: str) -> Optional[Dict]:
-        """Get cast and crew from TMDB"""
-        try:
-            url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/credits"
-            params = {'api_key': self.tmdb_api_key}
-            return self._fetch_with_retry(url, params)
-        except:
-            return None
+    def _primary_images(self, details: Dict) -> Dict:
+        """The primary poster/backdrop from a details response, shaped like an /images response"""
+        return {
+            'posters': [{'file_path': details['poster_path']}] if details.get('poster_path') else [],
+            'backdrops': [{'file_path': details['backdrop_path']}] if details.get('backdrop_path') else []
+        }
 
-    def _get_tmdb_videos(self, tmdb_id: int, media_type: str) -> List[Dict]:
-        """Get videos (trailers) from TMDB"""
-        try:
-            url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}/videos"
-            params = {
-                'api_key': self.tmdb_api_key,
-                'language': 'en-US'
-            }
-            data = self._fetch_with_retry(url, params)
-            return data.get('results', [])
-        except:
-            return []
+    def _sorted_image_paths(self, images: Dict, image_type: str) -> List[str]:
+        """File paths of posters or backdrops, best voted first"""
+        items = sorted(images.get(image_type, []), key=lambda x: x.get('vote_average', 0), reverse=True)
+        return [img['file_path'] for img in items if img.get('file_path')]
 
     def _save_json(self, data, filename):
-        """Save data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Save data to JSON file (serialized in memory, then written in one go)"""
+        save_json(data, filename)
         print(f"💾 Saved: {filename}")
 
     def _parse_release_date(self, date_str):
@@ -661,34 +770,23 @@ class TMDBContentUpdater:
             except:
                 return None
 
-    def _filter_upcoming_only(self):
-        """Filter out movies that have already been released"""
-        today = datetime.now()
-        before_count = len(self.movies)
-
-        filtered_movies = []
-        for movie in self.movies:
-            release_date_str = movie.get('release_date')
-            if not release_date_str:
-                # Keep movies without release date
-                filtered_movies.append(movie)
-                continue
+    def _merge_duplicate(self, seen: Dict, movie: Dict) -> bool:
+        """Fold movie into an earlier row with the same title and release date; True if it was a duplicate"""
+        key = (movie['title'].lower().strip(), movie.get('release_date'))
+        existing = seen.get(key)
+        if existing is None:
+            seen[key] = movie
+            return False
 
-            release_date = self._parse_release_date(release_date_str)
-            if release_date:
-                # Only keep if release date is today or in the future
-                if release_date.date() >= today.date():
-                    filtered_movies.append(movie)
-            else:
-                # Keep if we can't parse the date
-                filtered_movies.append(movie)
+        platforms = existing.get('platforms', []) + movie.get('platforms', [])
+        if platforms:
+            existing['platforms'] = list(dict.fromkeys(platforms))
+        return True
 
-        self.movies = filtered_movies
-        removed_count = before_count - len(self.movies)
-
-        if removed_count > 0:
-            print(f"\n🗑️  Removed {removed_count} already-released movies")
-            print(f"📅 Keeping {len(self.movies)} upcoming movies (from {today.strftime('%d %b %Y')} onwards)")
+    def _is_upcoming(self, movie: Dict, today) -> bool:
+        """Keep movies releasing today or later, and those without a parseable date"""
+        release_date = self._parse_release_date(movie.get('release_date'))
+        return release_date is None or release_date.date() >= today
 
     async def run(self):
         """Run all steps"""
@@ -700,49 +798,79 @@ class TMDBContentUpdater:
         print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*60)
 
-        # Step 1: Scrape from Binged
-        await self.scrape_movies()
+        # Steps 1 + 2 overlap: each scraped movie that is new and still upcoming goes
+        # straight to TMDB enrichment, so lookups run while the next Binged page loads
+        today = datetime.now()
+        seen = {}
+        upcoming = []
+        skipped = {'duplicates': 0, 'released': 0, 'test_mode': 0}
+
+        def queue_for_enrichment(movie):
+            if self._merge_duplicate(seen, movie):
+                skipped['duplicates'] += 1
+            elif not self._is_upcoming(movie, today.date()):
+                skipped['released'] += 1
+            elif self.test_mode and len(upcoming) >= 3:
+                skipped['test_mode'] += 1
+            else:
+                upcoming.append(movie)
+                self._schedule_enrichment(movie)
+
+        await self._start_enrichment()
+        try:
+            await self.scrape_movies(on_movie=queue_for_enrichment)
+        finally:
+            results = await self._finish_enrichment()
 
-        # Filter out already-released movies
-        self._filter_upcoming_only()
+        self.movies = upcoming
 
-        # Test mode: limit to first 3 movies
-        if self.test_mode and len(self.movies) > 3:
-            print(f"\n🧪 TEST MODE: Processing only first 3 movies (out of {len(self.movies)})")
-            self.movies = self.movies[:3]
+        if skipped['duplicates']:
+            print(f"\n🔁 Merged {skipped['duplicates']} duplicate listings")
+        if skipped['released']:
+            print(f"\n🗑️  Removed {skipped['released']} already-released movies")
+            print(f"📅 Keeping {len(self.movies) + skipped['test_mode']} upcoming movies (from {today.strftime('%d %b %Y')} onwards)")
+        if skipped['test_mode']:
+            print(f"\n🧪 TEST MODE: Processed only first 3 movies (out of {len(self.movies) + skipped['test_mode']})")
 
-        # Step 2: Comprehensive TMDB Enrichment
         if self.movies:
-            await self.enrich_with_tmdb_comprehensive()
+            self._report_enrichment(results)
 
         # Summary
         elapsed = time.time() - start_time
 
-        with_tmdb = sum(1 for m in self.movies if m.get('tmdb_id'))
-        with_imdb = sum(1 for m in self.movies if m.get('imdb_id'))
-        with_posters = sum(1 for m in self.movies if m.get('posters'))
-        with_backdrops = sum(1 for m in self.movies if m.get('backdrops'))
-        with_cast = sum(1 for m in self.movies if m.get('cast'))
-        with_genres = sum(1 for m in self.movies if m.get('genres'))
-        with_description = sum(1 for m in self.movies if m.get('overview'))
-        with_trailers = sum(1 for m in self.movies if m.get('youtube_id'))
+        # Count coverage in a single pass over the movies
+        with_tmdb = with_imdb = with_posters = with_backdrops = 0
+        with_cast = with_genres = with_description = with_trailers = 0
+        movies = self.movies
+        total = len(movies)
+        for m in movies:
+            if m.get('tmdb_id'): with_tmdb += 1
+            if m.get('imdb_id'): with_imdb += 1
+            if m.get('posters'): with_posters += 1
+            if m.get('backdrops'): with_backdrops += 1
+            if m.get('cast'): with_cast += 1
+            if m.get('genres'): with_genres += 1
+            if m.get('overview'): with_description += 1
+            if m.get('youtube_id'): with_trailers += 1
 
         print("\n" + "="*60)
         print("✅ ALL DONE!")
         print("="*60)
         print(f"\n📊 Summary:")
-        print(f"   • Movies scraped: {len(self.movies)}")
-        print(f"   • With TMDB IDs: {with_tmdb}/{len(self.movies)}")
-        print(f"   • With IMDb IDs: {with_imdb}/{len(self.movies)}")
-        print(f"   • With descriptions: {with_description}/{len(self.movies)}")
-        print(f"   • With genres: {with_genres}/{len(self.movies)}")
-        print(f"   • With cast info: {with_cast}/{len(self.movies)}")
-        print(f"   • With posters: {with_posters}/{len(self.movies)}")
-        print(f"   • With backdrops: {with_backdrops}/{len(self.movies)}")
-        print(f"   • With trailers: {with_trailers}/{len(self.movies)}")
+        print(f"   • Movies scraped: {total}")
+        print(f"   • With TMDB IDs: {with_tmdb}/{total}")
+        print(f"   • With IMDb IDs: {with_imdb}/{total}")
+        print(f"   • With descriptions: {with_description}/{total}")
+        print(f"   • With genres: {with_genres}/{total}")
+        print(f"   • With cast info: {with_cast}/{total}")
+        print(f"   • With posters: {with_posters}/{total}")
+        print(f"   • With backdrops: {with_backdrops}/{total}")
+        print(f"   • With trailers: {with_trailers}/{total}")
         print(f"   • Time elapsed: {elapsed:.1f} seconds")
         print(f"\n📁 Files created:")
-        print(f"   • movies.json (scraped data)")
+        if self.checkpoint:
+            print(f"   • movies.json (scraped data)")
+            print(f"   • movies_enriched.jsonl (per-movie enrichment checkpoint)")
         print(f"   • movies_enriched.json (✨ FINAL - comprehensive TMDB data)")
         print("\n" + "="*60 + "\n")
 
@@ -752,13 +880,19 @@ def main():
     parser.add_argument('--pages', type=int, default=5, help='Number of pages to scrape (default: 5)')
     parser.add_argument('--no-trailers', action='store_true', help='Skip trailer enrichment')
     parser.add_argument('--test', action='store_true', help='Test mode: process only 3 movies')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the TMDB response cache')
+    parser.add_argument('--primary-images', action='store_true', help='Keep only the primary TMDB poster/backdrop in all_posters/all_backdrops (one fewer request per movie)')
+    parser.add_argument('--checkpoint', action='store_true', help='Also save the raw scrape to movies.json and each enriched movie to movies_enriched.jsonl as it finishes')
 
     args = parser.parse_args()
 
     updater = TMDBContentUpdater(
         max_pages=args.pages,
         enable_trailers=not args.no_trailers,
-        test_mode=args.test
+        test_mode=args.test,
+        use_cache=not args.no_cache,
+        checkpoint=args.checkpoint,
+        primary_images_only=args.primary_images
     )
 
     asyncio.run(updater.run())
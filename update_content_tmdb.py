@@ -5,26 +5,34 @@ Comprehensive scraper using TMDB API for discovery and enrichment
 Replaces Binged.com scraping with official TMDB API
 
 Usage:
-    python3 update_content_tmdb.py [--days N] [--test]
+    python3 update_content_tmdb.py [--days N] [--test] [--no-cache]
 """
 
-import json
+import asyncio
 import os
 import sys
 import time
 import argparse
 import requests
+from collections import Counter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
 # Check required packages
 try:
-    import requests
-except ImportError:
-    print("❌ Missing required package: requests")
-    print("\n💡 Install: pip3 install requests")
+    import aiohttp
+except ImportError as e:
+    print(f"❌ Missing required package: {e.name}")
+    print("\n💡 Install: pip3 install aiohttp")
     sys.exit(1)
 
+from config import BACKDROP_SIZES, POSTER_SIZES, tmdb_image_url, tmdb_image_urls
+from json_io import save_json
+from tmdb_cache import ResponseCache
+from tmdb_client import TMDBClient, is_rate_limited
+
 
 class TMDBContentUpdater:
     """Complete content updater using TMDB API for discovery and enrichment"""
@@ -41,10 +49,29 @@ class TMDBContentUpdater:
         532: 'Aha Video',
     }
 
-    def __init__(self, days_ahead=60, test_mode=False):
+    # Items enriched at once over the shared aiohttp session
+    ENRICH_CONCURRENCY = 16
+
+    # Sub-resources returned inside the details response (one request per item)
+    DETAIL_APPENDS = 'external_ids,images,credits,videos,watch/providers'
+    # English / Indian languages (and textless art) preferred for posters and backdrops
+    PREFERRED_IMAGE_LANGUAGES = ['en', 'hi', 'ta', 'te', 'ml', 'kn', 'bn', 'mr', None]
+    INCLUDE_IMAGE_LANGUAGE = ','.join(lang or 'null' for lang in PREFERRED_IMAGE_LANGUAGES)
+
+    # Discover results below this popularity (or without a date) are placeholders not worth enriching
+    MIN_POPULARITY = 0.5
+
+    # On-disk cache of TMDB responses, shared across runs (discover pages change daily)
+    CACHE_FILE = '.cache/tmdb_content_cache.json'
+    CACHE_TTL = 7 * 24 * 3600
+    CACHE_TTL_DISCOVER = 24 * 3600
+
+    def __init__(self, days_ahead=60, test_mode=False, use_cache=True):
         self.days_ahead = days_ahead
         self.test_mode = test_mode
+        self.use_cache = use_cache
         self.content = []
+        self.cache = ResponseCache(self.CACHE_FILE, self.CACHE_TTL, enabled=use_cache, ttl_for=self._cache_ttl)
 
         # TMDB API
         self.tmdb_api_key = os.environ.get('TMDB_API_KEY')
@@ -61,21 +88,44 @@ class TMDBContentUpdater:
         self.today = datetime.now().date()
         self.end_date = self.today + timedelta(days=days_ahead)
 
-    def _fetch_with_retry(self, url, params, max_retries=3):
-        """Fetch URL with retry logic"""
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, params=params, timeout=15)
-                response.raise_for_status()
-                return response.json()
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-                if attempt < max_retries - 1:
-                    time.sleep((attempt + 1) * 2)
-                    continue
-                else:
-                    raise
-            except Exception:
-                raise
+        # One pooled keep-alive session for every TMDB call; the adapter retries
+        # connection errors, 429s (honouring Retry-After) and 5xx with backoff
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.params = {'api_key': self.tmdb_api_key}  # Sent with every request
+
+        # Rate-limited TMDB requests over one pooled aiohttp session (opened while enriching)
+        self.tmdb = TMDBClient(self.tmdb_api_key, self.cache)
+
+    def _load_cache(self):
+        """Load cached TMDB responses from disk"""
+        if self.cache.load():
+            print(f"📦 Loaded {len(self.cache)} cached TMDB responses")
+
+    def _cache_ttl(self, url, data):
+        """How long a cached TMDB response stays fresh (discover pages change daily)"""
+        return self.CACHE_TTL_DISCOVER if '/discover/' in url else self.CACHE_TTL
+
+    def _fetch_with_retry(self, url, params=None):
+        """Fetch URL (retries are handled by the session's adapter), answering from the on-disk cache"""
+        params = params or {}
+        cache_key, cached, fresh = self.cache.lookup(url, params)
+        if fresh:
+            return cached['data']
+
+        try:
+            response = self.session.get(url, params=params, timeout=15)
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            if cached:
+                return cached['data']  # TMDB unreachable: a stale answer beats none
+            raise
+
+        data = response.json()
+        self.cache.store(cache_key, data)
+        return data
 
     def discover_content(self, media_type='movie'):
         """Discover upcoming content from TMDB"""
@@ -90,7 +140,6 @@ class TMDBContentUpdater:
             try:
                 url = f"https://api.themoviedb.org/3/discover/{media_type}"
                 params = {
-                    'api_key': self.tmdb_api_key,
                     'language': 'en-US',
                     f'{date_field}.gte': str(self.today),
                     f'{date_field}.lte': str(self.end_date),
@@ -114,7 +163,6 @@ class TMDBContentUpdater:
                     break
 
                 page += 1
-                time.sleep(0.25)
 
             except Exception as e:
                 print(f"    Error on page {page}: {e}")
@@ -122,96 +170,94 @@ class TMDBContentUpdater:
 
         return content_items
 
-    def get_watch_providers(self, item_id: int, media_type: str) -> List[str]:
+    async def get_watch_providers(self, item_id: int, media_type: str) -> List[str]:
         """Get streaming platforms for India"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{item_id}/watch/providers"
-            params = {'api_key': self.tmdb_api_key}
-
-            data = self._fetch_with_retry(url, params)
-            india_providers = data.get('results', {}).get('IN', {})
+            data = await self.tmdb.fetch(url)
+            return self._india_platforms(data)
 
-            platforms = []
-            for provider in india_providers.get('flatrate', []):
-                provider_id = provider.get('provider_id')
-                if provider_id in self.INDIAN_PLATFORMS:
-                    platform_name = self.INDIAN_PLATFORMS[provider_id]
-                    if platform_name not in platforms:
-                        platforms.append(platform_name)
-
-            return platforms
-
-        except:
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
             return []
 
-    def get_full_details(self, item_id: int, media_type: str) -> Optional[Dict]:
-        """Get full details for a movie/show"""
-        try:
-            url = f"https://api.themoviedb.org/3/{media_type}/{item_id}"
-            params = {
-                'api_key': self.tmdb_api_key,
-                'language': 'en-US'
-            }
-            return self._fetch_with_retry(url, params)
-        except:
-            return None
+    def _india_platforms(self, providers: Dict) -> List[str]:
+        """Indian subscription platforms from a watch/providers response"""
+        india_providers = providers.get('results', {}).get('IN', {})
+
+        platforms = []
+        for provider in india_providers.get('flatrate', []):
+            provider_id = provider.get('provider_id')
+            if provider_id in self.INDIAN_PLATFORMS:
+                platform_name = self.INDIAN_PLATFORMS[provider_id]
+                if platform_name not in platforms:
+                    platforms.append(platform_name)
+
+        return platforms
+
+    async def get_full_details(self, item_id: int, media_type: str) -> Optional[Dict]:
+        """Get full details for a movie/show, with IDs, images, credits, videos and providers appended (errors propagate)"""
+        url = f"https://api.themoviedb.org/3/{media_type}/{item_id}"
+        params = {
+            'language': 'en-US',
+            'append_to_response': self.DETAIL_APPENDS,
+            'include_image_language': self.INCLUDE_IMAGE_LANGUAGE
+        }
+        return await self.tmdb.fetch(url, params)
 
-    def get_external_ids(self, item_id: int, media_type: str) -> Optional[Dict]:
+    async def get_external_ids(self, item_id: int, media_type: str) -> Optional[Dict]:
         """Get external IDs (IMDb)"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{item_id}/external_ids"
-            params = {'api_key': self.tmdb_api_key}
-            return self._fetch_with_retry(url, params)
-        except:
+            return await self.tmdb.fetch(url)
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
             return None
 
-    def get_images(self, item_id: int, media_type: str, image_type: str) -> List[Dict]:
-        """Get images with language filtering"""
+    async def get_images(self, item_id: int, media_type: str) -> Dict:
+        """Get every poster and backdrop (all languages)"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{item_id}/images"
-            params = {'api_key': self.tmdb_api_key}
-
-            data = self._fetch_with_retry(url, params)
-            images = data.get(image_type, [])
-
-            # Filter for English or Indian languages
-            preferred_langs = ['en', 'hi', 'ta', 'te', 'ml', 'kn', 'bn', 'mr', None]
-            preferred_images = [img for img in images if img.get('iso_639_1') in preferred_langs]
-
-            if not preferred_images:
-                preferred_images = images
+            return await self.tmdb.fetch(url) or {}
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
+            return {}
 
-            # Sort by quality
-            preferred_images.sort(key=lambda x: x.get('vote_average', 0), reverse=True)
+    def _rank_images(self, images: List[Dict]) -> List[Dict]:
+        """Images in English or Indian languages (all of them if none), best voted first"""
+        preferred_images = [img for img in images if img.get('iso_639_1') in self.PREFERRED_IMAGE_LANGUAGES]
 
-            return preferred_images
+        if not preferred_images:
+            preferred_images = images
 
-        except:
-            return []
+        # Sort by quality
+        return sorted(preferred_images, key=lambda x: x.get('vote_average', 0), reverse=True)
 
-    def get_credits(self, item_id: int, media_type: str) -> Optional[Dict]:
+    async def get_credits(self, item_id: int, media_type: str) -> Optional[Dict]:
         """Get cast and crew"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{item_id}/credits"
-            params = {'api_key': self.tmdb_api_key}
-            return self._fetch_with_retry(url, params)
-        except:
+            return await self.tmdb.fetch(url)
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
             return None
 
-    def get_videos(self, item_id: int, media_type: str) -> List[Dict]:
+    async def get_videos(self, item_id: int, media_type: str) -> List[Dict]:
         """Get videos (trailers)"""
         try:
             url = f"https://api.themoviedb.org/3/{media_type}/{item_id}/videos"
-            params = {
-                'api_key': self.tmdb_api_key,
-                'language': 'en-US'
-            }
-            data = self._fetch_with_retry(url, params)
+            data = await self.tmdb.fetch(url, {'language': 'en-US'})
             return data.get('results', [])
-        except:
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
             return []
 
-    def enrich_item(self, item: Dict, media_type: str) -> Dict:
+    async def enrich_item(self, item: Dict, media_type: str) -> Dict:
         """Fully enrich a single item with all metadata"""
 
         item_id = item['id']
@@ -230,12 +276,46 @@ class TMDBContentUpdater:
             'popularity': item.get('popularity'),
         }
 
-        # Get streaming platforms
-        platforms = self.get_watch_providers(item_id, media_type)
+        # One request: details with every sub-resource appended
+        unreachable = False
+        try:
+            details = await self.get_full_details(item_id, media_type)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            details, unreachable = None, True
+        except aiohttp.ClientResponseError as e:
+            if is_rate_limited(e):
+                raise
+            details = None  # A 4xx (e.g. a removed id) would fail the same way on every endpoint
+
+        if details:
+            platforms = self._india_platforms(details.get('watch/providers') or {})
+            external_ids = details.get('external_ids')
+            images = details.get('images') or {}
+            credits = details.get('credits')
+            videos = (details.get('videos') or {}).get('results', [])
+        elif not unreachable:
+            platforms, external_ids, images, credits, videos = [], None, {}, None, []
+        else:
+            # Details timed out or the connection failed: fall back to the individual endpoints
+            platforms, external_ids, images, credits, videos = await asyncio.gather(
+                self.get_watch_providers(item_id, media_type),
+                self.get_external_ids(item_id, media_type),
+                self.get_images(item_id, media_type),
+                self.get_credits(item_id, media_type),
+                self.get_videos(item_id, media_type)
+            )
+
+        if details and not images.get('posters'):
+            # The appended images only cover preferred languages; any poster beats none
+            images = await self.get_images(item_id, media_type)
+
+        posters = self._rank_images(images.get('posters', []))
+        backdrops = self._rank_images(images.get('backdrops', []))
+
+        # Streaming platforms
         enriched['platforms'] = platforms
 
-        # Get full details
-        details = self.get_full_details(item_id, media_type)
+        # Full details
         if details:
             enriched['description'] = details.get('overview', '')
 
@@ -255,66 +335,33 @@ class TMDBContentUpdater:
             enriched['status'] = details.get('status')
 
         # External IDs
-        external_ids = self.get_external_ids(item_id, media_type)
         if external_ids:
             imdb_id = external_ids.get('imdb_id')
             if imdb_id:
                 enriched['imdb_id'] = imdb_id
 
         # Posters (with language filtering)
-        posters = self.get_images(item_id, media_type, 'posters')
         if posters:
-            poster_path = posters[0]['file_path']
-            enriched['posters'] = {
-                'thumbnail': f"https://image.tmdb.org/t/p/w92{poster_path}",
-                'small': f"https://image.tmdb.org/t/p/w185{poster_path}",
-                'medium': f"https://image.tmdb.org/t/p/w342{poster_path}",
-                'large': f"https://image.tmdb.org/t/p/w500{poster_path}",
-                'xlarge': f"https://image.tmdb.org/t/p/w780{poster_path}",
-                'original': f"https://image.tmdb.org/t/p/original{poster_path}"
-            }
+            enriched['posters'] = tmdb_image_urls(posters[0]['file_path'], POSTER_SIZES)
             enriched['poster_url_medium'] = enriched['posters']['medium']
             enriched['poster_url_large'] = enriched['posters']['large']
             enriched['poster_language'] = posters[0].get('iso_639_1') or 'none'
 
-            # Store all posters
-            enriched['all_posters'] = [
-                {
-                    'thumbnail': f"https://image.tmdb.org/t/p/w92{p['file_path']}",
-                    'small': f"https://image.tmdb.org/t/p/w185{p['file_path']}",
-                    'medium': f"https://image.tmdb.org/t/p/w342{p['file_path']}",
-                    'large': f"https://image.tmdb.org/t/p/w500{p['file_path']}",
-                    'xlarge': f"https://image.tmdb.org/t/p/w780{p['file_path']}",
-                    'original': f"https://image.tmdb.org/t/p/original{p['file_path']}",
-                    'language': p.get('iso_639_1')
-                }
-                for p in posters[:5]
+            # Store all posters (the first is the primary set plus its language)
+            enriched['all_posters'] = [dict(enriched['posters'], language=posters[0].get('iso_639_1'))]
+            enriched['all_posters'] += [
+                dict(tmdb_image_urls(p['file_path'], POSTER_SIZES), language=p.get('iso_639_1'))
+                for p in posters[1:5]
             ]
 
         # Backdrops
-        backdrops = self.get_images(item_id, media_type, 'backdrops')
         if backdrops:
-            backdrop_path = backdrops[0]['file_path']
-            enriched['backdrops'] = {
-                'small': f"https://image.tmdb.org/t/p/w300{backdrop_path}",
-                'medium': f"https://image.tmdb.org/t/p/w780{backdrop_path}",
-                'large': f"https://image.tmdb.org/t/p/w1280{backdrop_path}",
-                'original': f"https://image.tmdb.org/t/p/original{backdrop_path}"
-            }
+            # Top 5 backdrops; the best one is also the primary set
+            enriched['all_backdrops'] = [tmdb_image_urls(b['file_path'], BACKDROP_SIZES) for b in backdrops[:5]]
+            enriched['backdrops'] = dict(enriched['all_backdrops'][0])
             enriched['backdrop_url'] = enriched['backdrops']['original']
 
-            enriched['all_backdrops'] = [
-                {
-                    'small': f"https://image.tmdb.org/t/p/w300{b['file_path']}",
-                    'medium': f"https://image.tmdb.org/t/p/w780{b['file_path']}",
-                    'large': f"https://image.tmdb.org/t/p/w1280{b['file_path']}",
-                    'original': f"https://image.tmdb.org/t/p/original{b['file_path']}"
-                }
-                for b in backdrops[:5]
-            ]
-
         # Cast and crew
-        credits = self.get_credits(item_id, media_type)
         if credits:
             cast = credits.get('cast', [])
             crew = credits.get('crew', [])
@@ -323,7 +370,7 @@ class TMDBContentUpdater:
                 {
                     'name': c['name'],
                     'character': c.get('character', ''),
-                    'profile_path': f"https://image.tmdb.org/t/p/w185{c['profile_path']}" if c.get('profile_path') else None
+                    'profile_path': tmdb_image_url(c['profile_path'], 'w185') if c.get('profile_path') else None
                 }
                 for c in cast[:10]
             ]
@@ -335,7 +382,6 @@ class TMDBContentUpdater:
             enriched['writers'] = writers[:5]
 
         # Videos (trailers)
-        videos = self.get_videos(item_id, media_type)
         if videos:
             trailers = [v for v in videos if v.get('type') == 'Trailer' and v.get('site') == 'YouTube']
             if trailers:
@@ -346,6 +392,50 @@ class TMDBContentUpdater:
 
         return enriched
 
+    def _unique_by_id(self, items: List[Dict]) -> List[Dict]:
+        """Discover results with repeated TMDB ids dropped (overlapping pages), first one kept"""
+        seen = set()
+        return [item for item in items if not (item['id'] in seen or seen.add(item['id']))]
+
+    def _worth_enriching(self, item: Dict, date_field: str) -> bool:
+        """Whether a discover result has a date and some audience (checked before any enrichment request)"""
+        return bool(item.get(date_field)) and (item.get('popularity') or 0) >= self.MIN_POPULARITY
+
+    async def _enrich_all(self, movies: List[Dict], tv_shows: List[Dict]) -> List[Optional[Dict]]:
+        """Enrich every movie and show concurrently over one pooled, rate-limited session (input order kept)"""
+        semaphore = asyncio.Semaphore(self.ENRICH_CONCURRENCY)
+        jobs = [(movie, 'movie', i, len(movies)) for i, movie in enumerate(movies, 1)]
+        jobs += [(show, 'tv', i, len(tv_shows)) for i, show in enumerate(tv_shows, 1)]
+
+        try:
+            async with self.tmdb:
+                results = await asyncio.gather(*(
+                    self._enrich_item_bounded(semaphore, index, total, item, media_type)
+                    for item, media_type, index, total in jobs
+                ))
+        finally:
+            self.cache.save()
+
+        return results
+
+    async def _enrich_item_bounded(self, semaphore, index: int, total: int,
+                                   item: Dict, media_type: str) -> Optional[Dict]:
+        """Enrich one item under the concurrency limit and print its status line"""
+        title = (item.get('title') or item.get('name', 'Unknown'))[:50]
+        label = 'Movie' if media_type == 'movie' else 'TV'
+
+        async with semaphore:
+            try:
+                enriched = await self.enrich_item(item, media_type)
+            except Exception as e:
+                print(f"[{label} {index}/{total}] {title}... ✗ Error: {str(e)[:30]}")
+                return None
+
+        platforms = enriched.get('platforms', [])
+        status = f"✓ {len(platforms)} platform(s)" if platforms else "✓ Platform TBA"
+        print(f"[{label} {index}/{total}] {title}... {status}")
+        return enriched
+
     def run(self):
         """Run the complete update process"""
 
@@ -360,6 +450,8 @@ class TMDBContentUpdater:
         print(f"Test mode: {'Yes (limited)' if self.test_mode else 'No'}")
         print("="*70)
 
+        self._load_cache()
+
         # Discover movies
         print("\n" + "="*70)
         print("STEP 1: DISCOVERING MOVIES")
@@ -379,71 +471,43 @@ class TMDBContentUpdater:
         print("STEP 3: ENRICHING WITH FULL METADATA")
         print("="*70 + "\n")
 
-        all_content = []
-
-        # Enrich movies
-        if movies:
-            print(f"Enriching {len(movies)} movies...\n")
-            for i, movie in enumerate(movies, 1):
-                title = movie.get('title', 'Unknown')[:50]
-                print(f"[{i}/{len(movies)}] {title}... ", end='', flush=True)
-
-                try:
-                    enriched = self.enrich_item(movie, 'movie')
-                    all_content.append(enriched)
-
-                    platforms = enriched.get('platforms', [])
-                    if platforms:
-                        print(f"✓ {len(platforms)} platform(s)")
-                    else:
-                        print("✓ Platform TBA")
+        discovered = len(movies) + len(tv_shows)
+        movies = [movie for movie in self._unique_by_id(movies) if self._worth_enriching(movie, 'release_date')]
+        tv_shows = [show for show in self._unique_by_id(tv_shows) if self._worth_enriching(show, 'first_air_date')]
+        skipped = discovered - len(movies) - len(tv_shows)
+        if skipped:
+            print(f"⊙ Skipping {skipped} duplicate or placeholder entries (no date or popularity < {self.MIN_POPULARITY})")
 
-                except Exception as e:
-                    print(f"✗ Error: {str(e)[:30]}")
+        print(f"Enriching {len(movies)} movies and {len(tv_shows)} TV shows...\n")
 
-                time.sleep(0.3)
+        results = asyncio.run(self._enrich_all(movies, tv_shows))
 
-        # Enrich TV shows
-        if tv_shows:
-            print(f"\nEnriching {len(tv_shows)} TV shows...\n")
-            for i, show in enumerate(tv_shows, 1):
-                title = show.get('name', 'Unknown')[:50]
-                print(f"[{i}/{len(tv_shows)}] {title}... ", end='', flush=True)
-
-                try:
-                    enriched = self.enrich_item(show, 'tv')
-                    all_content.append(enriched)
-
-                    platforms = enriched.get('platforms', [])
-                    if platforms:
-                        print(f"✓ {len(platforms)} platform(s)")
-                    else:
-                        print("✓ Platform TBA")
-
-                except Exception as e:
-                    print(f"✗ Error: {str(e)[:30]}")
-
-                time.sleep(0.3)
+        # Collect results and tally the summary in the same pass
+        all_content = []
+        with_platforms = with_posters = with_trailers = with_cast = 0
+        platform_counts = Counter()
+        for enriched in results:
+            if not enriched:
+                continue
+            all_content.append(enriched)
+            if enriched.get('platforms'):
+                with_platforms += 1
+                platform_counts.update(enriched['platforms'])
+            if enriched.get('posters'):
+                with_posters += 1
+            if enriched.get('youtube_id'):
+                with_trailers += 1
+            if enriched.get('cast'):
+                with_cast += 1
 
         # Save results
         if all_content:
-            with open('movies_enriched.json', 'w', encoding='utf-8') as f:
-                json.dump(all_content, f, indent=2, ensure_ascii=False)
+            save_json(all_content, 'movies_enriched.json')
             print(f"\n💾 Saved: movies_enriched.json")
 
         # Summary
         elapsed = time.time() - start_time
 
-        platform_counts = {}
-        for item in all_content:
-            for platform in item.get('platforms', []):
-                platform_counts[platform] = platform_counts.get(platform, 0) + 1
-
-        with_platforms = sum(1 for item in all_content if item.get('platforms'))
-        with_posters = sum(1 for item in all_content if item.get('posters'))
-        with_trailers = sum(1 for item in all_content if item.get('youtube_id'))
-        with_cast = sum(1 for item in all_content if item.get('cast'))
-
         print("\n" + "="*70)
         print("✅ UPDATE COMPLETE!")
         print("="*70)
@@ -458,7 +522,7 @@ class TMDBContentUpdater:
 
         if platform_counts:
             print(f"\n📺 Platform Distribution:")
-            for platform, count in sorted(platform_counts.items(), key=lambda x: -x[1]):
+            for platform, count in platform_counts.most_common():
                 print(f"   • {platform}: {count}")
 
         print(f"\n⏱️  Time elapsed: {elapsed:.1f} seconds")
@@ -470,10 +534,11 @@ def main():
     parser = argparse.ArgumentParser(description='Update content using TMDB API')
     parser.add_argument('--days', type=int, default=60, help='Days ahead to look (default: 60)')
     parser.add_argument('--test', action='store_true', help='Test mode (limited results)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the TMDB response cache')
 
     args = parser.parse_args()
 
-    updater = TMDBContentUpdater(days_ahead=args.days, test_mode=args.test)
+    updater = TMDBContentUpdater(days_ahead=args.days, test_mode=args.test, use_cache=not args.no_cache)
 
     try:
         updater.run()